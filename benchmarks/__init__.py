@@ -0,0 +1 @@
+"""Offline benchmarks for the ForexFactory MCP server (see `benchmarks.run`)."""
@@ -0,0 +1,78 @@
+"""
+fake_ff.py
+
+Local stand-in for forexfactory.com used by the scrape and end-to-end
+benchmarks.
+
+Every `/calendar...` request is answered with the same calendar page (built
+from a fixture `days` array), after an optional simulated network latency,
+so the scrape path runs against a real socket without leaving the machine.
+
+Usage:
+    server = FakeForexFactory(days, latency_ms=50)
+    server.start()
+    ... BASE_URL=server.base_url ...
+    server.stop()
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+from benchmarks.fixtures import calendar_html
+
+
+class FakeForexFactory:
+    """
+    Threaded HTTP server serving a fixed calendar page.
+
+    Parameters
+    ----------
+    days : List[Dict[str, Any]]
+        Days array embedded in every page.
+    latency_ms : float
+        Delay before each response, to mimic network and server time.
+    """
+
+    def __init__(self, days: List[Dict[str, Any]], latency_ms: float = 0.0):
+        self.body = calendar_html(days).encode()
+        self.latency_ms = latency_ms
+        self.requests = 0
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real site
+
+            def do_GET(self):
+                fake.requests += 1
+                if fake.latency_ms:
+                    time.sleep(fake.latency_ms / 1000)
+                if not self.path.startswith("/calendar"):
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(fake.body)))
+                self.end_headers()
+                self.wfile.write(fake.body)
+
+            def log_message(self, *_args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
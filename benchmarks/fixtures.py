@@ -0,0 +1,132 @@
+"""
+fixtures.py
+
+Calendar payloads for the benchmarks.
+
+By default a deterministic, synthetic month is generated with the same shape
+and key set as a real ForexFactory `days` array (about 500 events), so runs
+are comparable across machines and commits. A real payload can be used
+instead: pass a recording made with `SCRAPER_MODE=record` (the `<key>.json`
+file from `SCRAPER_RECORD_DIR`) or any JSON file holding a `days` array.
+"""
+
+import datetime as dt
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+_CURRENCIES = ["USD", "EUR", "GBP", "JPY", "AUD", "NZD", "CAD", "CHF", "CNY"]
+_IMPACTS = [
+    ("high", "icon--ff-impact-red", "High Impact Expected"),
+    ("medium", "icon--ff-impact-ora", "Medium Impact Expected"),
+    ("low", "icon--ff-impact-yel", "Low Impact Expected"),
+    ("holiday", "icon--ff-impact-gra", "Non-Economic"),
+]
+_NAMES = [
+    "CPI m/m",
+    "Core CPI m/m",
+    "Retail Sales m/m",
+    "Unemployment Rate",
+    "Non-Farm Employment Change",
+    "Trade Balance",
+    "Manufacturing PMI",
+    "Services PMI",
+    "GDP q/q",
+    "Official Bank Rate",
+    "Building Permits",
+    "Consumer Confidence",
+    "PPI m/m",
+    "Crude Oil Inventories",
+    "FOMC Member Speaks",
+]
+
+
+def synthetic_month(
+    year: int = 2025, month: int = 9, seed: int = 42
+) -> List[Dict[str, Any]]:
+    """A month of raw day blocks shaped like ForexFactory's `days` array."""
+    rng = random.Random(seed)
+    days = []
+    event_id = 140000
+
+    day = dt.date(year, month, 1)
+    while day.month == month:
+        dateline = int(
+            dt.datetime(
+                day.year, day.month, day.day, tzinfo=dt.timezone.utc
+            ).timestamp()
+        )
+        count = rng.randint(18, 30) if day.weekday() < 5 else rng.randint(0, 2)
+        events = []
+        for _ in range(count):
+            event_id += 1
+            currency = rng.choice(_CURRENCIES)
+            name = rng.choice(_NAMES)
+            impact, impact_class, impact_title = rng.choice(_IMPACTS)
+            released = rng.random() < 0.5
+            minute = rng.randrange(0, 24 * 60, 15)
+            events.append(
+                {
+                    "id": event_id,
+                    "ebaseId": rng.randint(1000, 9999),
+                    "name": name,
+                    "dateline": dateline + minute * 60,
+                    "country": currency[:2],
+                    "currency": currency,
+                    "impactName": impact,
+                    "impactClass": impact_class,
+                    "impactTitle": impact_title,
+                    "timeLabel": f"{(minute // 60) % 12 or 12}:{minute % 60:02d}"
+                    f"{'am' if minute < 720 else 'pm'}",
+                    "actual": f"{rng.uniform(-2, 5):.1f}%" if released else "",
+                    "forecast": f"{rng.uniform(-2, 5):.1f}%",
+                    "previous": f"{rng.uniform(-2, 5):.1f}%",
+                    "revision": "",
+                    "leaked": False,
+                    "actualBetterWorse": rng.randint(0, 2) if released else 0,
+                    "revisionBetterWorse": 0,
+                    "prefixedName": f"{currency} {name}",
+                    "trimmedPrefixedName": f"{currency} {name}",
+                    "soloTitle": name,
+                    "soloTitleShort": name,
+                    "notice": "",
+                    "hasGraph": True,
+                    "hasDataValues": True,
+                    "hasLinkedThreads": False,
+                    "url": f"/calendar/{event_id}-{currency.lower()}-"
+                    f"{name.lower().replace(' ', '-').replace('/', '')}",
+                    "soloUrl": f"/calendar?solo={event_id}",
+                    "date": day.strftime("%b %-d, %Y"),
+                }
+            )
+        days.append(
+            {
+                "date": f"{day:%a} <span>{day:%b} {day.day}</span>",
+                "dateline": dateline,
+                "add": "",
+                "events": events,
+            }
+        )
+        day += dt.timedelta(days=1)
+    return days
+
+
+def load_days(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Load a recorded `days` payload from `path`, or synthesize a month."""
+    if path is None:
+        return synthetic_month()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["days"] if isinstance(data, dict) else data
+
+
+def calendar_html(days: List[Dict[str, Any]]) -> str:
+    """A minimal calendar page embedding `days` the way ForexFactory does."""
+    state = json.dumps({"days": days, "time": 0}, separators=(",", ":"))
+    return (
+        "<!DOCTYPE html><html><head><title>Forex Factory</title></head><body>"
+        '<div id="calendar"></div><script>'
+        "window.calendarComponentStates = window.calendarComponentStates || [];"
+        f"window.calendarComponentStates[1] = {state};"
+        "</script></body></html>"
+    )
@@ -0,0 +1,303 @@
+"""
+run.py
+
+Offline benchmark suite for the scrape → normalize → render → serve paths.
+
+Benchmarks (all run against a fixture month, never forexfactory.com):
+
+  - normalize     `extract_and_normalize_events()` over the month
+  - data_service  `DataService.normalize_events()` over the month
+  - markdown      `build_markdown_table()` of the normalized month
+  - scrape        `FFScraperService.refresh()` of this month over the HTTP
+                  backend, against a local fake ForexFactory (`fake_ff`)
+  - scrape_browser  the same over the Playwright backend (skipped when no
+                  Chromium is installed)
+  - tool          `<namespace>_get_calendar_events(time_period="this_month")`
+                  end to end through an in-process MCP client session
+
+Each benchmark reports throughput (ops/s, events/s), latency percentiles and
+the peak traced memory of one call (measured in a separate `tracemalloc`
+pass so it doesn't skew the timings). The calendar cache, event store and
+background refreshers are disabled so every call does the full work.
+
+Results can be saved as a baseline and later runs compared against it; a
+benchmark whose p50 latency or peak memory regresses by more than
+`--tolerance` makes the run exit with status 1. Baselines are machine
+specific, so none is checked in: `--compare` against a missing file records
+one there instead (`.benchmarks/` is git-ignored).
+
+Usage:
+    uv run python -m benchmarks.run
+    uv run python -m benchmarks.run -k normalize -k markdown -n 500
+    uv run python -m benchmarks.run --save .benchmarks/baseline.json
+    uv run python -m benchmarks.run --compare .benchmarks/baseline.json
+    uv run python -m benchmarks.run --fixture ~/.cache/forexfactory-mcp/recordings/<key>.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from benchmarks.fake_ff import FakeForexFactory
+from benchmarks.fixtures import load_days
+
+Op = Callable[[], Awaitable[Any]]
+
+DEFAULT_ITERATIONS = {
+    "normalize": 200,
+    "data_service": 200,
+    "markdown": 200,
+    "scrape": 50,
+    "scrape_browser": 20,
+    "tool": 50,
+}
+WARMUP = 3
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ForexFactory MCP benchmarks")
+    parser.add_argument(
+        "-k",
+        "--only",
+        action="append",
+        choices=list(DEFAULT_ITERATIONS),
+        help="Run only these benchmarks (repeatable)",
+    )
+    parser.add_argument("-n", "--iterations", type=int, help="Iterations per benchmark")
+    parser.add_argument("--fixture", help="Recorded days JSON to use as the month")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency of the fake ForexFactory server",
+    )
+    parser.add_argument("--save", help="Write the results to this baseline file")
+    parser.add_argument(
+        "--compare",
+        help="Compare against this baseline file (recorded there if missing)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed p50 / peak memory regression vs. the baseline (0.25 = 25%%)",
+    )
+    return parser.parse_args()
+
+
+def configure_environment(base_url: str) -> None:
+    """Point the server at the fake site and turn off every shortcut."""
+    os.environ.update(
+        BASE_URL=base_url,
+        SCRAPER_BACKEND="http",
+        SCRAPER_MODE="live",
+        SCRAPER_WORKERS="0",
+        SCRAPER_HEDGE_ENABLED="false",
+        CACHE_MAX_ENTRIES="0",
+        EVENT_STORE_ENABLED="false",
+        REFRESH_ENABLED="false",
+        RELEASE_REFRESH_ENABLED="false",
+    )
+
+
+def count_events(days: List[Dict[str, Any]]) -> int:
+    return sum(len(day.get("events", [])) for day in days)
+
+
+async def build_benchmarks(
+    days: List[Dict[str, Any]], stack: AsyncExitStack
+) -> Dict[str, Op]:
+    """
+    Create one zero-argument coroutine function per benchmark. The MCP
+    client session is entered on `stack` and reused by every tool call.
+    """
+    # Imported after `configure_environment` so the settings pick it up.
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    from forexfactory_mcp.models.time_period import TimePeriod
+    from forexfactory_mcp.server import app, settings
+    from forexfactory_mcp.services.browser_pool import get_browser_pool
+    from forexfactory_mcp.services.data_service import DataService
+    from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+    from forexfactory_mcp.utils.event_utils import extract_and_normalize_events
+    from forexfactory_mcp.utils.prompt_utils import build_markdown_table
+
+    # Per-call INFO logs (scrapes, HTTP requests, MCP requests) would dominate
+    logging.disable(logging.INFO)
+
+    events = DataService.normalize_events(days, TimePeriod.THIS_MONTH)["events"]
+    tool_name = f"{settings.NAMESPACE}_get_calendar_events"
+    client = await stack.enter_async_context(
+        create_connected_server_and_client_session(app)
+    )
+
+    async def normalize():
+        return extract_and_normalize_events(days)
+
+    async def data_service():
+        return DataService.normalize_events(days, TimePeriod.THIS_MONTH)
+
+    async def markdown():
+        return build_markdown_table(events)
+
+    async def scrape():
+        return await FFScraperService(TimePeriod.THIS_MONTH).refresh()
+
+    async def scrape_browser():
+        settings.SCRAPER_BACKEND = "browser"
+        try:
+            return await FFScraperService(TimePeriod.THIS_MONTH).refresh()
+        finally:
+            settings.SCRAPER_BACKEND = "http"
+
+    async def tool():
+        result = await client.call_tool(tool_name, {"time_period": "this_month"})
+        if result.isError:
+            raise RuntimeError(f"{tool_name} failed: {result.content}")
+        return result
+
+    benchmarks = {
+        "normalize": normalize,
+        "data_service": data_service,
+        "markdown": markdown,
+        "scrape": scrape,
+        "scrape_browser": scrape_browser,
+        "tool": tool,
+    }
+
+    pool = get_browser_pool()
+    await pool.start()
+    if not any(not slot.crashed for slot in pool.slots):
+        print("⚠️ scrape_browser skipped: Chromium is not available", file=sys.stderr)
+        del benchmarks["scrape_browser"]
+    return benchmarks
+
+
+async def measure(op: Op, iterations: int, events: int) -> Dict[str, Any]:
+    """Time `iterations` calls of `op`, then trace the memory of one more."""
+    from forexfactory_mcp.utils.metrics import Metrics
+
+    for _ in range(WARMUP):
+        await op()
+
+    latencies = Metrics(window=iterations)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        await op()
+        latencies.observe("ms", (time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    await op()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "ops_s": round(iterations / elapsed, 1),
+        "events_s": round(iterations * events / elapsed),
+        "p50_ms": round(latencies.quantile("ms", 0.5), 3),
+        "p90_ms": round(latencies.quantile("ms", 0.9), 3),
+        "p99_ms": round(latencies.quantile("ms", 0.99), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def print_results(results: Dict[str, Dict[str, Any]], events: int) -> None:
+    print(f"\n📊 Benchmarks ({events} events per call)\n")
+    columns = ["ops_s", "events_s", "p50_ms", "p90_ms", "p99_ms", "peak_kib"]
+    print(f"{'benchmark':<14}" + "".join(f"{c:>12}" for c in columns))
+    for name, result in results.items():
+        print(f"{name:<14}" + "".join(f"{result[c]:>12}" for c in columns))
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """Return a description of every regression beyond `tolerance`."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "peak_kib"):
+            limit = base[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{name}.{metric}: {result[metric]} > {base[metric]} "
+                    f"(+{(result[metric] / base[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    days = load_days(args.fixture)
+    events = count_events(days)
+
+    fake = FakeForexFactory(days, latency_ms=args.latency_ms)
+    fake.start()
+    configure_environment(fake.base_url)
+    try:
+        async with AsyncExitStack() as stack:
+            benchmarks = await build_benchmarks(days, stack)
+            results = {}
+            for name in args.only or list(benchmarks):
+                if name not in benchmarks:
+                    continue
+                iterations = args.iterations or DEFAULT_ITERATIONS[name]
+                print(f"⏱ {name} ({iterations} iterations)", file=sys.stderr)
+                results[name] = await measure(benchmarks[name], iterations, events)
+    finally:
+        from forexfactory_mcp.services.browser_pool import get_browser_pool
+        from forexfactory_mcp.services.http_scraper import get_http_fetcher
+
+        await get_browser_pool().close()
+        await get_http_fetcher().close()
+        fake.stop()
+    return results, events
+
+
+def main() -> int:
+    args = parse_arguments()
+    results, events = asyncio.run(run(args))
+    print_results(results, events)
+
+    save = args.save
+    if args.compare and not os.path.exists(args.compare):
+        print(f"\nℹ️ No baseline at {args.compare} yet; recording this run")
+        save, args.compare = args.compare, None
+
+    if save:
+        os.makedirs(os.path.dirname(save) or ".", exist_ok=True)
+        with open(save, "w", encoding="utf-8") as f:
+            json.dump({"events": events, "benchmarks": results}, f, indent=2)
+            f.write("\n")
+        print(f"\n💾 Baseline written to {save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ Regressions vs. {args.compare}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print(
+            f"\n✅ No regressions vs. {args.compare} (tolerance {args.tolerance:.0%})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
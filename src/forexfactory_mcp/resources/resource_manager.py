@@ -1,14 +1,24 @@
 import logging
+from typing import Any, Dict
 
 from mcp.server.fastmcp import FastMCP
 
 from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services.cache_service import CalendarSnapshot
 from forexfactory_mcp.services.data_service import DataService
 from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.services.refresh_service import get_refresher
+from forexfactory_mcp.utils.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
 
+def _with_status(payload: Dict[str, Any], snapshot: CalendarSnapshot) -> Dict[str, Any]:
+    """Annotate a resource payload with the freshness/outcome of its snapshot."""
+    payload.update(snapshot.freshness())
+    return payload
+
+
 def register(app: FastMCP, namespace: str) -> None:
     """Register all ForexFactory MCP resources under the given namespace."""
     logger.info("Registering MCP resources...")
@@ -30,14 +40,22 @@ def register(app: FastMCP, namespace: str) -> None:
         )
         async def _resource():
             try:
-                scraper = FFScraperService(time_period=period)
-                days_array = await scraper.get_events()
-                return DataService.normalize_events(days_array, period)
+                refresher = get_refresher()
+                if refresher.is_hot(period):
+                    # Served from the latest background snapshot
+                    snapshot = await refresher.get(period)
+                else:
+                    scraper = FFScraperService(time_period=period)
+                    snapshot = await scraper.get_snapshot()
+                return _with_status(
+                    DataService.normalize_events(snapshot.days, period), snapshot
+                )
             except Exception as e:
                 logger.exception(f"⚠️ Could not fetch {path}: {e}")
                 return {
                     "range": [period.value, period.value],
                     "events": [],
+                    "status": "error",
                     "error": str(e),
                 }
 
@@ -133,10 +151,29 @@ def register(app: FastMCP, namespace: str) -> None:
                 custom_start_date=start,
                 custom_end_date=end,
             )
-            days_array = await scraper.get_events()
-            return DataService.normalize_events(
-                days_array, TimePeriod.CUSTOM, start, end
+            snapshot = await scraper.get_snapshot()
+            return _with_status(
+                DataService.normalize_events(
+                    snapshot.days, TimePeriod.CUSTOM, start, end
+                ),
+                snapshot,
             )
         except Exception as e:
             logger.exception(f"⚠️ Could not fetch {namespace}://events/range: {e}")
-            return {"range": [start, end], "events": [], "error": str(e)}
+            return {
+                "range": [start, end],
+                "events": [],
+                "status": "error",
+                "error": str(e),
+            }
+
+    # Scraper metrics
+    @app.resource(
+        f"{namespace}://metrics",
+        name="metrics",
+        title="Scraper Metrics",
+        description="Counters, gauges and latency summaries from the scraper.",
+        mime_type="application/json",
+    )
+    async def metrics():
+        return get_metrics().snapshot()
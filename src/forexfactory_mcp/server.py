@@ -29,6 +29,13 @@ from mcp.server.fastmcp import FastMCP
 # Local modules – managers that register resources, tools, and prompts.
 from forexfactory_mcp.prompts.prompt_manager import register as register_prompts
 from forexfactory_mcp.resources.resource_manager import register as register_resources
+from forexfactory_mcp.services.browser_endpoints import get_browser_endpoints
+from forexfactory_mcp.services.browser_pool import get_browser_pool
+from forexfactory_mcp.services.browser_watchdog import get_watchdog
+from forexfactory_mcp.services.http_scraper import get_http_fetcher
+from forexfactory_mcp.services.leader_lease import get_leases
+from forexfactory_mcp.services.refresh_service import get_refresher
+from forexfactory_mcp.services.scrape_workers import get_scrape_workers
 from forexfactory_mcp.settings import get_settings
 from forexfactory_mcp.tools.tools_manager import register_tools
 
@@ -126,6 +133,41 @@ async def main_async():
     """
     logger.info(f"🚀 Starting ForexFactory MCP server (transport={transport})")
 
+    # Health-check remote browsers (if configured) before the pool connects
+    endpoints = get_browser_endpoints()
+    if endpoints is not None:
+        await endpoints.check()
+        await endpoints.start()
+
+    # Warm up the shared browser pool so the first scrape doesn't cold-launch.
+    # A failure here is not fatal: the pool retries lazily on first use.
+    # With scrape workers, each worker owns its browser instead.
+    pool = get_browser_pool()
+    workers = get_scrape_workers()
+    try:
+        if workers is not None:
+            await workers.start()
+        else:
+            await pool.start()
+    except Exception as e:
+        logger.error(f"⚠️ Could not start browser pool: {e}")
+
+    # Watch browser memory and clean up leaked Chromium processes
+    watchdog = get_watchdog()
+    if settings.WATCHDOG_ENABLED:
+        await watchdog.start()
+
+    # Coordinate scraping with other replicas sharing the cache (if enabled)
+    leases = get_leases()
+    if leases is not None:
+        await leases.start()
+
+    # Keep hot periods (today, this week, ...) refreshed in the background,
+    # serving the snapshots saved before the last restart until refreshed
+    refresher = get_refresher()
+    refresher.restore()
+    await refresher.start()
+
     try:
         if transport == "stdio":
             # Standard input/output transport for local inspectors
@@ -159,6 +201,18 @@ async def main_async():
             print("3. Try a different port with --port <PORT>.")
         sys.exit(1)
 
+    finally:
+        await refresher.stop()
+        if leases is not None:
+            await leases.stop()
+        await watchdog.stop()
+        await pool.close()
+        if workers is not None:
+            await workers.close()
+        if endpoints is not None:
+            await endpoints.stop()
+        await get_http_fetcher().close()
+
 
 # -----------------------------------------------------------------------------
 # 🏁 Entrypoint wrapper
@@ -0,0 +1,162 @@
+"""
+adaptive_timeout.py
+
+Scrape timeouts learned from observed latency.
+
+A single static `SCRAPER_TIMEOUT_MS` is too long for a one-day page and too
+short for a month or a long range. Scrapes are therefore bucketed by the size
+of the page they load (`scrape_bucket`):
+
+  - "day"   → `?day=...` and 1-day ranges
+  - "week"  → `?week=...` and ranges up to 7 days
+  - "month" → `?month=...` and ranges up to 31 days
+  - "range" → anything longer
+
+Each bucket keeps a rolling window of successful scrape latencies in the
+metrics registry (`scrape.latency_ms.<bucket>`), and its timeout is the
+`SCRAPER_TIMEOUT_QUANTILE` of that window times `SCRAPER_TIMEOUT_MULTIPLIER`,
+clamped to [`SCRAPER_TIMEOUT_FLOOR_MS`, `SCRAPER_TIMEOUT_CEILING_MS`]. Until a
+bucket has `SCRAPER_TIMEOUT_MIN_SAMPLES` samples, `SCRAPER_TIMEOUT_MS` is used
+(within the same bounds).
+
+Failed scrapes don't add samples (a timeout would feed the current timeout
+back into the window and ratchet it up). Instead, every consecutive failure
+in a bucket doubles its next timeout, up to the ceiling, until a scrape
+succeeds, so a timeout learned too tight still recovers.
+
+Usage:
+    from forexfactory_mcp.services.adaptive_timeout import (
+        get_adaptive_timeouts,
+        scrape_bucket,
+    )
+
+    timeout_ms = get_adaptive_timeouts().timeout_ms(scrape_bucket(url))
+"""
+
+import datetime as dt
+import logging
+from functools import lru_cache
+from typing import Dict
+from urllib.parse import parse_qs, urlsplit
+
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+LATENCY_METRIC = "scrape.latency_ms"
+
+
+def _range_days(value: str) -> int | None:
+    """Number of days in a `mmmdd.yyyy-mmmdd.yyyy` range parameter."""
+    try:
+        start, end = (dt.datetime.strptime(v, "%b%d.%Y") for v in value.split("-"))
+    except ValueError:
+        return None
+    return (end - start).days + 1
+
+
+def scrape_bucket(url: str) -> str:
+    """Classify a calendar URL as a "day", "week", "month" or "range" scrape."""
+    query = parse_qs(urlsplit(url).query)
+
+    for bucket in ("day", "week", "month"):
+        if bucket in query:
+            return bucket
+
+    days = _range_days(query.get("range", [""])[0])
+    if days is None:
+        return "range"
+    if days <= 1:
+        return "day"
+    if days <= 7:
+        return "week"
+    if days <= 31:
+        return "month"
+    return "range"
+
+
+def latency_series(bucket: str) -> str:
+    """Metrics series holding the latency samples of a bucket."""
+    return f"{LATENCY_METRIC}.{bucket}"
+
+
+class AdaptiveTimeouts:
+    """
+    Per-bucket scrape timeouts derived from recent latencies.
+
+    Parameters
+    ----------
+    enabled : bool
+        When False, `default_ms` is always used.
+    default_ms : int
+        Timeout used until a bucket has enough samples.
+    quantile : float
+        Latency quantile (0..1) the timeout is based on.
+    multiplier : float
+        Headroom applied on top of the quantile.
+    min_samples : int
+        Samples a bucket needs before its timeout is learned.
+    floor_ms, ceiling_ms : int
+        Bounds for every timeout.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        default_ms: int,
+        quantile: float,
+        multiplier: float,
+        min_samples: int,
+        floor_ms: int,
+        ceiling_ms: int,
+    ):
+        self.enabled = enabled
+        self.default_ms = default_ms
+        self.quantile = quantile
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self.floor_ms = floor_ms
+        self.ceiling_ms = max(floor_ms, ceiling_ms)
+        self._failures: Dict[str, int] = {}
+
+    def timeout_ms(self, bucket: str) -> int:
+        """Timeout (ms) for the next scrape in `bucket`."""
+        if not self.enabled:
+            return self.default_ms
+
+        metrics = get_metrics()
+        series = latency_series(bucket)
+        timeout_ms = float(self.default_ms)
+        if metrics.sample_count(series) >= self.min_samples:
+            timeout_ms = metrics.quantile(series, self.quantile) * self.multiplier
+        timeout_ms *= 2 ** self._failures.get(bucket, 0)
+
+        timeout_ms = int(min(self.ceiling_ms, max(self.floor_ms, timeout_ms)))
+        metrics.set_gauge(f"scrape.timeout_ms.{bucket}", timeout_ms)
+        return timeout_ms
+
+    def observe(self, bucket: str, elapsed_ms: float) -> None:
+        """Record how long a successful scrape in `bucket` took."""
+        self._failures.pop(bucket, None)
+        get_metrics().observe(latency_series(bucket), elapsed_ms)
+
+    def record_failure(self, bucket: str) -> None:
+        """Widen `bucket`'s next timeouts after a failed scrape."""
+        # Capped well past any ceiling / timeout ratio.
+        self._failures[bucket] = min(self._failures.get(bucket, 0) + 1, 16)
+
+
+@lru_cache
+def get_adaptive_timeouts() -> AdaptiveTimeouts:
+    """Cached accessor for the adaptive scrape timeouts."""
+    settings = get_settings()
+    return AdaptiveTimeouts(
+        enabled=settings.SCRAPER_ADAPTIVE_TIMEOUT,
+        default_ms=settings.SCRAPER_TIMEOUT_MS,
+        quantile=settings.SCRAPER_TIMEOUT_QUANTILE,
+        multiplier=settings.SCRAPER_TIMEOUT_MULTIPLIER,
+        min_samples=settings.SCRAPER_TIMEOUT_MIN_SAMPLES,
+        floor_ms=settings.SCRAPER_TIMEOUT_FLOOR_MS,
+        ceiling_ms=settings.SCRAPER_TIMEOUT_CEILING_MS,
+    )
@@ -0,0 +1,223 @@
+"""
+browser_endpoints.py
+
+Remote browsers for the browser pool.
+
+By default the pool launches Chromium next to the MCP server, so scrape bursts
+compete with the server for CPU. With `BROWSER_ENDPOINTS` set, pool slots
+connect to external browsers instead and the server only drives them:
+
+  - `ws://` / `wss://` endpoints are Playwright browser servers
+    (`playwright run-server`, see the `browser` service in docker-compose.yml)
+    and are joined with `chromium.connect()`;
+  - `http://` / `https://` endpoints, and `ws://…/devtools/…` URLs, are Chrome
+    DevTools Protocol endpoints joined with `chromium.connect_over_cdp()`.
+
+Slots are spread over the healthy endpoints (fewest slots first). An endpoint
+that fails to connect, or whose browser disconnects, is marked down for
+`BROWSER_ENDPOINT_RETRY_S`; a background health check probes every endpoint
+each `BROWSER_ENDPOINT_HEALTH_S` and brings it back once it answers again.
+
+Usage:
+    from forexfactory_mcp.services.browser_endpoints import get_browser_endpoints
+
+    endpoints = get_browser_endpoints()  # None when browsers run locally
+    browser, endpoint = await endpoints.connect(playwright)
+"""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.async_api import Browser, Playwright
+
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserEndpoint:
+    """
+    One remote browser endpoint and its health.
+
+    Attributes
+    ----------
+    url : str
+        Endpoint URL as configured.
+    slots : int
+        Pool slots currently connected to this endpoint.
+    down_until : float
+        Monotonic time until which the endpoint is skipped (0 = healthy).
+    """
+
+    def __init__(self, index: int, url: str):
+        self.index = index
+        self.url = url
+        self.slots = 0
+        self.down_until = 0.0
+
+    @property
+    def is_cdp(self) -> bool:
+        scheme = urlsplit(self.url).scheme
+        return scheme in ("http", "https") or "/devtools/" in self.url
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def mark_down(self, retry_s: float) -> None:
+        self.down_until = time.monotonic() + retry_s
+        get_metrics().set_gauge(f"browser.endpoint.{self.index}.healthy", 0)
+
+    def mark_up(self) -> None:
+        self.down_until = 0.0
+        get_metrics().set_gauge(f"browser.endpoint.{self.index}.healthy", 1)
+
+    async def probe(self, timeout_s: float) -> bool:
+        """True if the endpoint accepts TCP connections."""
+        parts = urlsplit(self.url)
+        default_port = 443 if parts.scheme in ("https", "wss") else 80
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(parts.hostname, parts.port or default_port),
+                timeout_s,
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+    async def connect(self, playwright: Playwright, timeout_ms: int) -> Browser:
+        if self.is_cdp:
+            return await playwright.chromium.connect_over_cdp(
+                self.url, timeout=timeout_ms
+            )
+        return await playwright.chromium.connect(self.url, timeout=timeout_ms)
+
+
+class BrowserEndpoints:
+    """
+    Health-checked, load-balanced set of remote browser endpoints.
+
+    Parameters
+    ----------
+    urls : List[str]
+        Endpoint URLs.
+    retry_s : float
+        How long a failed endpoint is skipped.
+    health_interval_s : float
+        Cadence of the background health check.
+    connect_timeout_ms : int
+        Timeout for connecting to an endpoint.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        retry_s: float,
+        health_interval_s: float,
+        connect_timeout_ms: int,
+    ):
+        self.endpoints = [BrowserEndpoint(i, url) for i, url in enumerate(urls)]
+        self.retry_s = retry_s
+        self.health_interval_s = health_interval_s
+        self.connect_timeout_ms = connect_timeout_ms
+        self._task: Optional[asyncio.Task] = None
+
+    def _candidates(self) -> List[BrowserEndpoint]:
+        """Endpoints in the order they should be tried."""
+        healthy = [e for e in self.endpoints if e.healthy]
+        down = [e for e in self.endpoints if not e.healthy]
+        # Least-loaded healthy endpoints first; if everything is down, still
+        # try the ones that should come back soonest.
+        return sorted(healthy, key=lambda e: (e.slots, e.index)) + sorted(
+            down, key=lambda e: e.down_until
+        )
+
+    async def connect(self, playwright: Playwright) -> Tuple[Browser, BrowserEndpoint]:
+        """
+        Connect to the best available endpoint.
+
+        Raises
+        ------
+        RuntimeError
+            If no endpoint could be connected to.
+        """
+        errors = []
+        for endpoint in self._candidates():
+            try:
+                browser = await endpoint.connect(playwright, self.connect_timeout_ms)
+            except Exception as e:
+                logger.warning(f"⚠️ Browser endpoint {endpoint.url} failed: {e}")
+                get_metrics().incr("browser.endpoint_failures")
+                endpoint.mark_down(self.retry_s)
+                errors.append(f"{endpoint.url}: {e}")
+                continue
+
+            endpoint.mark_up()
+            endpoint.slots += 1
+            logger.info(f"🛰 Connected to remote browser {endpoint.url}")
+            return browser, endpoint
+
+        raise RuntimeError(f"No browser endpoint available ({'; '.join(errors)})")
+
+    def release(self, endpoint: BrowserEndpoint, failed: bool = False) -> None:
+        """Forget a slot's connection; `failed` marks the endpoint down."""
+        endpoint.slots = max(0, endpoint.slots - 1)
+        if failed:
+            endpoint.mark_down(self.retry_s)
+
+    async def start(self) -> None:
+        """Start the background health check (no-op if already running)."""
+        if self._task is None:
+            logger.info(
+                f"🛰 Using {len(self.endpoints)} remote browser endpoint(s), "
+                f"health check every {self.health_interval_s}s"
+            )
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def check(self) -> None:
+        """Probe every endpoint and update its health."""
+        timeout_s = self.connect_timeout_ms / 1000
+        results = await asyncio.gather(
+            *(endpoint.probe(timeout_s) for endpoint in self.endpoints)
+        )
+        for endpoint, ok in zip(self.endpoints, results):
+            if ok and not endpoint.healthy:
+                logger.info(f"✅ Browser endpoint {endpoint.url} is back")
+                endpoint.mark_up()
+            elif not ok and endpoint.healthy:
+                logger.warning(f"⚠️ Browser endpoint {endpoint.url} is unreachable")
+                endpoint.mark_down(self.retry_s)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                logger.exception(f"⚠️ Browser endpoint health check failed: {e}")
+            await asyncio.sleep(self.health_interval_s)
+
+
+@lru_cache
+def get_browser_endpoints() -> Optional[BrowserEndpoints]:
+    """Cached accessor for the remote browser endpoints (None if unset)."""
+    settings = get_settings()
+    if not settings.BROWSER_ENDPOINTS:
+        return None
+    return BrowserEndpoints(
+        urls=settings.BROWSER_ENDPOINTS,
+        retry_s=settings.BROWSER_ENDPOINT_RETRY_S,
+        health_interval_s=settings.BROWSER_ENDPOINT_HEALTH_S,
+        connect_timeout_ms=settings.SCRAPER_TIMEOUT_MS,
+    )
@@ -0,0 +1,469 @@
+"""
+browser_pool.py
+
+Process-wide pool of warm Chromium browsers used by the ForexFactory scraper.
+
+Launching Playwright + Chromium costs 1–3 s per scrape. Instead, the pool keeps
+`BROWSER_POOL_SIZE` browsers alive for the lifetime of the server, each with a
+pre-created `BrowserContext` and `Page`. Scrapes borrow a page, use it, and
+hand it back. A slot is recycled (closed and relaunched) after
+`BROWSER_MAX_USES` scrapes, or as soon as its browser/page crashes or a scrape
+fails on it.
+
+Every pooled context routes its requests through the scrape `RequestPolicy`
+(images, fonts, stylesheets and third-party hosts are aborted), and the
+traffic loaded/blocked per scrape (with an estimate of the bytes saved) is
+logged and recorded in the metrics.
+
+With `BROWSER_PERSIST_SESSION`, slots run persistent profiles with a bounded
+disk cache and share a saved storage state (see `browser_session`); a scrape
+that raises `SessionRejectedError` invalidates that session and every slot
+is relaunched with a clean profile.
+
+With `BROWSER_ENDPOINTS`, slots connect to remote browsers (Playwright
+browser servers or CDP endpoints, see `browser_endpoints`) instead of
+launching Chromium locally, so scraping can scale separately from the server.
+Remote slots use a fresh context seeded with the saved session cookies.
+
+Each browser is launched with a per-slot marker switch so its process tree can
+be found in `/proc`. Closing a slot that doesn't shut down within
+`BROWSER_CLOSE_TIMEOUT_S` kills its processes, and the `BrowserWatchdog` uses
+the same trees for RSS tracking. Recycles are counted in `browser.recycles`
+and `browser.recycles.<reason>`.
+
+Usage:
+    from forexfactory_mcp.services.browser_pool import get_browser_pool
+
+    async with get_browser_pool().page() as page:
+        await page.goto(url)
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Response,
+    Route,
+    async_playwright,
+)
+
+from forexfactory_mcp.services.browser_endpoints import (
+    BrowserEndpoint,
+    get_browser_endpoints,
+)
+from forexfactory_mcp.services.browser_session import get_browser_session
+from forexfactory_mcp.services.hedging import is_hedge_cancel
+from forexfactory_mcp.services.request_policy import TrafficStats, get_request_policy
+from forexfactory_mcp.services.resilience import SessionRejectedError
+from forexfactory_mcp.services.scrape_recorder import get_scrape_recorder
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils import procfs
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Unique per launch, so a browser's process tree can be found by cmdline.
+_launch_ids = itertools.count()
+
+
+class BrowserSlot:
+    """
+    A single pooled Chromium browser with its pre-created context and page.
+
+    Attributes
+    ----------
+    index : int
+        Position of the slot in the pool (used for logging).
+    uses : int
+        Number of scrapes served since the slot was last (re)launched.
+    crashed : bool
+        Set when the browser disconnects, the page crashes, or a scrape fails.
+        A crashed slot is recycled before its next use.
+    recycle_reason : Optional[str]
+        Why the slot must be recycled before its next use (e.g. "rss" when the
+        watchdog finds it over `BROWSER_MAX_RSS_MB`), if anything.
+    pid : Optional[int]
+        Pid of the Chromium browser process (None if it couldn't be found, or
+        the browser is remote).
+    endpoint : Optional[BrowserEndpoint]
+        Remote endpoint the browser is connected to (None when local).
+    session_generation : int
+        `BrowserSession.generation` the slot's profile was opened under.
+    traffic : TrafficStats
+        Requests loaded/blocked during the current scrape.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.uses = 0
+        self.crashed = False
+        self.recycle_reason: Optional[str] = None
+        self.pid: Optional[int] = None
+        self.endpoint: Optional[BrowserEndpoint] = None
+        self.session_generation = 0
+        self.traffic = TrafficStats()
+
+    @property
+    def healthy(self) -> bool:
+        """True if the slot can serve a scrape without being relaunched."""
+        return (
+            not self.crashed
+            and self.recycle_reason is None
+            and self.context is not None
+            # Persistent contexts have no separate Browser object.
+            and (self.browser is None or self.browser.is_connected())
+            and self.page is not None
+            and not self.page.is_closed()
+        )
+
+    def _mark_crashed(self, *_args) -> None:
+        self.crashed = True
+
+    async def _route(self, route: Route) -> None:
+        """
+        Abort requests the scrape policy rejects; let the rest through (or,
+        when replaying recordings, answer them offline).
+        """
+        request = route.request
+        policy = get_request_policy()
+        reason = (
+            policy.block_reason(request.resource_type, request.url) if policy else None
+        )
+        recorder = get_scrape_recorder()
+        try:
+            if reason:
+                self.traffic.record_blocked(reason, request.resource_type)
+                await route.abort()
+            elif recorder is not None and recorder.replaying:
+                if await recorder.fulfill(route):
+                    self.traffic.allowed += 1
+                else:
+                    self.traffic.blocked["replay"] += 1
+            else:
+                self.traffic.allowed += 1
+                await route.continue_()
+        except Exception:
+            pass  # page/context closed mid-request
+
+    def _on_response(self, response: Response) -> None:
+        self.traffic.record_response(response.headers.get("content-length"))
+
+    def process_tree(self, procs: Dict[int, procfs.ProcInfo]) -> Set[int]:
+        """Pids of the browser process and all of its helpers."""
+        if self.pid is None or self.pid not in procs:
+            return set()
+        return procfs.descendants(self.pid, procs)
+
+    def _find_pid(self, marker: str) -> Optional[int]:
+        procs = procfs.list_processes()
+        ours = procfs.descendants(os.getpid(), procs)
+        pids = procfs.find_by_cmdline(marker, ours - {os.getpid()})
+        # The browser is the topmost process carrying the marker.
+        return next((p for p in pids if procs[p].ppid not in pids), None)
+
+    async def open(self, playwright: Playwright) -> None:
+        """Launch (or connect to) Chromium and pre-create the context and page."""
+        settings = get_settings()
+        session = get_browser_session()
+        endpoints = get_browser_endpoints()
+
+        # Chromium ignores unknown switches; this one tags the process tree.
+        marker = f"--forexfactory-mcp-slot={os.getpid()}.{next(_launch_ids)}"
+        args = ["--no-sandbox", marker]
+
+        if endpoints is not None:
+            self.browser, self.endpoint = await endpoints.connect(playwright)
+            self.browser.on("disconnected", self._mark_crashed)
+            self.context = await self.browser.new_context(
+                extra_http_headers=settings.extra_http_headers
+            )
+            if session is not None:
+                self.session_generation = session.generation
+        elif session is None:
+            self.browser = await playwright.chromium.launch(headless=True, args=args)
+            self.browser.on("disconnected", self._mark_crashed)
+            self.context = await self.browser.new_context(
+                extra_http_headers=settings.extra_http_headers
+            )
+        else:
+            user_data_dir = session.prepare_slot_dir(
+                self.index, wipe=self.session_generation < session.generation
+            )
+            self.session_generation = session.generation
+            self.browser = None
+            self.context = await playwright.chromium.launch_persistent_context(
+                user_data_dir,
+                headless=True,
+                args=args + session.launch_args,
+                extra_http_headers=settings.extra_http_headers,
+            )
+            self.context.on("close", self._mark_crashed)
+        if self.endpoint is None:
+            self.pid = self._find_pid(marker)
+
+        if session is not None:
+            state = session.load_state()
+            if state and state.get("cookies"):
+                await self.context.add_cookies(state["cookies"])
+
+        recorder = get_scrape_recorder()
+        if get_request_policy() is not None or (recorder and recorder.replaying):
+            await self.context.route("**/*", self._route)
+        self.context.on("response", self._on_response)
+
+        pages = self.context.pages
+        self.page = pages[0] if pages else await self.context.new_page()
+        self.page.on("crash", self._mark_crashed)
+
+        self.uses = 0
+        self.crashed = False
+        self.recycle_reason = None
+
+    async def close(self) -> None:
+        """
+        Close page, context and browser in reverse order.
+
+        Each step gets `BROWSER_CLOSE_TIMEOUT_S`; whatever is left of the
+        browser's process tree afterwards (hung or crashed browsers) is
+        killed and reaped. A remote browser that dropped its connection marks
+        its endpoint down.
+        """
+        timeout_s = get_settings().BROWSER_CLOSE_TIMEOUT_S
+        if self.endpoint is not None:
+            get_browser_endpoints().release(
+                self.endpoint,
+                failed=self.browser is not None and not self.browser.is_connected(),
+            )
+            self.endpoint = None
+
+        for close_fn in [
+            self.page.close if self.page else None,
+            self.context.close if self.context else None,
+            self.browser.close if self.browser else None,
+        ]:
+            if close_fn:
+                try:
+                    await asyncio.wait_for(close_fn(), timeout_s)
+                except Exception as e:
+                    logger.debug(f"Browser slot {self.index} close step failed: {e}")
+
+        self._kill_leftovers()
+
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.pid = None
+
+    def _kill_leftovers(self) -> None:
+        procs = procfs.list_processes()
+        tree = self.process_tree(procs)
+        alive = [pid for pid in tree if not procs[pid].is_zombie]
+        if alive:
+            logger.warning(
+                f"🔪 Killing {len(alive)} leftover Chromium process(es) "
+                f"of browser slot {self.index}"
+            )
+            get_metrics().incr("browser.processes_killed", procfs.kill(alive))
+        for pid in tree:
+            if procs[pid].ppid == os.getpid():
+                procfs.reap(pid)
+
+
+class BrowserPool:
+    """
+    Fixed-size pool of warm Chromium browsers.
+
+    Parameters
+    ----------
+    size : int
+        Number of browsers kept alive (and the max number of concurrent scrapes).
+    max_uses : int
+        Number of scrapes a slot serves before it is recycled.
+    """
+
+    def __init__(self, size: int, max_uses: int):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+
+        self._playwright: Optional[Playwright] = None
+        self._slots: List[BrowserSlot] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    @property
+    def slots(self) -> List[BrowserSlot]:
+        return list(self._slots)
+
+    async def start(self) -> None:
+        """
+        Start Playwright and launch all browsers. Safe to call repeatedly.
+
+        A browser that fails to launch is kept as a crashed slot and relaunched
+        on first use, so a flaky launch doesn't shrink the pool permanently.
+        """
+        async with self._start_lock:
+            if self.started:
+                return
+
+            logger.info(f"🚀 Starting browser pool (size={self.size})")
+            playwright = await async_playwright().start()
+            idle: asyncio.Queue = asyncio.Queue()
+
+            for index in range(self.size):
+                slot = BrowserSlot(index)
+                try:
+                    await slot.open(playwright)
+                except Exception as e:
+                    logger.error(f"⚠️ Could not launch browser slot {index}: {e}")
+                    slot.crashed = True
+                self._slots.append(slot)
+                idle.put_nowait(slot)
+
+            self._idle = idle
+            self._playwright = playwright
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        async with self._start_lock:
+            if not self.started:
+                return
+
+            logger.info("🛑 Closing browser pool")
+            for slot in self._slots:
+                await slot.close()
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+
+            self._slots = []
+            self._idle = None
+            self._playwright = None
+
+    async def _recycle(self, slot: BrowserSlot, reason: str) -> None:
+        logger.info(
+            f"♻️ Recycling browser slot {slot.index} ({reason}, uses={slot.uses})"
+        )
+        metrics = get_metrics()
+        metrics.incr("browser.recycles")
+        metrics.incr(f"browser.recycles.{reason}")
+        await slot.close()
+        await slot.open(self._playwright)
+
+    def _recycle_reason(self, slot: BrowserSlot) -> Optional[str]:
+        if slot.recycle_reason:
+            return slot.recycle_reason
+        session = get_browser_session()
+        if session and slot.session_generation < session.generation:
+            return "session"
+        if not slot.healthy:
+            return "crashed"
+        if slot.uses >= self.max_uses:
+            return "max_uses"
+        return None
+
+    async def recycle_flagged(self) -> None:
+        """
+        Recycle idle slots flagged for recycling (e.g. by the watchdog) now,
+        instead of on their next use. Busy slots are recycled when returned.
+        """
+        if not self.started:
+            return
+
+        for _ in range(self._idle.qsize()):
+            slot = self._idle.get_nowait()
+            try:
+                if slot.recycle_reason:
+                    await self._recycle(slot, slot.recycle_reason)
+            except Exception as e:
+                logger.error(f"⚠️ Could not recycle browser slot {slot.index}: {e}")
+                slot.crashed = True
+            finally:
+                self._idle.put_nowait(slot)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Borrow a warm page for the duration of one scrape.
+
+        Waits for a free slot if all browsers are busy. The slot is recycled
+        before use if it has crashed or reached `max_uses`, and marked for
+        recycling if the scrape raises (or is cancelled, unless it merely
+        lost a hedge).
+        """
+        await self.start()
+        slot: BrowserSlot = await self._idle.get()
+
+        try:
+            reason = self._recycle_reason(slot)
+            if reason:
+                await self._recycle(slot, reason)
+            slot.uses += 1
+            slot.traffic = TrafficStats()
+            yield slot.page
+
+            # Only a slot opened under the current session may overwrite it.
+            session = get_browser_session()
+            if session is not None and slot.session_generation == session.generation:
+                await session.save_state(slot.context)
+        except BaseException as e:
+            if is_hedge_cancel(e):
+                # The other attempt won; this browser is fine, keep it warm.
+                raise
+            slot.crashed = True
+            if isinstance(e, SessionRejectedError):
+                session = get_browser_session()
+                if session is not None:
+                    session.invalidate(str(e))
+                slot.recycle_reason = "session"
+            if slot.recycle_reason is None:
+                slot.recycle_reason = (
+                    "cancelled" if isinstance(e, asyncio.CancelledError) else "failed"
+                )
+            raise
+        finally:
+            self._report_traffic(slot.traffic)
+            self._idle.put_nowait(slot)
+
+    @staticmethod
+    def _report_traffic(traffic: TrafficStats) -> None:
+        logger.info(f"🧱 Scrape traffic: {traffic.summary()}")
+        metrics = get_metrics()
+        metrics.incr("scrape.requests_loaded", traffic.allowed)
+        metrics.incr("scrape.requests_blocked", traffic.blocked_total)
+        metrics.incr("scrape.bytes_loaded", traffic.bytes_loaded)
+        metrics.incr("scrape.responses_unsized", traffic.unsized)
+        metrics.incr("scrape.bytes_saved", traffic.bytes_saved)
+        for reason, count in traffic.blocked.items():
+            metrics.incr(f"scrape.requests_blocked.{reason}", count)
+
+
+@lru_cache
+def get_browser_pool() -> BrowserPool:
+    """
+    Cached accessor for the process-wide BrowserPool.
+
+    The pool is created lazily; browsers are launched by `start()` (called
+    from the server entrypoint) or on the first borrowed page.
+    """
+    settings = get_settings()
+    return BrowserPool(
+        size=settings.BROWSER_POOL_SIZE,
+        max_uses=settings.BROWSER_MAX_USES,
+    )
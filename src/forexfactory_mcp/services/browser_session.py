@@ -0,0 +1,149 @@
+"""
+browser_session.py
+
+Browser session state that survives browser launches (and server restarts).
+
+By default every pooled browser starts from an empty profile, so cookies,
+consent state, anti-bot clearance and the HTTP cache are thrown away on every
+launch or recycle. With `BROWSER_PERSIST_SESSION`:
+
+  - each pool slot uses its own persistent user-data directory under
+    `BROWSER_PROFILE_DIR` (`slot<N>/`, or `w<K>-slot<N>/` in scrape worker K),
+    with Chromium's disk cache bounded to `BROWSER_DISK_CACHE_MB`;
+  - the session of the last successful scrape is saved as a Playwright
+    `storage_state` file (`storage_state.json`, at most every
+    `BROWSER_STATE_SAVE_INTERVAL_S`) and its cookies are loaded into every
+    (re)launched slot, so a clearance obtained by one browser is shared by
+    all of them;
+  - when ForexFactory starts rejecting the session (a challenge page or a
+    403/429/503 without calendar data), `invalidate()` deletes the saved
+    state, and every slot wipes its profile when it is next relaunched.
+
+Usage:
+    from forexfactory_mcp.services.browser_session import get_browser_session
+
+    session = get_browser_session()  # None when persistence is disabled
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import BrowserContext
+
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserSession:
+    """
+    On-disk browser profiles and shared storage state for the browser pool.
+
+    Parameters
+    ----------
+    profile_dir : str
+        Root directory for per-slot profiles and the storage state file.
+    disk_cache_mb : int
+        Chromium disk cache size per slot.
+    save_interval_s : float
+        Minimum time between two storage state saves.
+    slot_prefix : str
+        Name prefix of the slot profile directories; processes sharing
+        `profile_dir` need distinct prefixes (Chromium locks a profile).
+    """
+
+    def __init__(
+        self,
+        profile_dir: str,
+        disk_cache_mb: int,
+        save_interval_s: float,
+        slot_prefix: str = "slot",
+    ):
+        self.profile_dir = os.path.expanduser(profile_dir)
+        self.disk_cache_mb = disk_cache_mb
+        self.save_interval_s = save_interval_s
+        self.slot_prefix = slot_prefix
+
+        # Bumped by `invalidate()`; slots opened under an older generation
+        # wipe their profile before relaunching.
+        self.generation = 0
+        self._saved_at = 0.0
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.profile_dir, "storage_state.json")
+
+    def slot_dir(self, index: int) -> str:
+        return os.path.join(self.profile_dir, f"{self.slot_prefix}{index}")
+
+    @property
+    def launch_args(self) -> List[str]:
+        return [f"--disk-cache-size={self.disk_cache_mb * 1024 * 1024}"]
+
+    def prepare_slot_dir(self, index: int, wipe: bool) -> str:
+        """Return the slot's profile directory, wiping it first if asked."""
+        path = self.slot_dir(index)
+        if wipe:
+            logger.info(f"🧽 Wiping browser profile {path}")
+            shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        """The saved storage state, or None if missing/unreadable."""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable storage state: {e}")
+            return None
+
+    async def save_state(self, context: BrowserContext) -> None:
+        """Save `context`'s storage state (throttled, atomic)."""
+        now = time.monotonic()
+        if now - self._saved_at < self.save_interval_s:
+            return
+        self._saved_at = now
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        # Per process: scrape workers save the same state file
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        try:
+            await context.storage_state(path=tmp_path)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not save browser storage state: {e}")
+
+    def invalidate(self, reason: str) -> None:
+        """Forget the saved session after ForexFactory rejected it."""
+        logger.warning(f"🚷 Browser session rejected ({reason}); invalidating it")
+        get_metrics().incr("browser.session_invalidated")
+        self.generation += 1
+        self._saved_at = 0.0
+        try:
+            os.remove(self.state_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"⚠️ Could not delete storage state: {e}")
+
+
+@lru_cache
+def get_browser_session() -> Optional[BrowserSession]:
+    """Cached accessor for the persisted browser session (None if disabled)."""
+    settings = get_settings()
+    if not settings.BROWSER_PERSIST_SESSION:
+        return None
+    return BrowserSession(
+        profile_dir=settings.BROWSER_PROFILE_DIR,
+        disk_cache_mb=settings.BROWSER_DISK_CACHE_MB,
+        save_interval_s=settings.BROWSER_STATE_SAVE_INTERVAL_S,
+    )
@@ -0,0 +1,157 @@
+"""
+browser_watchdog.py
+
+Background watchdog for the pooled Chromium processes.
+
+On a long-running deployment, browsers that hang or crash mid-scrape can leave
+orphaned Chromium processes behind that slowly eat RAM. Every
+`WATCHDOG_INTERVAL_S` the watchdog:
+
+  - measures the RSS of each pooled browser's process tree
+    (`browser.rss_mb`, `browser.rss_mb.slot<N>`) and force-recycles browsers
+    above `BROWSER_MAX_RSS_MB`,
+  - kills Chromium processes re-parented to this server that no pooled
+    browser owns any more (`watchdog.orphans_killed`),
+  - reaps Chromium zombies left as our children (`watchdog.zombies_reaped`).
+
+The server registers itself as a child subreaper on start, so orphans end up
+as our children even when it doesn't run as PID 1. The per-scrape hard
+deadline lives in `FFScraperService` (`SCRAPER_DEADLINE_FACTOR`).
+
+Usage:
+    from forexfactory_mcp.services.browser_watchdog import get_watchdog
+
+    await get_watchdog().start()
+"""
+
+import asyncio
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Set
+
+from forexfactory_mcp.services.browser_pool import BrowserPool, get_browser_pool
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils import procfs
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+# `comm` prefixes of Chromium browser/helper processes (comm is truncated to
+# 15 characters).
+_CHROMIUM_COMMS = ("chrome", "chromium", "headless_shell")
+
+
+def _is_chromium(comm: str) -> bool:
+    return comm.lower().startswith(_CHROMIUM_COMMS)
+
+
+class BrowserWatchdog:
+    """
+    Periodic RSS check, orphan killer and zombie reaper for the browser pool.
+
+    Parameters
+    ----------
+    pool : BrowserPool
+        Pool whose browsers are watched.
+    interval_s : float
+        Seconds between checks.
+    max_rss_mb : int
+        RSS per browser (process tree) above which it is recycled; 0 disables.
+    """
+
+    def __init__(self, pool: BrowserPool, interval_s: float, max_rss_mb: int):
+        self.pool = pool
+        self.interval_s = interval_s
+        self.max_rss_mb = max_rss_mb
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the watchdog loop (no-op if running or /proc is unavailable)."""
+        if self._task is not None:
+            return
+        if not procfs.available():
+            logger.info("🐕 /proc not available; browser watchdog disabled")
+            return
+
+        if not procfs.become_subreaper():
+            logger.debug("Could not become child subreaper; orphans go to PID 1")
+
+        logger.info(f"🐕 Starting browser watchdog (every {self.interval_s}s)")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.exception(f"⚠️ Browser watchdog check failed: {e}")
+
+    async def check(self) -> None:
+        """Run one round of RSS accounting, orphan killing and reaping."""
+        procs = procfs.list_processes()
+        metrics = get_metrics()
+
+        owned: Set[int] = set()
+        total_rss = 0
+        flagged = False
+
+        for slot in self.pool.slots:
+            tree = slot.process_tree(procs)
+            owned |= tree
+            rss = sum(procfs.rss_bytes(pid) for pid in tree)
+            total_rss += rss
+            metrics.set_gauge(f"browser.rss_mb.slot{slot.index}", round(rss / _MB, 1))
+
+            if (
+                self.max_rss_mb
+                and rss > self.max_rss_mb * _MB
+                and slot.recycle_reason is None
+            ):
+                logger.warning(
+                    f"🐘 Browser slot {slot.index} uses {rss / _MB:.0f} MB "
+                    f"(> {self.max_rss_mb} MB); recycling"
+                )
+                slot.recycle_reason = "rss"
+                flagged = True
+
+        metrics.set_gauge("browser.rss_mb", round(total_rss / _MB, 1))
+        self._reap_orphans(procs, owned)
+
+        if flagged:
+            await self.pool.recycle_flagged()
+
+    @staticmethod
+    def _reap_orphans(procs: Dict[int, procfs.ProcInfo], owned: Set[int]) -> None:
+        me = os.getpid()
+        metrics = get_metrics()
+
+        for info in procs.values():
+            if info.ppid != me or info.pid in owned or not _is_chromium(info.comm):
+                continue
+            if info.is_zombie:
+                if procfs.reap(info.pid):
+                    metrics.incr("watchdog.zombies_reaped")
+            elif procfs.kill([info.pid]):
+                logger.warning(f"🔪 Killed orphaned Chromium process {info.pid}")
+                metrics.incr("watchdog.orphans_killed")
+
+
+@lru_cache
+def get_watchdog() -> BrowserWatchdog:
+    """Cached accessor for the process-wide browser watchdog."""
+    settings = get_settings()
+    return BrowserWatchdog(
+        pool=get_browser_pool(),
+        interval_s=settings.WATCHDOG_INTERVAL_S,
+        max_rss_mb=settings.BROWSER_MAX_RSS_MB,
+    )
@@ -0,0 +1,440 @@
+"""
+cache_service.py
+
+Cache for scraped ForexFactory calendar data.
+
+Scraped `days` arrays are stored as `CalendarSnapshot`s in a bounded LRU cache
+with a per-entry TTL. The TTL depends on the requested period:
+
+  - Past periods (yesterday, last week/month, custom ranges entirely in the
+    past) are effectively immutable → `CACHE_TTL_PAST_S` (hours).
+  - Current periods (today, this week/month, ranges that include today) get
+    `CACHE_TTL_CURRENT_S`, because actuals fill in during the day.
+  - Future periods (tomorrow, next week/month) → `CACHE_TTL_FUTURE_S`.
+
+Entries are keyed by the period's resolved dates (`utils.date_ranges`) plus
+the raw-field projection, so e.g. `events/week` and a custom range over the
+same Sunday–Saturday share one snapshot, and narrower periods are sliced out
+of a cached wider one by `FFScraperService`.
+
+Usage:
+    from forexfactory_mcp.services.cache_service import get_calendar_cache
+
+    cache = get_calendar_cache()
+    snapshot = await cache.get((start, end, projection))
+
+Expired entries stay in the cache (until LRU eviction) so a failed re-scrape
+can still serve the last good snapshot via `get_stale()`.
+
+`CACHE_BACKEND` picks where snapshots live:
+
+  - "memory" → a per-process `TTLCache` (default).
+  - "sqlite" → a `SqliteCache` at `CACHE_PATH` (WAL mode). Every process
+               pointed at the same file (HTTP replicas on one host or shared
+               volume) reads what any of them scraped, so a period is scraped
+               once per TTL instead of once per replica.
+
+Failures are cached too (`NegativeCache`): after a failed scrape the key is
+not scraped again for `NEGATIVE_CACHE_TTL_S`, doubling on every consecutive
+failure up to `NEGATIVE_CACHE_MAX_TTL_S`. Readers in that window get the last
+good snapshot (marked stale) or the cached error, so an outage costs one
+scrape per key per window instead of one per reader.
+"""
+
+import asyncio
+import datetime as dt
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar, Union
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.date_ranges import local_today
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PAST_PERIODS = {TimePeriod.YESTERDAY, TimePeriod.LAST_WEEK, TimePeriod.LAST_MONTH}
+CURRENT_PERIODS = {TimePeriod.TODAY, TimePeriod.THIS_WEEK, TimePeriod.THIS_MONTH}
+FUTURE_PERIODS = {TimePeriod.TOMORROW, TimePeriod.NEXT_WEEK, TimePeriod.NEXT_MONTH}
+
+
+@dataclass
+class CalendarSnapshot:
+    """
+    Raw ForexFactory `days` array plus the wall-clock time it was scraped.
+
+    `status` is "ok" for fresh data, "stale" when the snapshot is served
+    because a re-scrape failed (`error` then holds the failure) and
+    "restored" when it was saved by a previous run of the server.
+    """
+
+    days: List[Dict[str, Any]]
+    fetched_at: float = field(default_factory=time.time)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def age_s(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+    def freshness(self) -> Dict[str, Any]:
+        """`status`, `age_s` (and `error`) to report alongside served data."""
+        fields: Dict[str, Any] = {"status": self.status, "age_s": round(self.age_s)}
+        if self.error:
+            fields["error"] = self.error
+        return fields
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with a per-entry time-to-live.
+
+    Entries are evicted least-recently-used first once `max_entries` is
+    exceeded, and treated as missing by `get()` once their TTL has elapsed.
+    Expired entries remain readable through `get_stale()` until evicted.
+    The accessors are coroutines, like those of `SqliteCache`.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value even if its TTL has elapsed (None if evicted)."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    async def set(self, key: Hashable, value: Any, ttl_s: float) -> None:
+        """Store a value for `ttl_s` seconds, evicting the LRU entry if full."""
+        if self.max_entries == 0 or ttl_s <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl_s, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"🧹 Evicted cache entry {evicted}")
+
+    async def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+# A read refreshes a row's `accessed_at` once this fraction of its lifetime
+# has passed since the last refresh (instead of writing on every hit).
+_TOUCH_FRACTION = 0.1
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    key TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class SqliteCache:
+    """
+    `TTLCache` counterpart that keeps `CalendarSnapshot`s in a SQLite file
+    shared between processes.
+
+    Keys are stored as JSON, expiry and LRU order use wall-clock time so
+    every process agrees on them. A read records its access time only once
+    a tenth of the entry's lifetime has passed since the last one, and all
+    SQLite calls run on one background thread, so a write lock held by
+    another replica never blocks the event loop. Each process keeps the last snapshot it
+    decoded per key (at most `max_entries`, least recently read dropped
+    first) and only re-reads the payload when another process has replaced
+    the row (tracked by a random `version`).
+
+    Parameters
+    ----------
+    path : str
+        Location of the SQLite database file (created if missing).
+    max_entries : int
+        Snapshots kept across all processes (0 disables caching).
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = os.path.expanduser(path)
+        self.max_entries = max(0, max_entries)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="calendar-cache")
+        # key → (version, decoded snapshot), in LRU order
+        self._decoded: "OrderedDict[str, Tuple[int, CalendarSnapshot]]" = OrderedDict()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=5.0, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_CACHE_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a SQLite operation on the cache's thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def _load(self, key: Hashable) -> Optional[Tuple[float, float, CalendarSnapshot]]:
+        """
+        (expires_at, accessed_at, snapshot) for `key`, decoding the payload
+        only if new.
+        """
+        skey = self._key(key)
+        known = self._decoded.get(skey)
+        row = self.conn.execute(
+            "SELECT expires_at, accessed_at, version, "
+            "CASE WHEN version = ? THEN NULL ELSE payload END "
+            "FROM snapshots WHERE key = ?",
+            (known[0] if known else None, skey),
+        ).fetchone()
+        if row is None:
+            self._decoded.pop(skey, None)
+            return None
+
+        expires_at, accessed_at, version, payload = row
+        if payload is not None:
+            known = (version, CalendarSnapshot(**json.loads(payload)))
+        self._remember(skey, known)
+        return expires_at, accessed_at, known[1]
+
+    def _remember(self, skey: str, decoded: Tuple[int, CalendarSnapshot]) -> None:
+        """Keep a decoded snapshot, forgetting the least recently read ones."""
+        self._decoded[skey] = decoded
+        self._decoded.move_to_end(skey)
+        while len(self._decoded) > max(1, self.max_entries):
+            self._decoded.popitem(last=False)
+
+    async def get(self, key: Hashable) -> Optional[CalendarSnapshot]:
+        """Return the cached snapshot, or None if missing or expired."""
+        return await self._call(self._get, key)
+
+    async def get_stale(self, key: Hashable) -> Optional[CalendarSnapshot]:
+        """Return the cached snapshot even if its TTL has elapsed (None if evicted)."""
+        return await self._call(self._get_stale, key)
+
+    async def set(self, key: Hashable, value: CalendarSnapshot, ttl_s: float) -> None:
+        """Store a snapshot for `ttl_s` seconds, evicting LRU entries if full."""
+        if self.max_entries == 0 or ttl_s <= 0:
+            return
+        await self._call(self._set, key, value, ttl_s)
+
+    async def invalidate(self, key: Hashable) -> None:
+        await self._call(self._invalidate, key)
+
+    async def clear(self) -> None:
+        await self._call(self._clear)
+
+    def _get(self, key: Hashable) -> Optional[CalendarSnapshot]:
+        entry = self._load(key)
+        if entry is None:
+            return None
+
+        expires_at, accessed_at, snapshot = entry
+        now = time.time()
+        if now >= expires_at:
+            return None
+
+        # LRU order only needs to be roughly right
+        if now - accessed_at >= _TOUCH_FRACTION * (expires_at - accessed_at):
+            self.conn.execute(
+                "UPDATE snapshots SET accessed_at = ? WHERE key = ?",
+                (now, self._key(key)),
+            )
+            self.conn.commit()
+        return snapshot
+
+    def _get_stale(self, key: Hashable) -> Optional[CalendarSnapshot]:
+        entry = self._load(key)
+        return entry[2] if entry is not None else None
+
+    def _set(self, key: Hashable, value: CalendarSnapshot, ttl_s: float) -> None:
+        skey = self._key(key)
+        version = int.from_bytes(os.urandom(7), "big")
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO snapshots "
+            "(key, version, payload, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                skey,
+                version,
+                json.dumps(asdict(value), separators=(",", ":")),
+                now + ttl_s,
+                now,
+            ),
+        )
+        evicted = self.conn.execute(
+            "DELETE FROM snapshots WHERE key IN (SELECT key FROM snapshots "
+            "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        ).rowcount
+        self.conn.commit()
+        self._remember(skey, (version, value))
+        if evicted:
+            logger.debug(f"🧹 Evicted {evicted} shared cache entr(ies)")
+
+    def _invalidate(self, key: Hashable) -> None:
+        skey = self._key(key)
+        self.conn.execute("DELETE FROM snapshots WHERE key = ?", (skey,))
+        self.conn.commit()
+        self._decoded.pop(skey, None)
+
+    def _clear(self) -> None:
+        self.conn.execute("DELETE FROM snapshots")
+        self.conn.commit()
+        self._decoded.clear()
+
+
+class NegativeCache:
+    """
+    Recently failed keys, each with a retry-after window that backs off.
+
+    Parameters
+    ----------
+    ttl_s : float
+        Window after the first failure (0 disables negative caching).
+    max_ttl_s : float
+        Upper bound of the window as consecutive failures double it.
+    max_entries : int
+        Keys remembered at most (oldest failures are forgotten first).
+    """
+
+    def __init__(self, ttl_s: float, max_ttl_s: float, max_entries: int = 256):
+        self.ttl_s = ttl_s
+        self.max_ttl_s = max(ttl_s, max_ttl_s)
+        self.max_entries = max(1, max_entries)
+        # key → (retry at (monotonic), error, consecutive failures)
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, int]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """The cached error for `key` while it is inside its window, else None."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def retry_in_s(self, key: Hashable) -> float:
+        entry = self._entries.get(key)
+        return max(0.0, entry[0] - time.monotonic()) if entry else 0.0
+
+    def record_failure(self, key: Hashable, error: str) -> float:
+        """Remember a failed scrape of `key`; returns the new window (s)."""
+        if self.ttl_s <= 0:
+            return 0.0
+
+        failures = self._entries.pop(key, (0.0, "", 0))[2] + 1
+        window = min(self.max_ttl_s, self.ttl_s * 2 ** (failures - 1))
+        self._entries[key] = (time.monotonic() + window, error, failures)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return window
+
+    def clear(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+
+def ttl_for_period(
+    time_period: TimePeriod,
+    custom_start_date: Optional[str] = None,
+    custom_end_date: Optional[str] = None,
+) -> int:
+    """
+    Pick a cache TTL (seconds) based on how likely the period is to change.
+
+    Parameters
+    ----------
+    time_period : TimePeriod
+        Requested period.
+    custom_start_date, custom_end_date : Optional[str]
+        YYYY-MM-DD bounds when `time_period` is CUSTOM.
+
+    Returns
+    -------
+    int
+        TTL in seconds.
+    """
+    settings = get_settings()
+
+    if time_period in PAST_PERIODS:
+        return settings.CACHE_TTL_PAST_S
+    if time_period in FUTURE_PERIODS:
+        return settings.CACHE_TTL_FUTURE_S
+
+    if time_period == TimePeriod.CUSTOM and custom_start_date and custom_end_date:
+        today = local_today()
+        if dt.date.fromisoformat(custom_end_date) < today:
+            return settings.CACHE_TTL_PAST_S
+        if dt.date.fromisoformat(custom_start_date) > today:
+            return settings.CACHE_TTL_FUTURE_S
+
+    return settings.CACHE_TTL_CURRENT_S
+
+
+@lru_cache
+def get_calendar_cache() -> Union[TTLCache, SqliteCache]:
+    """Cached accessor for the calendar cache of the configured backend."""
+    settings = get_settings()
+    if settings.CACHE_BACKEND.lower() == "sqlite":
+        logger.info(f"🗄 Shared calendar cache at {settings.CACHE_PATH}")
+        return SqliteCache(
+            path=settings.CACHE_PATH, max_entries=settings.CACHE_MAX_ENTRIES
+        )
+    return TTLCache(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+@lru_cache
+def get_negative_cache() -> NegativeCache:
+    """Cached accessor for the process-wide cache of failed scrapes."""
+    settings = get_settings()
+    return NegativeCache(
+        ttl_s=settings.NEGATIVE_CACHE_TTL_S,
+        max_ttl_s=settings.NEGATIVE_CACHE_MAX_TTL_S,
+    )
@@ -5,11 +5,26 @@ import logging
 from typing import Any, Dict, List
 
 from ..models.time_period import TimePeriod
+from ..utils.date_ranges import local_today, resolve_range
 
 logger = logging.getLogger(__name__)
 
 
 class DataService:
+    # Raw ForexFactory event keys read by `normalize_events`.
+    RAW_FIELDS = (
+        "id",
+        "name",
+        "country",
+        "currency",
+        "impactName",
+        "timeLabel",
+        "actual",
+        "forecast",
+        "previous",
+        "url",
+    )
+
     @staticmethod
     def normalize_events(
         days_array: List[Dict[str, Any]],
@@ -40,10 +55,8 @@ class DataService:
                     }
                 )
 
-        start, end = DataService._date_range(
-            time_period, custom_start_date, custom_end_date
-        )
-        return {"range": [start, end], "events": events}
+        start, end = resolve_range(time_period, custom_start_date, custom_end_date)
+        return {"range": [start.isoformat(), end.isoformat()], "events": events}
 
     @staticmethod
     def _normalize_date(date_str: str | None) -> str | None:
@@ -75,7 +88,7 @@ class DataService:
             # Handle case with no year → assume current year
             try:
                 parsed = dt.datetime.strptime(clean, "%a %b %d")
-                return parsed.replace(year=dt.date.today().year).date().isoformat()
+                return parsed.replace(year=local_today().year).date().isoformat()
             except ValueError:
                 pass
 
@@ -84,18 +97,76 @@ class DataService:
             return date_str
 
     @staticmethod
-    def _date_range(
-        time_period: TimePeriod, custom_start: str | None, custom_end: str | None
-    ) -> tuple[str, str]:
-        today = dt.date.today()
-
-        if time_period == TimePeriod.TODAY:
-            return today.isoformat(), today.isoformat()
-        elif time_period == TimePeriod.THIS_WEEK:
-            start = today - dt.timedelta(days=today.weekday())
-            end = start + dt.timedelta(days=6)
-            return start.isoformat(), end.isoformat()
-        elif time_period == TimePeriod.CUSTOM and custom_start and custom_end:
-            return custom_start, custom_end
-        else:
-            return today.isoformat(), today.isoformat()
+    def day_date(day: Dict[str, Any]) -> str | None:
+        """ISO date (YYYY-MM-DD) of a raw ForexFactory day block.
+
+        The `date` label carries month/day but usually no year, so the year is
+        taken from the block's `dateline` epoch when available.
+        """
+        anchor = None
+        try:
+            if day.get("dateline"):
+                anchor = dt.datetime.fromtimestamp(
+                    int(day["dateline"]), tz=dt.timezone.utc
+                ).date()
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+        try:
+            parsed = dt.date.fromisoformat(
+                DataService._normalize_date(day.get("date")) or ""
+            )
+        except ValueError:
+            parsed = None
+
+        if parsed and anchor:
+            candidates = []
+            for year in (anchor.year - 1, anchor.year, anchor.year + 1):
+                try:
+                    candidates.append(parsed.replace(year=year))
+                except ValueError:  # Feb 29 in a non-leap year
+                    continue
+            if candidates:
+                return min(candidates, key=lambda d: abs(d - anchor)).isoformat()
+        if parsed:
+            return parsed.isoformat()
+        if anchor:
+            return anchor.isoformat()
+        return None
+
+    @staticmethod
+    def merge_days(arrays: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge raw `days` arrays from several scrapes into one.
+
+        Blocks for the same date are combined, events are de-duplicated by
+        `id` (first occurrence wins) and days are returned in date order.
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        seen: Dict[str, set] = {}
+
+        for days in arrays:
+            for block in days or []:
+                key = DataService.day_date(block) or str(block.get("date"))
+                if key not in merged:
+                    merged[key] = {**block, "events": []}
+                    seen[key] = set()
+                for event in block.get("events", []):
+                    event_id = event.get("id")
+                    if event_id is not None:
+                        if event_id in seen[key]:
+                            continue
+                        seen[key].add(event_id)
+                    merged[key]["events"].append(event)
+
+        return [merged[key] for key in sorted(merged)]
+
+    @staticmethod
+    def slice_days(
+        days: List[Dict[str, Any]], start: str, end: str
+    ) -> List[Dict[str, Any]]:
+        """Day blocks of a raw `days` array dated within [start, end] (ISO)."""
+        return [
+            block
+            for block in days
+            if start <= (DataService.day_date(block) or "") <= end
+        ]
@@ -0,0 +1,192 @@
+"""
+event_store.py
+
+Persistent per-day store for scraped ForexFactory calendar data.
+
+Every successful scrape is split into its day blocks, which are saved in a
+local SQLite database keyed by ISO calendar day. Custom range queries are then
+assembled from stored days, and only missing or stale days are re-scraped.
+
+Freshness rules:
+  - A past day that was fetched after it ended is immutable (never stale).
+  - Any other day (today, future, or a past day fetched before it ended) is
+    stale once it is older than `EVENT_STORE_TTL_S`.
+
+Usage:
+    from forexfactory_mcp.services.event_store import get_event_store
+
+    store = get_event_store()
+    stored = store.get_days("2025-09-01", "2025-09-30")
+"""
+
+import datetime as dt
+import json
+import logging
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from forexfactory_mcp.services.data_service import DataService
+from forexfactory_mcp.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# (day block or None for "scraped, no events listed", fetched_at epoch seconds)
+StoredDay = Tuple[Optional[Dict[str, Any]], float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    day TEXT PRIMARY KEY,
+    payload TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class EventStore:
+    """
+    SQLite-backed store of raw ForexFactory day blocks keyed by ISO date.
+
+    Parameters
+    ----------
+    path : str
+        Location of the SQLite database file (created if missing).
+    ttl_s : int
+        Age after which today/future days are considered stale.
+    """
+
+    def __init__(self, path: str, ttl_s: int):
+        self.path = os.path.expanduser(path)
+        self.ttl_s = ttl_s
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_days(self, start: str, end: str) -> Dict[str, StoredDay]:
+        """
+        Load stored days between `start` and `end` (inclusive, YYYY-MM-DD).
+
+        Returns
+        -------
+        Dict[str, StoredDay]
+            ISO day → (day block or None, fetched_at).
+        """
+        rows = self.conn.execute(
+            "SELECT day, payload, fetched_at FROM days WHERE day BETWEEN ? AND ?",
+            (start, end),
+        ).fetchall()
+        return {
+            day: (json.loads(payload) if payload else None, fetched_at)
+            for day, payload, fetched_at in rows
+        }
+
+    def put_days(
+        self,
+        days: Dict[str, Optional[Dict[str, Any]]],
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """
+        Insert or replace day blocks.
+
+        Parameters
+        ----------
+        days : Dict[str, Optional[Dict[str, Any]]]
+            ISO day → raw day block. `None` records a day that was scraped but
+            not listed by ForexFactory, so it isn't fetched again needlessly.
+        fetched_at : Optional[float]
+            Epoch seconds of the scrape (defaults to now).
+        """
+        if not days:
+            return
+
+        fetched_at = fetched_at or time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO days (day, payload, fetched_at) VALUES (?, ?, ?)",
+            [
+                (day, json.dumps(block) if block is not None else None, fetched_at)
+                for day, block in days.items()
+            ],
+        )
+        self.conn.commit()
+
+    def put_blocks(
+        self, days_array: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None
+    ) -> None:
+        """Store every day block of a scraped `days` array under its ISO date."""
+        by_day = {}
+        for block in days_array:
+            day = DataService.day_date(block)
+            if day:
+                by_day[day] = block
+        self.put_days(by_day, fetched_at)
+
+    def is_fresh(self, day: str, fetched_at: float) -> bool:
+        """True if a stored day doesn't need to be re-scraped."""
+        local_tz = get_settings().local_tz
+        fetched_on = dt.datetime.fromtimestamp(fetched_at, local_tz).date()
+        if dt.date.fromisoformat(day) < fetched_on:
+            return True
+        return time.time() - fetched_at < self.ttl_s
+
+    def missing_days(self, days: List[str], stored: Dict[str, StoredDay]) -> List[str]:
+        """Return the days (in order) that are missing or stale in `stored`."""
+        return [
+            day
+            for day in days
+            if day not in stored or not self.is_fresh(day, stored[day][1])
+        ]
+
+
+def iter_days(start: str, end: str) -> List[str]:
+    """List every ISO day between `start` and `end`, inclusive."""
+    first = dt.date.fromisoformat(start)
+    last = dt.date.fromisoformat(end)
+    return [
+        (first + dt.timedelta(days=i)).isoformat()
+        for i in range((last - first).days + 1)
+    ]
+
+
+def contiguous_runs(days: List[str]) -> List[Tuple[str, str]]:
+    """Collapse a sorted list of ISO days into (start, end) runs of consecutive days."""
+    one_day = dt.timedelta(days=1)
+    runs: List[Tuple[str, str]] = []
+    for day in days:
+        if runs:
+            run_start, run_end = runs[-1]
+            gap = dt.date.fromisoformat(day) - dt.date.fromisoformat(run_end)
+            if gap == one_day:
+                runs[-1] = (run_start, day)
+                continue
+        runs.append((day, day))
+    return runs
+
+
+def split_range(start: str, end: str, max_days: int) -> List[Tuple[str, str]]:
+    """Split an inclusive ISO day range into consecutive shards of at most `max_days`."""
+    days = iter_days(start, end)
+    step = max(1, max_days)
+    return [
+        (days[i], days[min(i + step, len(days)) - 1]) for i in range(0, len(days), step)
+    ]
+
+
+@lru_cache
+def get_event_store() -> EventStore:
+    """Cached accessor for the process-wide per-day event store."""
+    settings = get_settings()
+    return EventStore(path=settings.EVENT_STORE_PATH, ttl_s=settings.EVENT_STORE_TTL_S)
@@ -1,25 +1,112 @@
+import asyncio
 import logging
+import time
+from dataclasses import replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from playwright.async_api import async_playwright
+from typing import Any, Dict, List, Optional, Tuple
 
 from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services.adaptive_timeout import (
+    LATENCY_METRIC,
+    get_adaptive_timeouts,
+    latency_series,
+    scrape_bucket,
+)
+from forexfactory_mcp.services.browser_pool import get_browser_pool
+from forexfactory_mcp.services.cache_service import (
+    CalendarSnapshot,
+    get_calendar_cache,
+    get_negative_cache,
+    ttl_for_period,
+)
+from forexfactory_mcp.services.data_service import DataService
+from forexfactory_mcp.services.event_store import (
+    contiguous_runs,
+    get_event_store,
+    iter_days,
+    split_range,
+)
+from forexfactory_mcp.services.hedging import get_hedge_policy, is_hedge_cancel
+from forexfactory_mcp.services.http_scraper import (
+    FastPathError,
+    get_http_fetcher,
+    is_challenge,
+)
+from forexfactory_mcp.services.leader_lease import get_leases
+from forexfactory_mcp.services.resilience import (
+    CircuitOpenError,
+    ScrapeError,
+    SessionRejectedError,
+    get_circuit_breaker,
+    get_retry_policy,
+)
+from forexfactory_mcp.services.scrape_recorder import get_scrape_recorder
+from forexfactory_mcp.services.scrape_scheduler import (
+    ScrapePriority,
+    get_scrape_scheduler,
+)
+from forexfactory_mcp.services.scrape_workers import get_scrape_workers
+from forexfactory_mcp.services.single_flight import SingleFlight
 from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.date_ranges import covering_periods, resolve_range
+from forexfactory_mcp.utils.event_utils import raw_fields_for
+from forexfactory_mcp.utils.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
+# Raw event keys every scrape keeps, whatever the requested fields: resources
+# (DataService) read them, and the release scheduler needs id/dateline/
+# impactName/actual to track releases.
+_BASE_RAW_FIELDS = frozenset(DataService.RAW_FIELDS) | {
+    "id",
+    "dateline",
+    "impactName",
+    "actual",
+}
+
+# Runs in the page: pull the days array out of `calendarComponentStates` and,
+# when a field list is given, project each event down to those keys so only
+# the data we use crosses the Playwright boundary. Returns null when the page
+# has no calendar state at all, so failures aren't mistaken for "no events".
+_EXTRACT_DAYS_JS = """(fields) => {
+    const states = window.calendarComponentStates;
+    if (typeof states === 'undefined') { return null }
+    const candidates = [states[1]?.days, states[0]?.days];
+    const days = candidates.find(d => Array.isArray(d) && d.length)
+        ?? candidates.find(d => Array.isArray(d));
+    if (!days) { return null }
+    if (!fields) { return days }
+    return days.map(day => ({
+        date: day.date,
+        dateline: day.dateline,
+        events: (day.events || []).map(ev => {
+            const out = {};
+            for (const f of fields) {
+                if (ev[f] !== undefined) { out[f] = ev[f] }
+            }
+            return out;
+        }),
+    }));
+}"""
+
+# Process-wide coalescing: concurrent loads of the same request URL share one
+# cache fill, and concurrent scrapes of the same page share one page load.
+# These are separate flights because a load may scrape its own URL.
+_load_flight = SingleFlight()
+_scrape_flight = SingleFlight()
+
 
 class FFScraperService:
     """
-    Service for scraping the ForexFactory calendar using Playwright.
+    Service for scraping the ForexFactory calendar.
 
     This class is initialized with either:
       - A predefined TimePeriod (e.g. TODAY, NEXT_WEEK, THIS_MONTH), or
       - TimePeriod.CUSTOM with explicit start and end dates.
 
     Based on these parameters, the service builds the correct ForexFactory URL
-    and fetches events from the calendar page by executing JavaScript in the DOM.
+    and fetches events from the calendar page: over plain HTTP when the fast path
+    works (`SCRAPER_BACKEND`), otherwise by executing JavaScript in the DOM.
 
     Attributes
     ----------
@@ -33,6 +120,15 @@ class FFScraperService:
         End date string (YYYY-MM-DD) if using TimePeriod.CUSTOM.
     url : str
         Fully resolved ForexFactory calendar URL for the requested range.
+    projection : Optional[Tuple[str, ...]]
+        Raw event keys extracted in the browser (None → every key).
+    date_range : Tuple[date, date]
+        Inclusive dates the period resolves to (see `utils.date_ranges`).
+    cache_key : Tuple[str, str, Optional[Tuple[str, ...]]]
+        Identity of the scraped data (ISO start/end dates + projection) for
+        caching.
+    priority : ScrapePriority
+        Admission priority of this service's scrapes in the scrape scheduler.
     """
 
     def __init__(
@@ -40,6 +136,8 @@ class FFScraperService:
         time_period: TimePeriod,
         custom_start_date: Optional[str] = None,
         custom_end_date: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        priority: ScrapePriority = ScrapePriority.INTERACTIVE,
     ):
         """
         Initialize the scraper service.
@@ -52,12 +150,39 @@ class FFScraperService:
             Start date (YYYY-MM-DD) if using CUSTOM.
         custom_end_date : Optional[str], default=None
             End date (YYYY-MM-DD) if using CUSTOM.
+        fields : Optional[List[str]], default=None
+            Per-request output fields; extends the raw keys extracted in the
+            browser beyond what INCLUDE_FIELDS / default_fields need.
+        priority : ScrapePriority, default=ScrapePriority.INTERACTIVE
+            Scheduler priority; background callers pass REFRESH or BACKFILL.
         """
         self.settings = get_settings()
         self.time_period = time_period
         self.custom_start_date = custom_start_date
         self.custom_end_date = custom_end_date
         self.url = self._build_url()
+        self.projection = self._build_projection(fields)
+        self.date_range = resolve_range(time_period, custom_start_date, custom_end_date)
+        start, end = self.date_range
+        self.cache_key = (start.isoformat(), end.isoformat(), self.projection)
+        self.priority = priority
+
+    @staticmethod
+    def _build_projection(
+        fields: Optional[List[str]] = None,
+    ) -> Optional[Tuple[str, ...]]:
+        """
+        Raw event keys to extract in the browser.
+
+        Always the keys INCLUDE_FIELDS (or default_fields) and the resources
+        need, plus whatever a per-request `fields` list adds. None means no
+        projection (a wildcard `*` was requested).
+        """
+        default_raw = raw_fields_for()
+        extra_raw = raw_fields_for(fields) if fields is not None else set()
+        if default_raw is None or extra_raw is None:
+            return None
+        return tuple(sorted(_BASE_RAW_FIELDS | default_raw | extra_raw))
 
     def _format_date(self, date_str: str) -> str:
         """
@@ -95,104 +220,611 @@ class FFScraperService:
             and self.custom_start_date
             and self.custom_end_date
         ):
-            start_date = self._format_date(self.custom_start_date)
-            end_date = self._format_date(self.custom_end_date)
-            href = f"{TimePeriod.to_href(self.time_period)}{start_date}-{end_date}"
-        else:
-            href = TimePeriod.to_href(self.time_period)
+            return self._build_range_url(self.custom_start_date, self.custom_end_date)
 
-        return f"{base_url}{href}"
+        return f"{base_url}{TimePeriod.to_href(self.time_period)}"
+
+    def _build_range_url(self, start: str, end: str) -> str:
+        """
+        Construct a `/calendar?range=start-end` URL for explicit YYYY-MM-DD bounds.
+        """
+        start_date = self._format_date(start)
+        end_date = self._format_date(end)
+        href = f"{TimePeriod.to_href(TimePeriod.CUSTOM)}{start_date}-{end_date}"
+        return f"{self.settings.BASE_URL}{href}"
+
+    @property
+    def _stores_days(self) -> bool:
+        # Stored days carry the default projection, so requests that need
+        # extra raw keys bypass the store.
+        return (
+            self.settings.EVENT_STORE_ENABLED
+            and self.projection == self._build_projection()
+        )
+
+    @property
+    def _is_custom_range(self) -> bool:
+        return bool(
+            self.time_period == TimePeriod.CUSTOM
+            and self.custom_start_date
+            and self.custom_end_date
+        )
+
+    @property
+    def _uses_event_store(self) -> bool:
+        return self._stores_days and self._is_custom_range
 
     async def get_events(self) -> List[Dict[str, Any]]:
         """
         Public entry point to fetch events.
 
+        Served from the calendar cache when a fresh entry exists. Otherwise,
+        concurrent calls that resolve to the same URL are coalesced into a
+        single scrape; every caller receives the same (read-only) list.
+
         Returns
         -------
         List[Dict[str, Any]]
             A list of normalized ForexFactory events grouped by days.
+
+        Raises
+        ------
+        ScrapeError
+            If the scrape failed and no previous snapshot can be served.
+        """
+        return (await self.get_snapshot()).days
+
+    async def get_snapshot(self) -> CalendarSnapshot:
+        """
+        Like `get_events()`, but returns the whole `CalendarSnapshot`.
+
+        When the scrape fails (or the circuit breaker is open), the last good
+        snapshot is served instead, with `status="stale"` and the failure in
+        `error`. A failed key isn't scraped again until its negative-cache
+        window has passed; until then the failure is served from the cache.
+
+        Raises
+        ------
+        ScrapeError
+            If the scrape failed and no previous snapshot can be served.
+        """
+        cache = get_calendar_cache()
+        snapshot = await cache.get(self.cache_key) or await self._slice_cached()
+        if snapshot is not None:
+            logger.info(f"⚡ Cache hit for {self.url} (age {snapshot.age_s:.0f}s)")
+            return snapshot
+
+        error = self._cached_failure()
+        if error is None:
+            try:
+                return await _load_flight.do(self.cache_key, self._load_and_cache)
+            except ScrapeError as e:
+                error = e
+
+        stale = await cache.get_stale(self.cache_key)
+        if stale is None:
+            raise error
+        logger.warning(
+            f"⚠️ Serving last good snapshot of {self.url} "
+            f"(age {stale.age_s:.0f}s): {error}"
+        )
+        get_metrics().incr("scrape.stale_served")
+        return replace(stale, status="stale", error=str(error))
+
+    def _cached_failure(self) -> Optional[ScrapeError]:
+        """The failure of a recent scrape of this key, while it's negative-cached."""
+        negative = get_negative_cache()
+        error = negative.get(self.cache_key)
+        if error is None:
+            return None
+        retry_in_s = negative.retry_in_s(self.cache_key)
+        logger.info(f"🚫 Not re-scraping {self.url} for {retry_in_s:.0f}s: {error}")
+        get_metrics().incr("scrape.negative_hits")
+        return ScrapeError(f"{error} (retrying in {retry_in_s:.0f}s)")
+
+    async def _slice_cached(self) -> Optional[CalendarSnapshot]:
+        """
+        Cut this period out of a fresh cached snapshot of a wider period that
+        contains it (today out of this week, a week out of this month, ...),
+        so it needs no scrape of its own.
+        """
+        cache = get_calendar_cache()
+        start, end = self.cache_key[:2]
+        for period, (wide_start, wide_end) in covering_periods(self.date_range):
+            wide = await cache.get(
+                (wide_start.isoformat(), wide_end.isoformat(), self.projection)
+            )
+            if wide is None:
+                continue
+            logger.info(f"✂️ Slicing {start}..{end} from cached {period.value}")
+            get_metrics().incr("cache.slice_hits")
+            return replace(wide, days=DataService.slice_days(wide.days, start, end))
+        return None
+
+    async def refresh(self) -> List[Dict[str, Any]]:
+        """
+        Re-scrape without reading the calendar cache or the per-day event
+        store, then repopulate both.
+
+        Used by background refreshers; concurrent calls for the same URL are
+        still coalesced with each other and with `get_events()` misses.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            A list of normalized ForexFactory events grouped by days.
+
+        Raises
+        ------
+        ScrapeError
+            If the scrape failed, now or within the key's negative-cache
+            window.
+        """
+        error = self._cached_failure()
+        if error is not None:
+            raise error
+        snapshot = await _load_flight.do(
+            self.cache_key, lambda: self._load_and_cache(use_store=False)
+        )
+        return snapshot.days
+
+    async def _load_and_cache(self, use_store: bool = True) -> CalendarSnapshot:
+        """
+        Load `self.url` and cache the result. With leader election, the load
+        holds this key's scrape lease: while another replica holds it, its
+        result is taken from the shared cache instead of scraping again.
+        """
+        leases = get_leases()
+        if leases is None:
+            return await self._scrape_and_cache(use_store)
+
+        since = time.time()
+        return await leases.exclusive(
+            f"scrape:{self.cache_key}",
+            lambda: self._scrape_and_cache(use_store),
+            lambda: self._peer_snapshot(since),
+        )
+
+    async def _peer_snapshot(self, since: float) -> Optional[CalendarSnapshot]:
+        """Snapshot of this key another replica cached after `since`, if any."""
+        snapshot = await get_calendar_cache().get_stale(self.cache_key)
+        if snapshot is not None and snapshot.fetched_at >= since:
+            return snapshot
+        return None
+
+    async def _scrape_and_cache(self, use_store: bool = True) -> CalendarSnapshot:
+        """
+        Load `self.url` and cache the result with a period-aware TTL; a
+        failure is negative-cached (circuit-open errors excepted, the breaker
+        already paces those).
+        """
+        negative = get_negative_cache()
+        error = None
+        try:
+            if use_store and self._uses_event_store:
+                days_array, error = await self._get_range_from_store()
+            elif self._is_custom_range:
+                days_array = await self._scrape_range(
+                    self.custom_start_date, self.custom_end_date
+                )
+            else:
+                days_array = await self._scrape(self.url)
+        except CircuitOpenError:
+            raise
+        except ScrapeError as e:
+            window_s = negative.record_failure(self.cache_key, str(e))
+            logger.warning(
+                f"🚫 Scrape of {self.url} failed; backing off {window_s:.0f}s"
+            )
+            raise
+        negative.clear(self.cache_key)
+
+        # A range partly assembled from stale stored days isn't cached, so the
+        # next query retries the failed shards.
+        if error is not None:
+            return CalendarSnapshot(days_array, status="stale", error=error)
+
+        snapshot = CalendarSnapshot(days_array)
+        ttl_s = ttl_for_period(
+            self.time_period, self.custom_start_date, self.custom_end_date
+        )
+        await get_calendar_cache().set(self.cache_key, snapshot, ttl_s)
+        return snapshot
+
+    async def _scrape(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` (coalesced with identical in-flight scrapes, admitted by
+        the global scrape scheduler) and record the resulting day blocks in
+        the per-day event store.
+        """
+        days_array = await _scrape_flight.do(
+            (url, self.projection), lambda: self._scrape_with_retry(url)
+        )
+
+        if days_array and self._stores_days:
+            try:
+                get_event_store().put_blocks(days_array)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not update event store: {e}")
+
+        return days_array
+
+    async def _scrape_with_retry(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` through the scrape scheduler (hedged when enabled),
+        retrying failures with jittered exponential backoff while the circuit
+        breaker allows it.
+
+        Raises
+        ------
+        ScrapeError
+            When every attempt failed, or `CircuitOpenError` if the circuit
+            breaker is open.
+        """
+        retry = get_retry_policy()
+        breaker = get_circuit_breaker()
+        metrics = get_metrics()
+
+        series = latency_series(scrape_bucket(url))
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"circuit open, ForexFactory scrapes paused for "
+                    f"{breaker.retry_in_s:.0f}s"
+                )
+            # Nothing awaits since allow(), so half-open means we hold the probe.
+            probing = breaker.state == breaker.HALF_OPEN
+
+            try:
+                days_array = await get_scrape_scheduler().run(
+                    lambda: get_hedge_policy().run(
+                        lambda: self._get_calendar(url), series
+                    ),
+                    self.priority,
+                )
+            except ScrapeError as e:
+                breaker.record_failure()
+                metrics.incr("scrape.failures")
+                attempt += 1
+                if attempt >= retry.attempts:
+                    raise
+
+                delay = retry.delay(attempt - 1)
+                logger.warning(
+                    f"🔁 Scrape of {url} failed ({e}); "
+                    f"retry {attempt}/{retry.attempts - 1} in {delay:.1f}s"
+                )
+                metrics.incr("scrape.retries")
+                await asyncio.sleep(delay)
+                continue
+            except asyncio.CancelledError:
+                if probing:
+                    breaker.release_probe()
+                raise
+            except Exception:
+                # Unexpected errors still count, or a failed probe would
+                # leave the circuit half-open forever.
+                breaker.record_failure()
+                metrics.incr("scrape.failures")
+                raise
+
+            breaker.record_success()
+            return days_array
+
+    async def _scrape_shards(
+        self, shards: List[Tuple[str, str]], return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Scrape each (start, end) shard as its own range page, running up to
+        `SCRAPER_SHARD_CONCURRENCY` shards at once.
+
+        Returns one days array per shard, in shard order. With
+        `return_exceptions`, a failed shard yields its exception instead of
+        failing the whole call.
+        """
+        if len(shards) > 1:
+            logger.info(
+                f"🧩 Scraping {shards[0][0]}..{shards[-1][1]} "
+                f"as {len(shards)} shards"
+            )
+        semaphore = asyncio.Semaphore(max(1, self.settings.SCRAPER_SHARD_CONCURRENCY))
+
+        async def scrape_shard(shard: Tuple[str, str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._scrape(self._build_range_url(*shard))
+
+        return list(
+            await asyncio.gather(
+                *(scrape_shard(s) for s in shards),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def _scrape_range(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """
+        Scrape an explicit YYYY-MM-DD range, sharded into pages of at most
+        `SCRAPER_SHARD_DAYS` days, and merge the shards (events de-duplicated
+        by id).
         """
-        return await self._get_calendar(self.url)
+        shards = split_range(start, end, self.settings.SCRAPER_SHARD_DAYS)
+        results = await self._scrape_shards(shards)
+        if len(results) == 1:
+            return results[0]
+        return DataService.merge_days(results)
+
+    async def _get_range_from_store(
+        self,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Assemble a custom range from the per-day event store.
+
+        Only days that are missing or stale are scraped, grouped into
+        contiguous runs (sharded like `_scrape_range`) so each gap costs as
+        few page loads as possible. If a shard can't be scraped, whatever
+        (stale) data is stored for its days is used instead and the failure
+        is returned alongside the days.
+
+        Raises
+        ------
+        ScrapeError
+            If a shard failed and some of its days were never stored.
+        """
+        store = get_event_store()
+        days = iter_days(self.custom_start_date, self.custom_end_date)
+        if not days:
+            return [], None
+
+        stored = store.get_days(days[0], days[-1])
+        missing = store.missing_days(days, stored)
+
+        if missing:
+            logger.info(
+                f"🗄 Event store has {len(days) - len(missing)}/{len(days)} days "
+                f"for {days[0]}..{days[-1]}; scraping the rest"
+            )
+        else:
+            logger.info(f"🗄 Event store hit for {days[0]}..{days[-1]}")
+
+        shards = [
+            shard
+            for run in contiguous_runs(missing)
+            for shard in split_range(*run, self.settings.SCRAPER_SHARD_DAYS)
+        ]
+        results = (
+            await self._scrape_shards(shards, return_exceptions=True) if shards else []
+        )
+
+        error = None
+        for (shard_start, shard_end), days_array in zip(shards, results):
+            if isinstance(days_array, BaseException):
+                if not isinstance(days_array, ScrapeError):
+                    raise days_array
+                shard_days = iter_days(shard_start, shard_end)
+                if any(day not in stored for day in shard_days):
+                    raise ScrapeError(
+                        f"could not scrape {shard_start}..{shard_end}: {days_array}"
+                    ) from days_array
+                logger.warning(
+                    f"⚠️ Using stale stored days for {shard_start}..{shard_end}: "
+                    f"{days_array}"
+                )
+                error = str(days_array)
+                continue
+
+            # `_scrape` already stored the listed days. Days in the shard that
+            # ForexFactory didn't list are remembered as empty so they aren't
+            # scraped again on the next query.
+            fetched_at = time.time()
+            scraped = {DataService.day_date(block): block for block in days_array}
+            run_days = {
+                day: scraped.get(day) for day in iter_days(shard_start, shard_end)
+            }
+            store.put_days(
+                {day: None for day, block in run_days.items() if block is None},
+                fetched_at,
+            )
+            stored.update({day: (block, fetched_at) for day, block in run_days.items()})
+
+        return [stored[day][0] for day in days if stored.get(day, (None,))[0]], error
 
     async def _get_calendar(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` with the adaptive timeout of its size bucket and record
+        how long it took.
+        """
+        timeouts = get_adaptive_timeouts()
+        bucket = scrape_bucket(url)
+        timeout_ms = timeouts.timeout_ms(bucket)
+
+        started = time.monotonic()
+        try:
+            days_array = await self._get_calendar_backend(url, timeout_ms)
+        except ScrapeError:
+            timeouts.record_failure(bucket)
+            raise
+        except asyncio.CancelledError as e:
+            if is_hedge_cancel(e):
+                # A lost hedge took at least this long; dropping it would bias
+                # the hedge quantile low.
+                elapsed_ms = (time.monotonic() - started) * 1000
+                metrics = get_metrics()
+                metrics.observe(latency_series(bucket), elapsed_ms)
+                metrics.observe(LATENCY_METRIC, elapsed_ms)
+            raise
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        timeouts.observe(bucket, elapsed_ms)
+        get_metrics().observe(LATENCY_METRIC, elapsed_ms)
+        return days_array
+
+    async def _get_calendar_backend(
+        self, url: str, timeout_ms: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` in a scrape worker process when `SCRAPER_WORKERS` is
+        set, otherwise on this event loop.
+        """
+        workers = get_scrape_workers()
+        if workers is not None:
+            return await workers.scrape(url, self.projection, timeout_ms)
+        return await self.scrape_page(url, self.projection, timeout_ms)
+
+    @staticmethod
+    async def scrape_page(
+        url: str, projection: Optional[Tuple[str, ...]], timeout_ms: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` on this event loop, recording or replaying it when
+        `SCRAPER_MODE` asks for it.
+        """
+        recorder = get_scrape_recorder()
+        if recorder is None:
+            return await FFScraperService._scrape_page_backend(
+                url, projection, timeout_ms
+            )
+        return await recorder.scrape(
+            url,
+            projection,
+            lambda p: FFScraperService._scrape_page_backend(url, p, timeout_ms),
+        )
+
+    @staticmethod
+    async def _scrape_page_backend(
+        url: str, projection: Optional[Tuple[str, ...]], timeout_ms: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` with the configured `SCRAPER_BACKEND`.
+
+        - "http": parse the page HTML fetched over httpx only.
+        - "browser": always use Playwright.
+        - "auto": try the HTTP fast path and fall back to Playwright when it
+          fails, gets challenged or finds no days (a page the browser might
+          still render calendar data for).
+
+        Parameters
+        ----------
+        url : str
+            The ForexFactory calendar URL to scrape.
+        projection : Optional[Tuple[str, ...]]
+            Raw event keys to keep (None → every key).
+        timeout_ms : int
+            Timeout for the page load.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Raw event data as extracted from the calendar state.
+
+        Raises
+        ------
+        ScrapeError
+            If no backend could extract the calendar state.
+        """
+        backend = get_settings().SCRAPER_BACKEND.lower()
+        if backend == "browser":
+            return await FFScraperService._get_calendar_browser(
+                url, projection, timeout_ms
+            )
+
+        logger.info(f"⚡ Fetching ForexFactory over HTTP: {url}")
+        try:
+            days_array = await get_http_fetcher().fetch_days(
+                url, projection, timeout_s=timeout_ms / 1000
+            )
+        except FastPathError as e:
+            if backend == "http":
+                raise ScrapeError(f"HTTP scrape failed: {e}") from e
+            logger.warning(f"⚠️ HTTP fast path failed for {url}: {e}")
+        else:
+            if days_array or backend == "http":
+                return days_array
+            logger.warning(f"⚠️ HTTP fast path found no days for {url}")
+
+        logger.info("↩️ Falling back to the browser scraper")
+        return await FFScraperService._get_calendar_browser(url, projection, timeout_ms)
+
+    @staticmethod
+    async def _get_calendar_browser(
+        url: str, projection: Optional[Tuple[str, ...]], timeout_ms: int
+    ) -> List[Dict[str, Any]]:
         """
         Perform the actual scraping using Playwright.
 
         Steps:
-        - Launch headless Chromium.
+        - Borrow a warm page from the shared browser pool.
         - Navigate to the ForexFactory calendar URL.
-        - Evaluate `window.calendarComponentStates` in the DOM.
+        - Evaluate `window.calendarComponentStates` in the DOM, projecting
+          events down to `projection` in the browser.
         - Return the extracted array of days/events.
 
+        Once a page is borrowed, the scrape runs under a hard wall-clock
+        deadline of `timeout_ms * SCRAPER_DEADLINE_FACTOR`; a scrape that
+        overruns it is cancelled and its browser is recycled. Waiting for a
+        free slot (or a browser relaunch) doesn't count against it.
+
         Parameters
         ----------
         url : str
             The ForexFactory calendar URL to scrape.
+        projection : Optional[Tuple[str, ...]]
+            Raw event keys to keep (None → every key).
+        timeout_ms : int
+            Navigation and default timeout for the page.
 
         Returns
         -------
         List[Dict[str, Any]]
             Raw event data as extracted from the client-side JS object.
+
+        Raises
+        ------
+        ScrapeError
+            If the page couldn't be loaded or has no calendar state.
         """
         logger.info(f"🌐 Scraping ForexFactory: {url}")
 
-        days_array: List[Dict[str, Any]] = []
-
-        # Playwright session objects
-        playwright = None
-        browser = None
-        context = None
-        page = None
-
-        timeout_ms = self.settings.SCRAPER_TIMEOUT_MS
         logger.info(f"⏱ Using timeout {timeout_ms}ms")
+        deadline_s = timeout_ms * get_settings().SCRAPER_DEADLINE_FACTOR / 1000
 
         try:
-            # Start Playwright engine
-            playwright = await async_playwright().start()
-            browser = await playwright.chromium.launch(
-                headless=True, args=["--no-sandbox"]
-            )
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Apply timeouts
-            page.set_default_timeout(timeout_ms)
-            page.set_default_navigation_timeout(timeout_ms)
+            async with get_browser_pool().page() as page, asyncio.timeout(deadline_s):
+                # Apply timeouts
+                page.set_default_timeout(timeout_ms)
+                page.set_default_navigation_timeout(timeout_ms)
 
-            # Apply extra headers and navigate
-            await page.set_extra_http_headers(self.settings.extra_http_headers)
-            await page.goto(url, wait_until="domcontentloaded")
+                # Navigate (extra headers are set on the pooled context)
+                response = await page.goto(url, wait_until="domcontentloaded")
 
-            try:
                 # Evaluate JS global to extract calendar state
-                data = await page.evaluate(
-                    """() => {
-                        if (typeof window.calendarComponentStates === 'undefined') { return [] }
-                        return (window.calendarComponentStates[1]?.days 
-                                    || window.calendarComponentStates[0]?.days || []);
-                    }"""
+                days_array = await page.evaluate(
+                    _EXTRACT_DAYS_JS,
+                    list(projection) if projection else None,
                 )
-                days_array = data or []
-            except Exception as e:
-                logger.error(f"⚠️ Failed to evaluate calendar state: {e}")
 
+                # No calendar on a challenge page: the session was rejected
+                status = response.status if response else 0
+                if days_array is None and is_challenge(status, await page.content()):
+                    raise SessionRejectedError(f"challenged (HTTP {status})")
+
+                # Keep the raw document for offline replays
+                recorder = get_scrape_recorder()
+                if recorder and recorder.recording and days_array is not None:
+                    if response is not None:
+                        recorder.save_page(url, await response.text())
+
+        except ScrapeError:
+            raise
+        except TimeoutError as e:
+            logger.error(f"⏰ Scrape of {url} exceeded its {deadline_s:.1f}s deadline")
+            get_metrics().incr("watchdog.deadline_exceeded")
+            raise ScrapeError(f"scrape deadline of {deadline_s:.1f}s exceeded") from e
         except Exception as e:
-            logger.exception(f"⚠️ Could not scrape ForexFactory: {e}")
-
-        finally:
-            # Always close resources in reverse order
-            for obj, close_fn in [
-                (page, page.close if page else None),
-                (context, context.close if context else None),
-                (browser, browser.close if browser else None),
-                (playwright, playwright.stop if playwright else None),
-            ]:
-                if close_fn:
-                    try:
-                        await close_fn()
-                    except Exception:
-                        pass
+            logger.error(f"⚠️ Could not scrape ForexFactory: {e}")
+            raise ScrapeError(f"browser scrape failed: {e}") from e
+
+        if days_array is None:
+            raise ScrapeError("calendarComponentStates not found in page")
 
         # logger.info(f"✅ Extracted {len(days_array)} days of events")
         return days_array
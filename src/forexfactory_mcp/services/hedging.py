@@ -0,0 +1,163 @@
+"""
+hedging.py
+
+Hedged scrapes to cut tail latency.
+
+Most scrapes finish well within a second, but the occasional page load hangs
+until `SCRAPER_TIMEOUT_MS`. With `SCRAPER_HEDGE_ENABLED`, a scrape that hasn't
+finished after the `SCRAPER_HEDGE_QUANTILE` (p90 by default) of recent scrape
+latencies (`scrape.latency_ms`, or the latency series of the scrape's size
+bucket when given) gets a second, identical attempt — on another pooled
+browser (or HTTP connection). Whichever attempt succeeds first wins and the
+other is cancelled with `HEDGE_LOST`: the loser was healthy, just slower, so
+its pooled browser is handed back as is instead of being recycled, and its
+elapsed time still counts as a (lower-bound) latency sample.
+
+Hedges only start when the scrape scheduler has a free slot and nothing is
+queued, so they never delay other scrapes. Counters:
+
+  - `scrape.hedges`          hedged attempts started
+  - `scrape.hedges_won`      hedges that beat the original attempt
+  - `scrape.hedges_skipped`  hedges not started because no slot was free
+
+Usage:
+    from forexfactory_mcp.services.hedging import get_hedge_policy
+
+    days = await get_hedge_policy().run(lambda: scrape(url))
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from forexfactory_mcp.services.adaptive_timeout import LATENCY_METRIC
+from forexfactory_mcp.services.scrape_scheduler import get_scrape_scheduler
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Cancellation message of the losing attempt of a decided hedge.
+HEDGE_LOST = "hedge lost"
+
+
+def is_hedge_cancel(error: BaseException) -> bool:
+    """True if `error` cancelled the losing attempt of a hedge."""
+    return isinstance(error, asyncio.CancelledError) and HEDGE_LOST in error.args
+
+
+def _consume_result(task: asyncio.Future) -> None:
+    # Losing attempts may fail after the race is decided; don't let asyncio
+    # log "exception was never retrieved" for them.
+    if not task.cancelled():
+        task.exception()
+
+
+class HedgePolicy:
+    """
+    Decide when to hedge a scrape and race the attempts.
+
+    Parameters
+    ----------
+    enabled : bool
+        Master switch; disabled policies just await the single attempt.
+    quantile : float
+        Latency quantile (0..1) of recent scrapes used as the hedge delay.
+    min_samples : int
+        Latency samples required before hedging kicks in.
+    min_delay_ms : float
+        Floor for the hedge delay, so a run of very fast scrapes doesn't
+        hedge everything.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        quantile: float,
+        min_samples: int,
+        min_delay_ms: float,
+    ):
+        self.enabled = enabled
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay_ms = min_delay_ms
+
+    def delay_s(self, series: str = LATENCY_METRIC) -> Optional[float]:
+        """Seconds to wait before hedging, or None if hedging is off."""
+        if not self.enabled:
+            return None
+
+        metrics = get_metrics()
+        if metrics.sample_count(series) < self.min_samples:
+            return None
+
+        threshold_ms = metrics.quantile(series, self.quantile)
+        return max(threshold_ms or 0.0, self.min_delay_ms) / 1000
+
+    async def run(
+        self, fn: Callable[[], Awaitable[T]], series: str = LATENCY_METRIC
+    ) -> T:
+        """
+        Run `fn()`, starting a second `fn()` if the first is too slow.
+
+        `series` is the latency window the hedge delay is learned from.
+        Returns the first successful result; if every attempt fails, the
+        original attempt's exception is raised.
+        """
+        delay_s = self.delay_s(series)
+        if delay_s is None:
+            return await fn()
+
+        primary = asyncio.ensure_future(fn())
+        primary.add_done_callback(_consume_result)
+        pending = {primary}
+        decided = False
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay_s)
+            if done:
+                return primary.result()
+
+            scheduler = get_scrape_scheduler()
+            metrics = get_metrics()
+            if not scheduler.try_acquire():
+                metrics.incr("scrape.hedges_skipped")
+                return await primary
+
+            logger.info(f"🪁 Hedging scrape still running after {delay_s:.2f}s")
+            metrics.incr("scrape.hedges")
+            hedge = asyncio.ensure_future(fn())
+            hedge.add_done_callback(_consume_result)
+            hedge.add_done_callback(lambda _: scheduler.release())
+            pending.add(hedge)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            metrics.incr("scrape.hedges_won")
+                        decided = True
+                        return task.result()
+
+            return primary.result()  # both failed: raise the original error
+        finally:
+            for task in pending:
+                task.cancel(HEDGE_LOST if decided else None)
+
+
+@lru_cache
+def get_hedge_policy() -> HedgePolicy:
+    """Cached accessor for the scrape hedging policy."""
+    settings = get_settings()
+    return HedgePolicy(
+        enabled=settings.SCRAPER_HEDGE_ENABLED,
+        quantile=settings.SCRAPER_HEDGE_QUANTILE,
+        min_samples=settings.SCRAPER_HEDGE_MIN_SAMPLES,
+        min_delay_ms=settings.SCRAPER_HEDGE_MIN_DELAY_MS,
+    )
@@ -0,0 +1,170 @@
+"""
+http_scraper.py
+
+Browser-free fast path for scraping the ForexFactory calendar.
+
+The calendar page embeds its data in an inline script:
+
+    window.calendarComponentStates[1] = {
+        days: [{"date": "...", "dateline": ..., "events": [...]}, ...],
+        ...
+    };
+
+`HttpCalendarFetcher` downloads the HTML over a pooled `httpx.AsyncClient`
+(using `Settings.extra_http_headers`) and decodes that `days` array directly,
+with no Chromium involved. When the page is a bot challenge or the state
+can't be found, it raises `FastPathError` so the caller can fall back to the
+Playwright scraper.
+
+Usage:
+    from forexfactory_mcp.services.http_scraper import get_http_fetcher
+
+    days = await get_http_fetcher().fetch_days(url)
+"""
+
+import json
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from forexfactory_mcp.services.scrape_recorder import get_scrape_recorder
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.event_utils import project_days
+
+logger = logging.getLogger(__name__)
+
+_STATE_RE = re.compile(r"calendarComponentStates\[(\d+)\]\s*=\s*\{")
+_DAYS_RE = re.compile(r"""["']?days["']?\s*:\s*\[""")
+
+# Statuses and markers of anti-bot interstitials served instead of the calendar.
+_CHALLENGE_STATUSES = (403, 429, 503)
+_CHALLENGE_MARKERS = ("cf-chl", "challenge-platform", "Just a moment...")
+
+
+class FastPathError(Exception):
+    """The HTTP fast path couldn't produce calendar data; use the browser."""
+
+
+def extract_days(html: str) -> List[Dict[str, Any]]:
+    """
+    Decode the `days` array of `calendarComponentStates` from page HTML.
+
+    Mirrors the in-browser extraction: a non-empty state 1 is preferred over
+    state 0. An empty array is returned only if the page really lists no days.
+
+    Raises
+    ------
+    FastPathError
+        If no calendar state with a decodable `days` array is present.
+    """
+    decoder = json.JSONDecoder()
+    states: Dict[int, List[Dict[str, Any]]] = {}
+
+    matches = list(_STATE_RE.finditer(html))
+    for i, match in enumerate(matches):
+        # Only look for `days` inside this state's own assignment.
+        stop = matches[i + 1].start() if i + 1 < len(matches) else len(html)
+        days_match = _DAYS_RE.search(html, match.end(), stop)
+        if days_match is None:
+            continue
+        try:
+            days, _ = decoder.raw_decode(html, days_match.end() - 1)
+        except ValueError:
+            continue
+        if isinstance(days, list):
+            states.setdefault(int(match.group(1)), days)
+
+    for index in (1, 0):
+        if states.get(index):
+            return states[index]
+    for index in (1, 0):
+        if index in states:
+            return states[index]
+    raise FastPathError("calendarComponentStates not found in page")
+
+
+def is_challenge(status: int, html: str) -> bool:
+    """True if a response looks like a bot challenge / rate-limit page."""
+    return status in _CHALLENGE_STATUSES or any(
+        marker in html for marker in _CHALLENGE_MARKERS
+    )
+
+
+class HttpCalendarFetcher:
+    """Fetch calendar pages over a pooled keep-alive `httpx.AsyncClient`."""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            settings = get_settings()
+            recorder = get_scrape_recorder()
+            self._client = httpx.AsyncClient(
+                # Replays are answered from the recordings, offline.
+                transport=(
+                    recorder.transport()
+                    if recorder is not None and recorder.replaying
+                    else None
+                ),
+                headers=settings.extra_http_headers,
+                follow_redirects=True,
+                timeout=settings.SCRAPER_TIMEOUT_MS / 1000,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_days(
+        self,
+        url: str,
+        projection: Optional[Sequence[str]] = None,
+        timeout_s: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Download `url` and extract its (optionally projected) days array.
+
+        `timeout_s` overrides the client's default timeout for this request.
+
+        Raises
+        ------
+        FastPathError
+            On HTTP errors, bot challenges, or pages without calendar state.
+        """
+        try:
+            if timeout_s is None:
+                response = await self.client.get(url)
+            else:
+                response = await self.client.get(url, timeout=timeout_s)
+        except httpx.HTTPError as e:
+            raise FastPathError(f"request failed: {e!r}") from e
+
+        html = response.text
+        if is_challenge(response.status_code, html):
+            raise FastPathError(f"challenged (HTTP {response.status_code})")
+        if response.is_error:
+            raise FastPathError(f"HTTP {response.status_code}")
+
+        days = project_days(extract_days(html), projection)
+        recorder = get_scrape_recorder()
+        if recorder is not None and recorder.recording:
+            recorder.save_page(url, html)
+        return days
+
+
+@lru_cache
+def get_http_fetcher() -> HttpCalendarFetcher:
+    """Cached accessor for the process-wide HTTP calendar fetcher."""
+    return HttpCalendarFetcher(max_connections=get_settings().HTTP_MAX_CONNECTIONS)
@@ -0,0 +1,235 @@
+"""
+leader_lease.py
+
+SQLite row leases for running several server replicas against one shared
+calendar cache (`CACHE_BACKEND=sqlite`).
+
+With `LEADER_ELECTION_ENABLED`, replicas coordinate through a `leases` table
+in the shared cache file (`CACHE_PATH`):
+
+  - `refresh:<period>` — the replica holding it is the period's leader: it
+    runs the background refresh and release watches for that period.
+    Followers only adopt the snapshots the leader stores in the shared cache.
+  - `scrape:<cache key>` — held for the duration of one scrape, so at most
+    one replica scrapes a key at a time; the others wait for its result to
+    appear in the shared cache instead of scraping it themselves.
+
+A lease lasts `LEADER_LEASE_TTL_S` and is renewed in the background while
+held. If its holder dies, the lease expires and another replica takes it over
+on its next attempt, so a dead leader is replaced within the lease TTL plus
+one refresh tick. Leases are released on shutdown for an immediate handover.
+SQLite calls run on a background thread, so a write lock held by another
+replica never blocks the event loop.
+
+Usage:
+    from forexfactory_mcp.services.leader_lease import get_leases
+
+    leases = get_leases()  # None unless leader election is enabled
+    if leases is None or await leases.acquire("refresh:this_week"):
+        ...
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional, Set, TypeVar
+
+from forexfactory_mcp.services.resilience import ScrapeError
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class LeaseStore:
+    """
+    Named, expiring leases shared by every process using the same file.
+
+    Parameters
+    ----------
+    path : str
+        Location of the SQLite database file (created if missing).
+    ttl_s : float
+        Lifetime of a lease that isn't renewed.
+    poll_s : float
+        How often a replica waiting on another one's scrape checks for it.
+    """
+
+    def __init__(self, path: str, ttl_s: float, poll_s: float = 0.25):
+        self.path = os.path.expanduser(path)
+        self.ttl_s = max(1.0, ttl_s)
+        self.poll_s = poll_s
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{os.urandom(3).hex()}"
+        self._held: Set[str] = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="leases")
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=5.0, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a SQLite operation on the store's thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def acquire(self, name: str) -> bool:
+        """
+        Take or renew lease `name`; True if this process holds it afterwards.
+
+        Succeeds when the lease is free, expired, or already ours.
+        """
+        acquired = await self._call(self._acquire, name)
+
+        if acquired and name not in self._held:
+            logger.info(f"👑 Acquired lease {name}")
+            get_metrics().incr("leases.acquired")
+            self._held.add(name)
+        elif not acquired and name in self._held:
+            self._held.discard(name)
+            logger.warning(f"⚠️ Lost lease {name} to {await self.holder_of(name)}")
+        get_metrics().set_gauge("leases.held", len(self._held))
+        return acquired
+
+    async def release(self, name: str) -> None:
+        await self._call(self._release, name)
+        self._held.discard(name)
+        get_metrics().set_gauge("leases.held", len(self._held))
+
+    async def holder_of(self, name: str) -> Optional[str]:
+        """Current (unexpired) holder of lease `name`, if any."""
+        return await self._call(self._holder_of, name)
+
+    def _acquire(self, name: str) -> bool:
+        now = time.time()
+        acquired = (
+            self.conn.execute(
+                "INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "holder = excluded.holder, expires_at = excluded.expires_at "
+                "WHERE leases.holder = excluded.holder OR leases.expires_at <= ?",
+                (name, self.holder, now + self.ttl_s, now),
+            ).rowcount
+            == 1
+        )
+        self.conn.commit()
+        return acquired
+
+    def _release(self, name: str) -> None:
+        self.conn.execute(
+            "DELETE FROM leases WHERE name = ? AND holder = ?", (name, self.holder)
+        )
+        self.conn.commit()
+
+    def _holder_of(self, name: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT holder FROM leases WHERE name = ? AND expires_at > ?",
+            (name, time.time()),
+        ).fetchone()
+        return row[0] if row else None
+
+    async def exclusive(
+        self,
+        name: str,
+        load: Callable[[], Awaitable[T]],
+        peer_result: Callable[[], Awaitable[Optional[T]]],
+    ) -> T:
+        """
+        Run `load()` while holding lease `name`, or wait for the replica that
+        holds it to publish its result (`peer_result()` returns it once there).
+
+        A dead holder's lease expires within `ttl_s`, so waiting up to twice
+        that long always ends with a result or with this process taking over.
+
+        Raises
+        ------
+        ScrapeError
+            If another replica held the lease throughout without publishing.
+        """
+        deadline = time.monotonic() + 2 * self.ttl_s
+        waiting = False
+        while True:
+            acquired = await self.acquire(name)
+            try:
+                # A peer may also have finished just before we got the lease.
+                result = await peer_result()
+                if result is not None:
+                    get_metrics().incr("leases.peer_results")
+                    return result
+                if acquired:
+                    return await load()
+            finally:
+                if acquired:
+                    await self.release(name)
+
+            if not waiting:
+                holder = await self.holder_of(name)
+                logger.info(f"⏳ Waiting for {holder} to finish {name}")
+                get_metrics().incr("leases.peer_waits")
+                waiting = True
+            if time.monotonic() >= deadline:
+                raise ScrapeError(f"timed out waiting for another replica ({name})")
+            await asyncio.sleep(self.poll_s)
+
+    async def start(self) -> None:
+        """Start renewing held leases in the background (no-op if running)."""
+        if self._task is None:
+            logger.info(f"👑 Leader election enabled as {self.holder}")
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop renewing and hand every held lease over immediately."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for name in list(self._held):
+            await self.release(name)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl_s / 3)
+            for name in list(self._held):
+                try:
+                    await self.acquire(name)
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ Could not renew lease {name}: {e}")
+
+
+@lru_cache
+def get_leases() -> Optional[LeaseStore]:
+    """Cached accessor for the replica lease store (None if disabled)."""
+    settings = get_settings()
+    if not settings.LEADER_ELECTION_ENABLED:
+        return None
+    if settings.CACHE_BACKEND.lower() != "sqlite":
+        logger.warning(
+            "⚠️ LEADER_ELECTION_ENABLED needs CACHE_BACKEND=sqlite so followers "
+            "can read the leader's snapshots; leader election is disabled"
+        )
+        return None
+    return LeaseStore(path=settings.CACHE_PATH, ttl_s=settings.LEADER_LEASE_TTL_S)
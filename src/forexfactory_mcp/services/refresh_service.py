@@ -0,0 +1,430 @@
+"""
+refresh_service.py
+
+Stale-while-revalidate snapshots for the hottest calendar periods.
+
+Agents mostly read `events/today`, `events/this_week` and `events/next_week`.
+For these "hot" periods (`REFRESH_PERIODS`) the refresher keeps the latest
+scraped snapshot in memory and:
+
+  - re-scrapes every period in the background every `REFRESH_INTERVAL_S`,
+  - serves reads instantly from the latest snapshot,
+  - kicks off a background refresh when a read finds the snapshot older than
+    `REFRESH_SOFT_TTL_S`.
+
+A hot period that lies inside another hot period (today inside this week)
+isn't scraped on its own: it is sliced out of that period's snapshot after
+each refresh.
+
+When a period rolls over (local midnight, a new week or month), its snapshot
+still holds the previous dates; it is then treated like a missing one, so
+reads wait for a scrape of the new dates instead of serving old events.
+
+Only the very first read of a period (before any snapshot exists) waits on
+the browser. A failed refresh keeps the previous snapshot, marked
+`status="stale"` with the failure in `error`. Every fresh snapshot is also
+handed to the `ReleaseScheduler`, which re-scrapes single days right after
+high-impact releases and patches the refreshed day back into the snapshots.
+
+With `SNAPSHOT_RESTORE_ENABLED`, the snapshots are also saved to
+`SNAPSHOT_PATH` (with the dates each was fetched for) after every refresh and
+on shutdown, and restored when the server starts: after a restart the first
+reads are served instantly from them (`status="restored"`, with their
+original age) while the background loop replaces them right away. A saved
+snapshot whose period now resolves to other dates (yesterday's "today") is
+not restored.
+
+With leader election (`services.leader_lease`), only the replica holding a
+period's `refresh:<period>` lease runs its background refresh and release
+watches. Followers adopt the leader's snapshots from the shared cache every
+tick (`min(REFRESH_INTERVAL_S, LEADER_LEASE_TTL_S)`) and try to take the
+lease over. A follower read that finds the shared snapshot past its soft TTL
+still refreshes it, but through the per-key scrape lease, so replicas never
+scrape the same period at the same time.
+
+Usage:
+    from forexfactory_mcp.services.refresh_service import get_refresher
+
+    refresher = get_refresher()
+    if refresher.is_hot(period):
+        snapshot = await refresher.get(period)
+"""
+
+import asyncio
+import datetime as dt
+import json
+import logging
+import os
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services.cache_service import (
+    CalendarSnapshot,
+    get_calendar_cache,
+    ttl_for_period,
+)
+from forexfactory_mcp.services.data_service import DataService
+from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.services.leader_lease import LeaseStore, get_leases
+from forexfactory_mcp.services.release_scheduler import ReleaseScheduler
+from forexfactory_mcp.services.resilience import ScrapeError
+from forexfactory_mcp.services.scrape_scheduler import ScrapePriority
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.date_ranges import covering_periods, resolve_range
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotRefresher:
+    """
+    Background scheduler that keeps hot periods refreshed.
+
+    Parameters
+    ----------
+    periods : List[TimePeriod]
+        Periods to keep warm.
+    interval_s : float
+        Cadence of the background refresh loop.
+    soft_ttl_s : float
+        Snapshot age after which a read triggers a background refresh.
+    release_refresh : bool
+        Re-scrape single days right after high-impact releases.
+    leases : Optional[LeaseStore]
+        Replica leases; None refreshes every period in this process.
+    snapshot_path : Optional[str]
+        File the snapshots are saved to and restored from (None disables).
+    """
+
+    def __init__(
+        self,
+        periods: List[TimePeriod],
+        interval_s: float,
+        soft_ttl_s: float,
+        release_refresh: bool = False,
+        leases: Optional[LeaseStore] = None,
+        snapshot_path: Optional[str] = None,
+    ):
+        self.periods = periods
+        self.interval_s = interval_s
+        self.soft_ttl_s = soft_ttl_s
+        self.leases = leases
+        self.snapshot_path = (
+            os.path.expanduser(snapshot_path) if snapshot_path else None
+        )
+        # Followers check for a dead leader at least once per lease TTL.
+        self.tick_s = min(interval_s, leases.ttl_s) if leases else interval_s
+        self.releases = (
+            ReleaseScheduler(on_day_refreshed=self.patch_day)
+            if release_refresh
+            else None
+        )
+
+        self._snapshots: Dict[TimePeriod, CalendarSnapshot] = {}
+        # Dates each snapshot was fetched for (a period's range moves daily).
+        self._ranges: Dict[TimePeriod, Tuple[dt.date, dt.date]] = {}
+        self._errors: Dict[TimePeriod, str] = {}
+        self._refreshing: Dict[TimePeriod, asyncio.Task] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def is_hot(self, period: TimePeriod) -> bool:
+        return period in self.periods
+
+    async def start(self) -> None:
+        """Start the background refresh loop (no-op if already running)."""
+        if self._loop_task is None and self.periods:
+            logger.info(
+                f"🔄 Starting background refresh for "
+                f"{', '.join(p.value for p in self.periods)} "
+                f"(every {self.interval_s}s)"
+            )
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and any refresh still in flight."""
+        tasks = list(self._refreshing.values())
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+            self._loop_task = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.releases:
+            await self.releases.stop()
+        self.save()
+
+    def save(self) -> None:
+        """Write every period's latest snapshot to `snapshot_path`."""
+        if not self.snapshot_path or not self._snapshots:
+            return
+
+        saved = {}
+        for period, snapshot in self._snapshots.items():
+            start, end = self._ranges[period]
+            saved[period.value] = {
+                "range": [start.isoformat(), end.isoformat()],
+                "fetched_at": snapshot.fetched_at,
+                "days": snapshot.days,
+            }
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+            tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(saved, f, separators=(",", ":"))
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save snapshots to {self.snapshot_path}: {e}")
+
+    def restore(self) -> None:
+        """
+        Load the snapshots saved by a previous run, marked "restored", for
+        every hot period that still covers the same dates.
+        """
+        if not self.snapshot_path or not self.periods:
+            return
+
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"⚠️ Ignoring unreadable snapshots {self.snapshot_path}: {e}"
+            )
+            return
+
+        for period in self.periods:
+            entry = saved.get(period.value)
+            if entry is None:
+                continue
+            start, end = resolve_range(period)
+            if entry.get("range") != [start.isoformat(), end.isoformat()]:
+                continue
+            snapshot = CalendarSnapshot(
+                entry["days"], fetched_at=entry["fetched_at"], status="restored"
+            )
+            self._snapshots[period] = snapshot
+            self._ranges[period] = (start, end)
+            get_metrics().incr("refresh.restored")
+            logger.info(
+                f"💾 Restored {period.value} snapshot (age {snapshot.age_s:.0f}s)"
+            )
+
+    async def get(self, period: TimePeriod) -> CalendarSnapshot:
+        """
+        Return the latest snapshot for `period`.
+
+        Never waits on the browser once a snapshot of the period's current
+        dates exists; a stale snapshot is returned as-is while a refresh runs
+        in the background.
+
+        Raises
+        ------
+        ScrapeError
+            If there is no snapshot of the current dates yet and scraping them
+            failed.
+        """
+        snapshot = self._snapshots.get(period)
+
+        if snapshot is None or not self._is_current(period):
+            # Cold start, or the period rolled over: wait for the first scrape
+            # (a refresh already in flight may still be for the old dates).
+            for _ in range(2):
+                await self.refresh(period, ScrapePriority.INTERACTIVE)
+                if period in self._errors or self._is_current(period):
+                    break
+            if period in self._errors or not self._is_current(period):
+                raise ScrapeError(self._errors.get(period, "no snapshot available"))
+            return self._snapshots[period]
+
+        if snapshot.age_s > self.soft_ttl_s:
+            self.refresh(period)
+
+        return snapshot
+
+    def refresh(
+        self,
+        period: TimePeriod,
+        priority: ScrapePriority = ScrapePriority.REFRESH,
+    ) -> asyncio.Task:
+        """Start a refresh of `period` unless one is already running."""
+        task = self._refreshing.get(period)
+        if task is None:
+            task = asyncio.create_task(self._refresh(period, priority))
+            self._refreshing[period] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(period, None))
+        return task
+
+    def _covering_hot_period(self, period: TimePeriod) -> Optional[TimePeriod]:
+        """Narrowest other hot period whose dates contain `period`'s."""
+        for wide, _ in covering_periods(resolve_range(period)):
+            if wide in self.periods:
+                return wide
+        return None
+
+    async def _leads(self, period: TimePeriod) -> bool:
+        """True if this replica owns `period`'s refresh (always without leases)."""
+        if self.leases is None:
+            return True
+        root = self._covering_hot_period(period) or period
+        return await self.leases.acquire(f"refresh:{root.value}")
+
+    async def _follow(self, period: TimePeriod) -> Optional[CalendarSnapshot]:
+        """Adopt a newer snapshot of `period` left by the leader in the shared cache."""
+        wide = self._covering_hot_period(period)
+        if wide is not None:
+            await self._follow(wide)
+            self._slice_from(period, wide)
+            return self._snapshots.get(period)
+
+        scraper = FFScraperService(time_period=period)
+        shared = await get_calendar_cache().get_stale(scraper.cache_key)
+        current = self._snapshots.get(period)
+        if shared is not None and (
+            current is None or shared.fetched_at > current.fetched_at
+        ):
+            self._errors.pop(period, None)
+            self._snapshots[period] = shared
+            self._ranges[period] = scraper.date_range
+        return self._snapshots.get(period)
+
+    def _is_current(self, period: TimePeriod) -> bool:
+        """True if `period`'s snapshot covers the dates it resolves to now."""
+        return self._ranges.get(period) == resolve_range(period)
+
+    def _due(self, period: TimePeriod) -> bool:
+        """True if the refresh loop should re-scrape `period` on this tick."""
+        snapshot = self._snapshots.get(period)
+        return (
+            snapshot is None
+            or snapshot.status == "restored"
+            or not self._is_current(period)
+            or snapshot.age_s + self.tick_s >= self.interval_s
+        )
+
+    async def _refresh(self, period: TimePeriod, priority: ScrapePriority) -> None:
+        wide = self._covering_hot_period(period)
+        if wide is not None:
+            await self.refresh(wide, priority)
+            self._slice_from(period, wide)
+            return
+
+        leading = await self._leads(period)
+        if not leading:
+            snapshot = await self._follow(period)
+            if (
+                snapshot is not None
+                and snapshot.age_s <= self.soft_ttl_s
+                and self._is_current(period)
+            ):
+                return
+
+        try:
+            scraper = FFScraperService(time_period=period, priority=priority)
+            days_array = await scraper.refresh()
+        except Exception as e:
+            logger.error(f"⚠️ Background refresh of {period.value} failed: {e}")
+            # Keep serving the previous snapshot, flagged as stale.
+            self._errors[period] = str(e)
+            snapshot = self._snapshots.get(period)
+            if snapshot is not None:
+                self._snapshots[period] = replace(
+                    snapshot, status="stale", error=str(e)
+                )
+            return
+
+        self._errors.pop(period, None)
+        self._snapshots[period] = CalendarSnapshot(days_array)
+        self._ranges[period] = scraper.date_range
+        logger.info(f"🔄 Refreshed {period.value} ({len(days_array)} days)")
+        if self.releases and leading:
+            self.releases.schedule_from(days_array)
+        self.save()
+
+    def _slice_from(self, period: TimePeriod, wide: TimePeriod) -> None:
+        """Derive `period`'s snapshot from the snapshot of hot period `wide`."""
+        snapshot = self._snapshots.get(wide)
+        start, end = resolve_range(period)
+        wide_range = self._ranges.get(wide)
+        if snapshot is None or not (
+            wide_range and wide_range[0] <= start and end <= wide_range[1]
+        ):
+            self._errors[period] = self._errors.get(wide, "no snapshot available")
+            return
+
+        days = DataService.slice_days(snapshot.days, start.isoformat(), end.isoformat())
+        self._errors.pop(period, None)
+        self._snapshots[period] = replace(snapshot, days=days)
+        self._ranges[period] = (start, end)
+        logger.info(f"✂️ Sliced {period.value} from {wide.value} ({len(days)} days)")
+
+    async def patch_day(self, day: str, block: Dict[str, Any]) -> None:
+        """
+        Replace the `day` block in every snapshot (and cached copy) that has it.
+
+        Called by the release scheduler after re-scraping a single day, so
+        fresh actuals show up without re-scraping the whole period. The rest
+        of the period is as old as before, so the snapshot keeps its
+        `fetched_at` (and the cached copy its remaining TTL): a patch never
+        makes the period look freshly scraped or delays its next refresh.
+        """
+        for period, snapshot in list(self._snapshots.items()):
+            days = [
+                block if DataService.day_date(b) == day else b for b in snapshot.days
+            ]
+            if days == snapshot.days:
+                continue
+
+            patched = replace(snapshot, days=days)
+            self._snapshots[period] = patched
+            await get_calendar_cache().set(
+                FFScraperService(time_period=period).cache_key,
+                patched,
+                # Past its TTL, still store it (briefly) so stale fallbacks
+                # serve the patched day rather than the old one.
+                max(ttl_for_period(period) - patched.age_s, 1),
+            )
+            logger.info(f"🩹 Patched {day} into {period.value} snapshot")
+
+    async def _run(self) -> None:
+        while True:
+            for period in self.periods:
+                try:
+                    if not await self._leads(period):
+                        await self._follow(period)
+                    elif self._due(period):
+                        self.refresh(period)
+                except Exception as e:
+                    # e.g. "database is locked" on the shared lease / cache file
+                    logger.exception(f"⚠️ Refresh tick for {period.value} failed: {e}")
+            await asyncio.sleep(self.tick_s)
+
+
+@lru_cache
+def get_refresher() -> SnapshotRefresher:
+    """Cached accessor for the process-wide hot-period refresher."""
+    settings = get_settings()
+
+    periods: List[TimePeriod] = []
+    if settings.REFRESH_ENABLED:
+        for name in settings.REFRESH_PERIODS or []:
+            try:
+                periods.append(TimePeriod.from_text(name))
+            except ValueError:
+                logger.warning(f"⚠️ Ignoring unknown refresh period '{name}'")
+
+    return SnapshotRefresher(
+        periods=periods,
+        interval_s=settings.REFRESH_INTERVAL_S,
+        soft_ttl_s=settings.REFRESH_SOFT_TTL_S,
+        release_refresh=settings.RELEASE_REFRESH_ENABLED,
+        leases=get_leases(),
+        snapshot_path=(
+            settings.SNAPSHOT_PATH if settings.SNAPSHOT_RESTORE_ENABLED else None
+        ),
+    )
@@ -0,0 +1,141 @@
+"""
+release_scheduler.py
+
+Release-time-aware refresh of single calendar days.
+
+Every raw ForexFactory event carries a `dateline` epoch (its release time).
+Instead of polling whole weeks, the scheduler watches the hot snapshots for
+upcoming releases with an impact in `RELEASE_REFRESH_IMPACTS` and, a few
+seconds after each release (`RELEASE_REFRESH_DELAY_S`), re-scrapes only the
+affected day. If the `actual` values aren't published yet it retries with
+exponential backoff (`RELEASE_REFRESH_BACKOFF_S`, doubling) and gives up after
+`RELEASE_REFRESH_MAX_ATTEMPTS`; it stops as soon as every actual is populated.
+
+Releases sharing the same day and time are grouped into one re-scrape.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services.data_service import DataService
+from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.services.scrape_scheduler import ScrapePriority
+from forexfactory_mcp.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# (ISO day, release epoch)
+ReleaseKey = Tuple[str, int]
+
+# Called with (ISO day, refreshed day block) after every successful re-scrape.
+DayRefreshedCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class ReleaseScheduler:
+    """
+    Schedules targeted day re-scrapes right after high-impact releases.
+
+    Parameters
+    ----------
+    on_day_refreshed : Optional[DayRefreshedCallback]
+        Hook used to patch the refreshed day into existing snapshots.
+    """
+
+    def __init__(self, on_day_refreshed: Optional[DayRefreshedCallback] = None):
+        settings = get_settings()
+        self.impacts = {i.lower() for i in settings.RELEASE_REFRESH_IMPACTS or []}
+        self.delay_s = settings.RELEASE_REFRESH_DELAY_S
+        self.backoff_s = settings.RELEASE_REFRESH_BACKOFF_S
+        self.max_attempts = max(1, settings.RELEASE_REFRESH_MAX_ATTEMPTS)
+        self.lookback_s = settings.RELEASE_REFRESH_LOOKBACK_S
+        self.on_day_refreshed = on_day_refreshed
+
+        self._tasks: Dict[ReleaseKey, asyncio.Task] = {}
+
+    def _is_tracked(self, event: Dict[str, Any]) -> bool:
+        impact = str(event.get("impactName") or event.get("impact") or "").lower()
+        return impact in self.impacts and not event.get("actual")
+
+    def schedule_from(self, days_array: Iterable[Dict[str, Any]]) -> None:
+        """
+        Schedule re-scrapes for every pending tracked release in `days_array`.
+
+        Releases already scheduled are skipped, so this is safe to call after
+        every snapshot refresh.
+        """
+        now = time.time()
+        releases: Dict[ReleaseKey, Set[str]] = {}
+
+        for block in days_array:
+            day = DataService.day_date(block)
+            if not day:
+                continue
+            for event in block.get("events", []):
+                try:
+                    dateline = int(event.get("dateline"))
+                except (TypeError, ValueError):
+                    continue
+                if dateline < now - self.lookback_s or not self._is_tracked(event):
+                    continue
+                releases.setdefault((day, dateline), set()).add(str(event.get("id")))
+
+        for key, event_ids in releases.items():
+            if key not in self._tasks:
+                task = asyncio.create_task(self._watch(key, event_ids))
+                self._tasks[key] = task
+                task.add_done_callback(lambda _, k=key: self._tasks.pop(k, None))
+
+    async def stop(self) -> None:
+        """Cancel every pending release watch."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _watch(self, key: ReleaseKey, event_ids: Set[str]) -> None:
+        day, dateline = key
+        await asyncio.sleep(max(0.0, dateline + self.delay_s - time.time()))
+
+        for attempt in range(self.max_attempts):
+            if attempt:
+                await asyncio.sleep(self.backoff_s * 2 ** (attempt - 1))
+
+            pending = await self._refresh_day(day, event_ids)
+            if not pending:
+                logger.info(f"📈 Actuals published for {day} release at {dateline}")
+                return
+            logger.info(
+                f"⏳ {len(pending)} actual(s) still pending for {day} "
+                f"(attempt {attempt + 1}/{self.max_attempts})"
+            )
+
+        logger.info(f"🛑 Giving up on actuals for {day} release at {dateline}")
+
+    async def _refresh_day(self, day: str, event_ids: Set[str]) -> List[str]:
+        """Re-scrape `day` and return the tracked event ids still missing actuals."""
+        try:
+            scraper = FFScraperService(
+                time_period=TimePeriod.CUSTOM,
+                custom_start_date=day,
+                custom_end_date=day,
+                priority=ScrapePriority.REFRESH,
+            )
+            days_array = await scraper.refresh()
+        except Exception as e:
+            logger.warning(f"⚠️ Release refresh of {day} failed: {e}")
+            return list(event_ids)
+
+        block = next((b for b in days_array if DataService.day_date(b) == day), None)
+        if block is None:
+            return list(event_ids)
+
+        if self.on_day_refreshed:
+            await self.on_day_refreshed(day, block)
+
+        published = {
+            str(ev.get("id")) for ev in block.get("events", []) if ev.get("actual")
+        }
+        return [event_id for event_id in event_ids if event_id not in published]
@@ -0,0 +1,126 @@
+"""
+request_policy.py
+
+Request interception policy for scrapes.
+
+The scraper only needs the inline `window.calendarComponentStates` script, yet
+a normal page load pulls in every image, font, stylesheet, ad and analytics
+script on the ForexFactory page. Pooled browser contexts route every request
+through `RequestPolicy`, which aborts:
+
+  - requests whose resource type is in `SCRAPER_BLOCKED_RESOURCE_TYPES`, and
+  - requests to hosts outside `SCRAPER_ALLOWED_HOSTS` (third parties),
+
+and `TrafficStats` counts what was loaded vs blocked for each scrape.
+
+Loaded bytes are the `content-length` of each response; responses without
+one (chunked or streamed) are counted as unsized rather than guessed. An
+aborted request never gets a response, so the bytes it saved are estimated
+from its resource type (`ESTIMATED_BYTES`, typical per-request transfer
+sizes) — good for spotting trends, not for exact accounting.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from forexfactory_mcp.settings import get_settings
+
+# Typical transfer size of one request per Playwright resource type, used to
+# estimate what a blocked request would have cost.
+ESTIMATED_BYTES: Dict[str, int] = {
+    "image": 16_000,
+    "media": 250_000,
+    "font": 32_000,
+    "stylesheet": 20_000,
+    "script": 24_000,
+}
+DEFAULT_ESTIMATED_BYTES = 4_000  # xhr, fetch, beacons, ...
+
+
+class RequestPolicy:
+    """
+    Decide which requests a scrape is allowed to make.
+
+    Parameters
+    ----------
+    blocked_types : Iterable[str]
+        Playwright resource types to abort (image, font, stylesheet, ...).
+    allowed_hosts : Iterable[str]
+        First-party hosts (subdomains included). Empty → no host filtering.
+    """
+
+    def __init__(self, blocked_types: Iterable[str], allowed_hosts: Iterable[str]):
+        self.blocked_types = {t.lower() for t in blocked_types}
+        self.allowed_hosts = [h.lower().lstrip(".") for h in allowed_hosts]
+
+    def _is_allowed_host(self, host: str) -> bool:
+        if not self.allowed_hosts:
+            return True
+        return any(host == h or host.endswith(f".{h}") for h in self.allowed_hosts)
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        Return why a request should be blocked, or None to let it through.
+
+        The reason is the resource type for type-based blocks and
+        "third-party" for requests to hosts outside the allowlist.
+        """
+        if resource_type == "document":
+            return None
+        if resource_type in self.blocked_types:
+            return resource_type
+        host = (urlsplit(url).hostname or "").lower()
+        if not self._is_allowed_host(host):
+            return "third-party"
+        return None
+
+
+@dataclass
+class TrafficStats:
+    """Requests loaded and blocked while serving one scrape."""
+
+    allowed: int = 0
+    bytes_loaded: int = 0
+    unsized: int = 0  # responses without a content-length
+    blocked: Counter = field(default_factory=Counter)
+    bytes_saved: int = 0  # estimated, see ESTIMATED_BYTES
+
+    @property
+    def blocked_total(self) -> int:
+        return sum(self.blocked.values())
+
+    def record_response(self, content_length: Optional[str]) -> None:
+        """Count a response's size from its `content-length` header."""
+        try:
+            self.bytes_loaded += int(content_length)
+        except (TypeError, ValueError):
+            self.unsized += 1
+
+    def record_blocked(self, reason: str, resource_type: str) -> None:
+        """Count an aborted request and the bytes it likely saved."""
+        self.blocked[reason] += 1
+        self.bytes_saved += ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+
+    def summary(self) -> str:
+        by_reason = ", ".join(f"{k}={v}" for k, v in self.blocked.most_common())
+        unsized = f" (+{self.unsized} unsized)" if self.unsized else ""
+        return (
+            f"loaded {self.allowed} requests / {self.bytes_loaded / 1024:.0f} KB"
+            f"{unsized}, blocked {self.blocked_total} ({by_reason or 'none'}, "
+            f"~{self.bytes_saved / 1024:.0f} KB saved)"
+        )
+
+
+@lru_cache
+def get_request_policy() -> Optional[RequestPolicy]:
+    """Cached accessor for the scrape request policy (None if disabled)."""
+    settings = get_settings()
+    if not settings.SCRAPER_BLOCK_REQUESTS:
+        return None
+    return RequestPolicy(
+        blocked_types=settings.SCRAPER_BLOCKED_RESOURCE_TYPES or [],
+        allowed_hosts=settings.SCRAPER_ALLOWED_HOSTS or [],
+    )
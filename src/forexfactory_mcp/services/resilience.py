@@ -0,0 +1,169 @@
+"""
+resilience.py
+
+Retry and circuit-breaking around ForexFactory scrapes.
+
+A failed scrape raises `ScrapeError` (an empty `days` array now always means
+"no events"). `FFScraperService` retries failures with jittered exponential
+backoff (`RetryPolicy`) and reports every outcome to a process-wide
+`CircuitBreaker`:
+
+  - closed    → scrapes run normally.
+  - open      → after `CIRCUIT_FAILURE_THRESHOLD` consecutive failures, scrapes
+                fail fast with `CircuitOpenError` for `CIRCUIT_RESET_TIMEOUT_S`
+                and callers serve their last good snapshot instead.
+  - half-open → once the timeout elapses a single probe scrape is let through;
+                success closes the circuit, failure re-opens it.
+
+Usage:
+    from forexfactory_mcp.services.resilience import (
+        get_circuit_breaker,
+        get_retry_policy,
+    )
+"""
+
+import logging
+import random
+import time
+from functools import lru_cache
+
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeError(Exception):
+    """A scrape failed (as opposed to succeeding with no events)."""
+
+
+class CircuitOpenError(ScrapeError):
+    """The circuit breaker is open; the scrape was not attempted."""
+
+
+class SessionRejectedError(ScrapeError):
+    """ForexFactory answered with a challenge instead of the calendar."""
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff ("full jitter").
+
+    Parameters
+    ----------
+    attempts : int
+        Total attempts per scrape, including the first one.
+    base_delay_s : float
+        Backoff cap before the first retry; doubles on every retry.
+    max_delay_s : float
+        Upper bound of the backoff cap.
+    """
+
+    def __init__(self, attempts: int, base_delay_s: float, max_delay_s: float):
+        self.attempts = max(1, attempts)
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+
+    def delay(self, retry: int) -> float:
+        """Seconds to sleep before retry number `retry` (0-based)."""
+        cap = min(self.max_delay_s, self.base_delay_s * (2**retry))
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker shared by every scrape.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        Consecutive failures that open the circuit.
+    reset_timeout_s : float
+        Time the circuit stays open before a probe scrape is allowed.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout_s: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = reset_timeout_s
+
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout_s:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    @property
+    def retry_in_s(self) -> float:
+        """Seconds until the next probe is allowed (0 when not open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout_s - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a scrape may run now (claims the probe when half-open)."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            logger.info("🔌 Circuit half-open: probing ForexFactory")
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Give up a claimed probe without an outcome (it was cancelled)."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("✅ Circuit closed: ForexFactory scrapes recovered")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+        get_metrics().set_gauge("scrape.circuit_open", 0)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or (
+            self._opened_at is None and self.failures >= self.failure_threshold
+        ):
+            logger.warning(
+                f"🚫 Circuit open after {self.failures} failed scrapes; "
+                f"failing fast for {self.reset_timeout_s}s"
+            )
+            self._opened_at = time.monotonic()
+            self._probing = False
+            metrics = get_metrics()
+            metrics.incr("scrape.circuit_opened")
+            metrics.set_gauge("scrape.circuit_open", 1)
+
+
+@lru_cache
+def get_retry_policy() -> RetryPolicy:
+    """Cached accessor for the scrape retry policy."""
+    settings = get_settings()
+    return RetryPolicy(
+        attempts=settings.SCRAPER_RETRY_ATTEMPTS,
+        base_delay_s=settings.SCRAPER_RETRY_BASE_DELAY_S,
+        max_delay_s=settings.SCRAPER_RETRY_MAX_DELAY_S,
+    )
+
+
+@lru_cache
+def get_circuit_breaker() -> CircuitBreaker:
+    """Cached accessor for the process-wide scrape circuit breaker."""
+    settings = get_settings()
+    return CircuitBreaker(
+        failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout_s=settings.CIRCUIT_RESET_TIMEOUT_S,
+    )
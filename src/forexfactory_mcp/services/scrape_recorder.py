@@ -0,0 +1,178 @@
+"""
+scrape_recorder.py
+
+Record-and-replay of ForexFactory page loads for deterministic offline runs.
+
+`SCRAPER_MODE` selects how `FFScraperService` reaches ForexFactory:
+
+  - "live"   → scrape forexfactory.com (default).
+  - "record" → scrape live and save every page under `SCRAPER_RECORD_DIR`,
+               keyed by a hash of its URL: `<key>.html` is the raw calendar
+               document, `<key>.json` the full (unprojected) days array.
+  - "replay" → never touch the network. Recorded pages are served to the
+               configured backend (an httpx mock transport for the HTTP fast
+               path, Playwright request routing for the browser), so parsing
+               and extraction still run; URLs with only a days snapshot are
+               answered from it directly. Unrecorded URLs fail with
+               `ScrapeError`.
+
+Replaying the same recordings makes scrape latency, normalization and tool
+timings comparable across commits (set `CACHE_MAX_ENTRIES=0` and
+`EVENT_STORE_ENABLED=false` to time every call end to end).
+
+Usage:
+    from forexfactory_mcp.services.scrape_recorder import get_scrape_recorder
+
+    recorder = get_scrape_recorder()  # None in live mode
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import httpx
+from playwright.async_api import Route
+
+from forexfactory_mcp.services.resilience import ScrapeError
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.event_utils import project_days
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeRecorder:
+    """
+    Saves and serves recorded calendar pages.
+
+    Parameters
+    ----------
+    mode : str
+        "record" or "replay".
+    record_dir : str
+        Directory holding the recordings.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    def __init__(self, mode: str, record_dir: str):
+        self.mode = mode
+        self.record_dir = os.path.expanduser(record_dir)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == self.RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == self.REPLAY
+
+    def _path(self, url: str, ext: str) -> str:
+        key = hashlib.sha1(url.encode()).hexdigest()[:16]
+        return os.path.join(self.record_dir, f"{key}.{ext}")
+
+    def _write(self, path: str, data: str) -> None:
+        os.makedirs(self.record_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _read(self, path: str) -> Optional[str]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save_page(self, url: str, html: str) -> None:
+        """Record the raw calendar document served for `url`."""
+        try:
+            self._write(self._path(url, "html"), html)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not record page {url}: {e}")
+
+    def load_page(self, url: str) -> Optional[str]:
+        return self._read(self._path(url, "html"))
+
+    def save_days(self, url: str, days: List[Dict[str, Any]]) -> None:
+        """Record the full days array scraped from `url`."""
+        recording = {"url": url, "recorded_at": time.time(), "days": days}
+        try:
+            self._write(self._path(url, "json"), json.dumps(recording))
+            logger.info(f"📼 Recorded {url}")
+        except OSError as e:
+            logger.warning(f"⚠️ Could not record days of {url}: {e}")
+
+    def load_days(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        raw = self._read(self._path(url, "json"))
+        return json.loads(raw)["days"] if raw is not None else None
+
+    async def scrape(
+        self,
+        url: str,
+        projection: Optional[Sequence[str]],
+        fetch: Callable[[Optional[Sequence[str]]], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Run `fetch(projection)` (a page load) in record or replay mode.
+
+        Recording fetches every key so the snapshot serves any projection;
+        replaying goes through `fetch` when the page was recorded (the
+        backends serve it offline) and falls back to the days snapshot.
+
+        Raises
+        ------
+        ScrapeError
+            When replaying a URL that was never recorded.
+        """
+        if self.replaying:
+            if self.load_page(url) is not None:
+                return await fetch(projection)
+            days = self.load_days(url)
+            if days is None:
+                raise ScrapeError(f"no recording for {url}")
+            logger.info(f"📼 Replaying recorded days for {url}")
+            return project_days(days, projection)
+
+        days = await fetch(None)
+        self.save_days(url, days)
+        return project_days(days, projection)
+
+    def transport(self) -> httpx.MockTransport:
+        """httpx transport that answers with recorded pages (404 otherwise)."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            html = self.load_page(str(request.url))
+            if html is None:
+                return httpx.Response(404, text="no recording")
+            return httpx.Response(200, text=html, headers={"content-type": "text/html"})
+
+        return httpx.MockTransport(handler)
+
+    async def fulfill(self, route: Route) -> bool:
+        """
+        Answer a browser request from the recordings; anything unrecorded is
+        aborted so replays stay offline. Returns True if it was fulfilled.
+        """
+        html = self.load_page(route.request.url)
+        if html is None:
+            await route.abort()
+            return False
+        await route.fulfill(status=200, content_type="text/html", body=html)
+        return True
+
+
+@lru_cache
+def get_scrape_recorder() -> Optional[ScrapeRecorder]:
+    """Cached accessor for the scrape recorder (None in live mode)."""
+    settings = get_settings()
+    mode = settings.SCRAPER_MODE.lower()
+    if mode not in (ScrapeRecorder.RECORD, ScrapeRecorder.REPLAY):
+        return None
+    logger.info(f"📼 Scraper mode: {mode} ({settings.SCRAPER_RECORD_DIR})")
+    return ScrapeRecorder(mode=mode, record_dir=settings.SCRAPER_RECORD_DIR)
@@ -0,0 +1,190 @@
+"""
+scrape_scheduler.py
+
+Process-wide admission control for scrapes.
+
+Every page load (browser or HTTP) goes through `ScrapeScheduler`, which lets
+at most `SCRAPER_MAX_CONCURRENCY` scrapes run at once. When all slots are busy,
+waiters queue by `ScrapePriority` (then arrival order), so interactive tool
+calls are admitted before background refreshes and bulk backfills.
+
+With `SCRAPER_BACKEND=browser`, every admitted scrape needs a pooled browser,
+so the cap is clamped to the browsers available (`BROWSER_POOL_SIZE`, or
+`SCRAPER_WORKERS` when scraping in worker processes). A larger cap would only
+move the queue into the browser pool, which hands out browsers first come
+first served and so ignores priority.
+
+Queue depth and active scrapes are published as gauges, and the time spent
+waiting for a slot is observed per priority:
+
+  - `scheduler.queue_depth`, `scheduler.active`
+  - `scheduler.wait_ms`, `scheduler.wait_ms.<priority>`
+
+Usage:
+    from forexfactory_mcp.services.scrape_scheduler import (
+        ScrapePriority,
+        get_scrape_scheduler,
+    )
+
+    days = await get_scrape_scheduler().run(
+        lambda: scrape(url), ScrapePriority.INTERACTIVE
+    )
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from functools import lru_cache
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ScrapePriority(IntEnum):
+    """Scrape priorities; lower values are admitted first."""
+
+    INTERACTIVE = 0  # tool calls and resource reads waiting on the result
+    REFRESH = 1  # background snapshot / release refreshes
+    BACKFILL = 2  # bulk range backfills
+
+
+class ScrapeScheduler:
+    """
+    Global concurrency cap with a priority queue for waiting scrapes.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        Maximum number of scrapes running at the same time.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.active = 0
+
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _publish(self) -> None:
+        metrics = get_metrics()
+        metrics.set_gauge("scheduler.active", self.active)
+        metrics.set_gauge("scheduler.queue_depth", self.queue_depth)
+
+    async def _acquire(self, priority: ScrapePriority) -> None:
+        if self.try_acquire():
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        self._publish()
+
+        try:
+            # The releasing scrape hands its slot over by resolving the future.
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Cancelled right after being handed a slot: pass it on.
+                self.release()
+            raise
+        finally:
+            self._publish()
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot only if one is free right now and nobody is queued.
+
+        Used for opportunistic extra work (e.g. hedged scrapes); the caller
+        must `release()` the slot when done.
+        """
+        if self.active < self.max_concurrency and not self.queue_depth:
+            self.active += 1
+            self._publish()
+            return True
+        return False
+
+    def release(self) -> None:
+        """Free a slot, handing it to the highest-priority waiter if any."""
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                break
+        else:
+            self.active -= 1
+        self._publish()
+
+    async def run(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        priority: ScrapePriority = ScrapePriority.INTERACTIVE,
+    ) -> T:
+        """
+        Wait for a scrape slot (in priority order), then run `fn()`.
+
+        Parameters
+        ----------
+        fn : Callable[[], Awaitable[T]]
+            Factory for the scrape coroutine.
+        priority : ScrapePriority
+            Admission priority while all slots are busy.
+
+        Returns
+        -------
+        T
+            Whatever `fn()` returns.
+        """
+        queued_at = time.monotonic()
+        await self._acquire(priority)
+
+        wait_ms = (time.monotonic() - queued_at) * 1000
+        metrics = get_metrics()
+        metrics.observe("scheduler.wait_ms", wait_ms)
+        metrics.observe(f"scheduler.wait_ms.{priority.name.lower()}", wait_ms)
+        if wait_ms >= 1000:
+            logger.info(
+                f"⏳ {priority.name.lower()} scrape waited {wait_ms:.0f}ms for a slot"
+            )
+
+        try:
+            return await fn()
+        finally:
+            self.release()
+
+
+def browser_capacity() -> Optional[int]:
+    """
+    Browsers available to concurrent scrapes, or None if scrapes don't
+    need one (HTTP or `auto` backend, replayed recordings).
+    """
+    settings = get_settings()
+    if settings.SCRAPER_BACKEND != "browser" or settings.SCRAPER_MODE == "replay":
+        return None
+    if settings.SCRAPER_WORKERS > 0:
+        return settings.SCRAPER_WORKERS  # one browser per worker process
+    return settings.BROWSER_POOL_SIZE
+
+
+@lru_cache
+def get_scrape_scheduler() -> ScrapeScheduler:
+    """Cached accessor for the process-wide scrape scheduler."""
+    max_concurrency = get_settings().SCRAPER_MAX_CONCURRENCY
+    capacity = browser_capacity()
+    if capacity is not None and max_concurrency > capacity:
+        logger.warning(
+            f"⚠️ SCRAPER_MAX_CONCURRENCY={max_concurrency} exceeds the "
+            f"{capacity} pooled browsers; capping scrapes at {capacity}"
+        )
+        max_concurrency = capacity
+    return ScrapeScheduler(max_concurrency=max_concurrency)
@@ -0,0 +1,247 @@
+"""
+scrape_workers.py
+
+Multi-process scrape workers.
+
+By default every page load, Playwright call and JSON decode runs on the
+server's single asyncio loop, so one core does all the work while Chromium
+competes for the others. With `SCRAPER_WORKERS` > 0, page loads are
+dispatched to a pool of worker processes instead:
+
+  - workers are started with the `spawn` method and each owns its own event
+    loop, Playwright instance and single-browser pool (plus its own HTTP
+    client for the fast path). Each takes a worker index 0..N-1, so with
+    `BROWSER_PERSIST_SESSION` its browser gets its own profile directory
+    (`w<index>-slot0/`) while the saved session stays shared;
+  - a job carries only `(url, projection, timeout_ms)` and a result comes
+    back as compact JSON bytes, decoded once in the server;
+  - counters recorded in a worker during a job (traffic, recycles, ...) are
+    shipped back with the result and merged into the server's metrics, and
+    its gauges are published as `workers.<pid>.<gauge>`;
+  - each worker runs the browser watchdog on its own browser (RSS recycling,
+    orphan reaping). A worker's loop only runs during jobs, so the check runs
+    before a job once `WATCHDOG_INTERVAL_S` has passed.
+
+Admission control, coalescing, retries, hedging, timeouts and caching stay in
+the server; only the page load itself moves. Keep `SCRAPER_MAX_CONCURRENCY`
+at least `SCRAPER_WORKERS` so every worker can be busy (with
+`SCRAPER_BACKEND=browser` it is capped at `SCRAPER_WORKERS`).
+
+Usage:
+    from forexfactory_mcp.services.scrape_workers import get_scrape_workers
+
+    workers = get_scrape_workers()  # None when scraping in-process
+    days = await workers.scrape(url, projection, timeout_ms)
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from forexfactory_mcp.services.resilience import ScrapeError
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils import procfs
+from forexfactory_mcp.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# (days as JSON bytes or None, error message or None, counter deltas,
+#  (worker pid, gauges))
+_JobResult = Tuple[
+    Optional[bytes], Optional[str], Dict[str, float], Tuple[int, Dict[str, float]]
+]
+
+# Worker-process state, set up by `_init_worker`.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_last_watchdog_check = 0.0
+
+
+def _init_worker(indexes: "multiprocessing.Queue") -> None:
+    """
+    Create the worker's event loop; its browser launches on first use.
+
+    `indexes` hands every worker of the executor a distinct index.
+    """
+    global _loop
+    from forexfactory_mcp.services.browser_session import get_browser_session
+
+    # One job runs per worker at a time, so one browser per worker is enough.
+    settings = get_settings()
+    settings.BROWSER_POOL_SIZE = 1
+
+    # Chromium locks a profile directory, so workers can't share slot0/.
+    session = get_browser_session()
+    if session is not None:
+        session.slot_prefix = f"w{indexes.get()}-slot"
+
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    atexit.register(_close_worker)
+
+    # Orphaned Chromium helpers of this worker's browser become ours to reap.
+    if settings.WATCHDOG_ENABLED and procfs.available():
+        procfs.become_subreaper()
+
+
+def _close_worker() -> None:
+    from forexfactory_mcp.services.browser_pool import get_browser_pool
+    from forexfactory_mcp.services.http_scraper import get_http_fetcher
+
+    try:
+        _loop.run_until_complete(get_browser_pool().close())
+        _loop.run_until_complete(get_http_fetcher().close())
+    except Exception:
+        pass
+
+
+def _ping() -> bool:
+    return True
+
+
+def _watchdog_tick() -> None:
+    """Run one watchdog check on this worker's browser if one is due."""
+    global _last_watchdog_check
+    from forexfactory_mcp.services.browser_watchdog import get_watchdog
+
+    settings = get_settings()
+    now = time.monotonic()
+    if not settings.WATCHDOG_ENABLED or not procfs.available():
+        return
+    if now - _last_watchdog_check < settings.WATCHDOG_INTERVAL_S:
+        return
+
+    _last_watchdog_check = now
+    try:
+        _loop.run_until_complete(get_watchdog().check())
+    except Exception as e:
+        logger.exception(f"⚠️ Browser watchdog check failed in worker: {e}")
+
+
+def _run_job(
+    url: str, projection: Optional[Tuple[str, ...]], timeout_ms: int
+) -> _JobResult:
+    """Scrape `url` in this worker and return the days as compact JSON."""
+    # Imported here: the scraper service imports this module.
+    from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+
+    metrics = get_metrics()
+    before = dict(metrics.counters)
+    _watchdog_tick()
+
+    payload, error = None, None
+    try:
+        days_array = _loop.run_until_complete(
+            FFScraperService.scrape_page(url, projection, timeout_ms)
+        )
+        payload = json.dumps(days_array, separators=(",", ":")).encode()
+    except Exception as e:
+        # Anything else would travel back pickled and skip the counters.
+        error = str(e) if isinstance(e, ScrapeError) else f"worker error: {e!r}"
+
+    counters = {
+        name: value - before.get(name, 0)
+        for name, value in metrics.counters.items()
+        if value != before.get(name, 0)
+    }
+    return payload, error, counters, (os.getpid(), dict(metrics.gauges))
+
+
+class ScrapeWorkerPool:
+    """
+    Pool of scrape worker processes.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = multiprocessing.get_context("spawn")
+            indexes = context.Queue()
+            for index in range(self.workers):
+                indexes.put(index)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(indexes,),
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Spawn every worker now instead of on the first scrapes."""
+        logger.info(f"🧵 Starting {self.workers} scrape worker process(es)")
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self.executor, _ping) for _ in range(self.workers))
+        )
+
+    async def close(self) -> None:
+        """Stop the workers (each closes its browser on exit)."""
+        if self._executor is not None:
+            logger.info("🛑 Stopping scrape workers")
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def scrape(
+        self,
+        url: str,
+        projection: Optional[Tuple[str, ...]],
+        timeout_ms: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape `url` in a worker process.
+
+        Raises
+        ------
+        ScrapeError
+            If the scrape failed, or the worker died (the pool is restarted).
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            payload, error, counters, (pid, gauges) = await loop.run_in_executor(
+                executor, _run_job, url, projection, timeout_ms
+            )
+        except BrokenProcessPool as e:
+            logger.error(f"💥 Scrape worker died; restarting the worker pool: {e}")
+            get_metrics().incr("workers.restarts")
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise ScrapeError(f"scrape worker died: {e}") from e
+
+        metrics = get_metrics()
+        metrics.incr("workers.jobs")
+        for name, value in counters.items():
+            metrics.incr(name, value)
+        for name, value in gauges.items():
+            metrics.set_gauge(f"workers.{pid}.{name}", value)
+
+        if error is not None:
+            raise ScrapeError(error)
+        return json.loads(payload)
+
+
+@lru_cache
+def get_scrape_workers() -> Optional[ScrapeWorkerPool]:
+    """Cached accessor for the scrape worker pool (None if disabled)."""
+    settings = get_settings()
+    if settings.SCRAPER_WORKERS <= 0:
+        return None
+    return ScrapeWorkerPool(workers=settings.SCRAPER_WORKERS)
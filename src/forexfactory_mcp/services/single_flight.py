@@ -0,0 +1,71 @@
+"""
+single_flight.py
+
+In-flight request coalescing ("single-flight") for async work.
+
+When several callers ask for the same key at the same time, only the first one
+starts the underlying coroutine; everyone else awaits the same future and gets
+the same result (or exception). Once the call completes the key is released, so
+the next request starts a fresh call.
+
+Usage:
+    flight = SingleFlight()
+    days = await flight.do(url, lambda: scrape(url))
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicate concurrent async calls that share the same key."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn()` unless a call for `key` is already in flight, then await it.
+
+        The shared call is shielded: a caller that gets cancelled stops waiting
+        but does not cancel the work other callers are waiting on.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identity of the call (e.g. the resolved calendar URL).
+        fn : Callable[[], Awaitable[T]]
+            Factory for the coroutine to run when no call is in flight.
+
+        Returns
+        -------
+        T
+            The shared result. Callers must treat it as read-only.
+        """
+        future = self._inflight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._release(key, f))
+        else:
+            logger.debug(f"🔗 Joining in-flight call for {key}")
+
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+        # Mark the exception as retrieved so an abandoned call doesn't log
+        # "exception was never retrieved" when every waiter was cancelled.
+        if not future.cancelled():
+            future.exception()
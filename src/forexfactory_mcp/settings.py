@@ -47,6 +47,108 @@ class Settings(BaseSettings):
     BASE_URL: str = "https://www.forexfactory.com"
     SCRAPER_TIMEOUT_MS: int = 5000  # Default 5s (Playwright expects ms)
 
+    # === Adaptive timeouts (per day/week/month/range bucket) ===
+    SCRAPER_ADAPTIVE_TIMEOUT: bool = True
+    SCRAPER_TIMEOUT_QUANTILE: float = 0.99  # latency quantile the timeout tracks
+    SCRAPER_TIMEOUT_MULTIPLIER: float = 2.0  # headroom over that quantile
+    SCRAPER_TIMEOUT_MIN_SAMPLES: int = 10  # samples before a bucket is learned
+    SCRAPER_TIMEOUT_FLOOR_MS: int = 2000
+    SCRAPER_TIMEOUT_CEILING_MS: int = 30000
+
+    # === Scrape backend ===
+    SCRAPER_BACKEND: str = "auto"  # auto (HTTP, browser fallback) | http | browser
+    SCRAPER_MODE: str = "live"  # live | record | replay (offline, from recordings)
+    SCRAPER_RECORD_DIR: str = "~/.cache/forexfactory-mcp/recordings"
+    HTTP_MAX_CONNECTIONS: int = 10  # pooled keep-alive connections for HTTP path
+
+    # === Scrape scheduling ===
+    SCRAPER_MAX_CONCURRENCY: int = 4  # scrapes running at once, process-wide
+    SCRAPER_WORKERS: int = 0  # scrape worker processes (0 = scrape in-process)
+
+    # === Retries and circuit breaker ===
+    SCRAPER_RETRY_ATTEMPTS: int = 3  # attempts per scrape, including the first
+    SCRAPER_RETRY_BASE_DELAY_S: float = 0.5  # backoff cap before the 1st retry
+    SCRAPER_RETRY_MAX_DELAY_S: float = 8.0  # backoff cap ceiling
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # consecutive failures that open it
+    CIRCUIT_RESET_TIMEOUT_S: int = 60  # open time before a probe scrape
+
+    # === Hedged scrapes ===
+    SCRAPER_HEDGE_ENABLED: bool = False
+    SCRAPER_HEDGE_QUANTILE: float = 0.9  # hedge after this latency quantile
+    SCRAPER_HEDGE_MIN_SAMPLES: int = 20  # latency samples needed before hedging
+    SCRAPER_HEDGE_MIN_DELAY_MS: int = 500  # never hedge sooner than this
+
+    # === Sharding of long custom ranges ===
+    SCRAPER_SHARD_DAYS: int = 7  # max days per range page load
+    SCRAPER_SHARD_CONCURRENCY: int = 4  # shards scraped in parallel
+
+    # === Browser pool ===
+    BROWSER_POOL_SIZE: int = 2  # warm Chromium instances kept alive
+    BROWSER_MAX_USES: int = 50  # recycle a pooled browser after N scrapes
+    BROWSER_CLOSE_TIMEOUT_S: float = 5.0  # then leftover processes are killed
+
+    # === Remote browsers ===
+    BROWSER_ENDPOINTS: Optional[List[str]] = None  # ws:// (run-server) or CDP URLs
+    BROWSER_ENDPOINT_RETRY_S: int = 30  # skip a failed endpoint this long
+    BROWSER_ENDPOINT_HEALTH_S: int = 15  # endpoint health check interval
+
+    # === Persisted browser session ===
+    BROWSER_PERSIST_SESSION: bool = False  # persistent profiles + storage state
+    BROWSER_PROFILE_DIR: str = "~/.cache/forexfactory-mcp/browser"
+    BROWSER_DISK_CACHE_MB: int = 64  # Chromium disk cache per pooled browser
+    BROWSER_STATE_SAVE_INTERVAL_S: int = 60  # min time between state saves
+
+    # === Browser watchdog ===
+    WATCHDOG_ENABLED: bool = True
+    WATCHDOG_INTERVAL_S: int = 30
+    BROWSER_MAX_RSS_MB: int = 512  # recycle a browser above this RSS (0 = off)
+    SCRAPER_DEADLINE_FACTOR: float = 3.0  # hard deadline = timeout × factor
+
+    # === Request interception during scrapes ===
+    SCRAPER_BLOCK_REQUESTS: bool = True
+    SCRAPER_BLOCKED_RESOURCE_TYPES: Optional[List[str]] = [
+        "image",
+        "media",
+        "font",
+        "stylesheet",
+    ]
+    SCRAPER_ALLOWED_HOSTS: Optional[List[str]] = ["forexfactory.com"]  # others blocked
+
+    # === Calendar cache ===
+    CACHE_BACKEND: str = "memory"  # "memory" (per process) or "sqlite" (shared)
+    CACHE_PATH: str = "~/.cache/forexfactory-mcp/cache.sqlite3"  # sqlite backend
+    CACHE_MAX_ENTRIES: int = 128  # 0 disables caching
+    CACHE_TTL_PAST_S: int = 6 * 3600  # yesterday / last week / last month
+    CACHE_TTL_CURRENT_S: int = 60  # today / this week / this month
+    CACHE_TTL_FUTURE_S: int = 15 * 60  # tomorrow / next week / next month
+    NEGATIVE_CACHE_TTL_S: int = 10  # don't re-scrape a failed key for this long
+    NEGATIVE_CACHE_MAX_TTL_S: int = 120  # cap as repeated failures double it
+
+    # === Replica leader election (needs CACHE_BACKEND=sqlite) ===
+    LEADER_ELECTION_ENABLED: bool = False
+    LEADER_LEASE_TTL_S: int = 30  # a dead leader is replaced after about this
+
+    # === Per-day event store (SQLite) ===
+    EVENT_STORE_ENABLED: bool = True
+    EVENT_STORE_PATH: str = "~/.cache/forexfactory-mcp/events.sqlite3"
+    EVENT_STORE_TTL_S: int = 300  # re-scrape today/future days after this
+
+    # === Background refresh of hot periods (stale-while-revalidate) ===
+    REFRESH_ENABLED: bool = True
+    REFRESH_PERIODS: Optional[List[str]] = ["today", "this_week", "next_week"]
+    REFRESH_INTERVAL_S: int = 300  # background refresh cadence
+    REFRESH_SOFT_TTL_S: int = 60  # reads older than this trigger a refresh
+    SNAPSHOT_RESTORE_ENABLED: bool = True  # save hot snapshots, restore on start
+    SNAPSHOT_PATH: str = "~/.cache/forexfactory-mcp/snapshots.json"
+
+    # === Release-time refresh (re-scrape a day right after a release) ===
+    RELEASE_REFRESH_ENABLED: bool = True
+    RELEASE_REFRESH_IMPACTS: Optional[List[str]] = ["high"]
+    RELEASE_REFRESH_DELAY_S: int = 5  # first re-scrape after the release time
+    RELEASE_REFRESH_BACKOFF_S: int = 10  # doubles while actuals are missing
+    RELEASE_REFRESH_MAX_ATTEMPTS: int = 5
+    RELEASE_REFRESH_LOOKBACK_S: int = 1800  # still chase releases this recent
+
     # === MCP namespace ===
     NAMESPACE: str = "ffcal"
 
@@ -73,7 +175,16 @@ class Settings(BaseSettings):
     # Tell Pydantic to look for environment variables in `.env`
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
-    @field_validator("INCLUDE_FIELDS", "EXCLUDE_FIELDS", mode="before")
+    @field_validator(
+        "INCLUDE_FIELDS",
+        "EXCLUDE_FIELDS",
+        "REFRESH_PERIODS",
+        "RELEASE_REFRESH_IMPACTS",
+        "SCRAPER_BLOCKED_RESOURCE_TYPES",
+        "SCRAPER_ALLOWED_HOSTS",
+        "BROWSER_ENDPOINTS",
+        mode="before",
+    )
     @classmethod
     def split_comma_or_blank(cls, v):
         """
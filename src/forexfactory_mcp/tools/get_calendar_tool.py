@@ -19,13 +19,15 @@ def register_get_calendar_tool(app: FastMCP, namespace: str) -> None:
         name=f"{namespace}_get_calendar_events",
         description="Retrieve ForexFactory calendar events for a given time period or custom date range."
         "Valid `time_period` values include: today, tomorrow, yesterday, "
-        "this_week, next_week, last_week, this_month, next_month, last_month, custom.",
+        "this_week, next_week, last_week, this_month, next_month, last_month, custom. "
+        "Optionally pass `fields` to choose which event fields are returned.",
     )
     async def get_calendar_events(
         time_period: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-    ) -> list[dict]:  # 👈 return JSON, not Pydantic
+        fields: Optional[List[str]] = None,
+    ) -> dict:  # 👈 return JSON, not Pydantic
         """
         Parameters
         ----------
@@ -36,11 +38,16 @@ def register_get_calendar_tool(app: FastMCP, namespace: str) -> None:
             Start date in YYYY-MM-DD (required if time_period='custom').
         end_date : str, optional
             End date in YYYY-MM-DD (required if time_period='custom').
+        fields : List[str], optional
+            Event fields to return (e.g. ["id", "title", "actual"], or ["*"]
+            for every raw field). Defaults to INCLUDE_FIELDS / the lean set.
 
         Returns
         -------
-        List[Event]
-            List of structured calendar events.
+        dict
+            `events` (structured calendar events) plus the snapshot's
+            `status` ("ok", "stale" or "restored"), `age_s` and, when a
+            scrape failed, `error`.
         """
 
         # CASE 1: Named time period
@@ -55,8 +62,8 @@ def register_get_calendar_tool(app: FastMCP, namespace: str) -> None:
                     f"Valid options: {', '.join([t.value for t in TimePeriod])}"
                 )
 
-            scraper = FFScraperService(time_period=tp)
-            raw_events = await scraper.get_events()
+            scraper = FFScraperService(time_period=tp, fields=fields)
+            snapshot = await scraper.get_snapshot()
 
         # CASE 2: Custom date range
         else:
@@ -66,9 +73,10 @@ def register_get_calendar_tool(app: FastMCP, namespace: str) -> None:
                 time_period=TimePeriod.CUSTOM,
                 custom_start_date=start_date,
                 custom_end_date=end_date,
+                fields=fields,
             )
-            raw_events = await scraper.get_events()
+            snapshot = await scraper.get_snapshot()
 
-        normalized = extract_and_normalize_events(raw_events)
+        events = extract_and_normalize_events(snapshot.days, fields)
 
-        return normalized
+        return {"events": events, **snapshot.freshness()}
@@ -0,0 +1,130 @@
+"""
+date_ranges.py
+
+Canonical calendar dates for every `TimePeriod`.
+
+ForexFactory weeks run Sunday → Saturday and months are calendar months;
+"today" is the current date in `Settings.local_tz` (`LOCAL_TIMEZONE`). Every
+period resolves to an inclusive `(start, end)` pair of dates, which is what
+the calendar cache is keyed on: periods that cover the same dates share one
+snapshot, and a period that falls inside a wider cached one (today inside
+this week, this week inside this month, ...) can be sliced out of it.
+
+Usage:
+    from forexfactory_mcp.utils.date_ranges import resolve_range
+
+    start, end = resolve_range(TimePeriod.THIS_WEEK)
+"""
+
+import datetime as dt
+from typing import List, Optional, Tuple
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.settings import get_settings
+
+DateRange = Tuple[dt.date, dt.date]
+
+# Named periods spanning several days, widest first: candidates to slice
+# narrower periods from.
+WIDE_PERIODS = [
+    TimePeriod.THIS_MONTH,
+    TimePeriod.NEXT_MONTH,
+    TimePeriod.LAST_MONTH,
+    TimePeriod.THIS_WEEK,
+    TimePeriod.NEXT_WEEK,
+    TimePeriod.LAST_WEEK,
+]
+
+
+def local_today() -> dt.date:
+    """Today's date in the configured local timezone."""
+    return dt.datetime.now(get_settings().local_tz).date()
+
+
+def _week_of(day: dt.date) -> DateRange:
+    start = day - dt.timedelta(days=(day.weekday() + 1) % 7)  # back to Sunday
+    return start, start + dt.timedelta(days=6)
+
+
+def _month_of(day: dt.date) -> DateRange:
+    start = day.replace(day=1)
+    next_month = (start + dt.timedelta(days=32)).replace(day=1)
+    return start, next_month - dt.timedelta(days=1)
+
+
+def resolve_range(
+    time_period: TimePeriod,
+    custom_start: Optional[str] = None,
+    custom_end: Optional[str] = None,
+    today: Optional[dt.date] = None,
+) -> DateRange:
+    """
+    Inclusive start/end dates of `time_period`.
+
+    Parameters
+    ----------
+    time_period : TimePeriod
+        Period to resolve.
+    custom_start, custom_end : Optional[str]
+        YYYY-MM-DD bounds, required for CUSTOM.
+    today : Optional[dt.date]
+        Reference date (defaults to `local_today()`).
+
+    Raises
+    ------
+    ValueError
+        If CUSTOM is given without both bounds, or with `start` after `end`.
+    """
+    today = today or local_today()
+    one_day = dt.timedelta(days=1)
+
+    if time_period == TimePeriod.CUSTOM:
+        if not (custom_start and custom_end):
+            raise ValueError("CUSTOM periods need a start and an end date")
+        start = dt.date.fromisoformat(custom_start)
+        end = dt.date.fromisoformat(custom_end)
+        if start > end:
+            raise ValueError(
+                f"Invalid date range: start {custom_start} is after end {custom_end}"
+            )
+        return start, end
+
+    if time_period == TimePeriod.TODAY:
+        return today, today
+    if time_period == TimePeriod.TOMORROW:
+        return today + one_day, today + one_day
+    if time_period == TimePeriod.YESTERDAY:
+        return today - one_day, today - one_day
+
+    if time_period == TimePeriod.THIS_WEEK:
+        return _week_of(today)
+    if time_period == TimePeriod.NEXT_WEEK:
+        return _week_of(today + dt.timedelta(days=7))
+    if time_period == TimePeriod.LAST_WEEK:
+        return _week_of(today - dt.timedelta(days=7))
+
+    this_month_start, this_month_end = _month_of(today)
+    if time_period == TimePeriod.THIS_MONTH:
+        return this_month_start, this_month_end
+    if time_period == TimePeriod.NEXT_MONTH:
+        return _month_of(this_month_end + one_day)
+    if time_period == TimePeriod.LAST_MONTH:
+        return _month_of(this_month_start - one_day)
+
+    raise ValueError(f"Invalid TimePeriod value: '{time_period}'")
+
+
+def covering_periods(
+    date_range: DateRange, today: Optional[dt.date] = None
+) -> List[Tuple[TimePeriod, DateRange]]:
+    """
+    Wider named periods whose dates contain `date_range` (itself excluded),
+    narrowest first.
+    """
+    start, end = date_range
+    candidates = []
+    for period in WIDE_PERIODS:
+        wide = resolve_range(period, today=today)
+        if wide[0] <= start and end <= wide[1] and wide != date_range:
+            candidates.append((period, wide))
+    return sorted(candidates, key=lambda c: c[1][1] - c[1][0])
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Iterable, List, Optional, Sequence
 
 from forexfactory_mcp.settings import get_settings
 
@@ -9,11 +9,75 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Raw ForexFactory keys each lean field is built from (in fallback order).
+RAW_FIELD_SOURCES: dict[str, tuple[str, ...]] = {
+    "id": ("id", "eventId"),
+    "title": ("title", "name", "soloTitle", "prefixedName"),
+    "currency": ("currency", "country"),
+    "impact": ("impact", "impactName", "impactTitle"),
+    "datetime": ("datetime", "dateline"),
+    "forecast": ("forecast",),
+    "previous": ("previous",),
+    "actual": ("actual",),
+}
 
-def _normalize_event(raw: dict) -> dict:
+
+def _resolve_fields(fields: Optional[List[str]] = None) -> Optional[List[str]]:
+    """Per-request field list if given, else INCLUDE_FIELDS (None → lean default)."""
+    return fields if fields is not None else settings.INCLUDE_FIELDS
+
+
+def raw_fields_for(fields: Optional[List[str]] = None) -> Optional[set[str]]:
+    """
+    Raw ForexFactory event keys needed to build the requested fields.
+
+    Parameters
+    ----------
+    fields : Optional[List[str]]
+        Per-request field list; falls back to INCLUDE_FIELDS / default_fields.
+
+    Returns
+    -------
+    Optional[set[str]]
+        Raw keys to keep when scraping, or None if every raw key is needed
+        (wildcard `*`).
+    """
+    include = _resolve_fields(fields)
+    if include == ["*"]:
+        return None
+
+    raw: set[str] = set()
+    for field in include or settings.default_fields:
+        raw.update(RAW_FIELD_SOURCES.get(field, ()))
+    return raw
+
+
+def project_days(days: List[dict], fields: Optional[Sequence[str]]) -> List[dict]:
+    """
+    Keep only `fields` on every event of a raw `days` array.
+
+    Python twin of the in-browser projection used by the Playwright scraper,
+    for backends that receive the full page state. `None` keeps everything.
+    """
+    if not fields:
+        return days
+    return [
+        {
+            "date": day.get("date"),
+            "dateline": day.get("dateline"),
+            "events": [
+                {f: ev[f] for f in fields if f in ev} for ev in day.get("events", [])
+            ],
+        }
+        for day in days
+    ]
+
+
+def _normalize_event(raw: dict, fields: Optional[List[str]] = None) -> dict:
     """
     Normalize raw ForexFactory event into a consistent structure.
-    Includes flexible INCLUDE_FIELDS / EXCLUDE_FIELDS support.
+    Includes flexible INCLUDE_FIELDS / EXCLUDE_FIELDS support; a per-request
+    `fields` list takes precedence over INCLUDE_FIELDS.
 
     Fallback rules:
       - id → id / eventId
@@ -44,18 +108,19 @@ def _normalize_event(raw: dict) -> dict:
     }
 
     # --- Step 2: Decide included fields ---
-    if settings.INCLUDE_FIELDS is None:
+    include = _resolve_fields(fields)
+    if include is None:
         # Blank → default lean model
         fields_to_include = settings.default_fields
-    elif settings.INCLUDE_FIELDS == ["*"]:
+    elif include == ["*"]:
         # Wildcard → all fields from raw event
         fields_to_include = list(raw.keys())
     else:
         # Explicit list
-        fields_to_include = settings.INCLUDE_FIELDS
+        fields_to_include = include
 
     # --- Step 3: Build the event dict according to INCLUDE_FIELDS ---
-    if settings.INCLUDE_FIELDS == ["*"]:
+    if include == ["*"]:
         # All raw fields (keep original event structure)
         event = {k: raw.get(k) for k in fields_to_include}
     else:
@@ -82,7 +147,9 @@ def _normalize_event(raw: dict) -> dict:
     return event
 
 
-def extract_and_normalize_events(raw_events: Iterable[dict]) -> list[dict]:
+def extract_and_normalize_events(
+    raw_events: Iterable[dict], fields: Optional[List[str]] = None
+) -> list[dict]:
     """
     Extract all events from a list of raw 'day' blocks and normalize them.
 
@@ -90,6 +157,8 @@ def extract_and_normalize_events(raw_events: Iterable[dict]) -> list[dict]:
     ----------
     raw_events : Iterable[dict]
         Each element should be a day block with an 'events' key.
+    fields : Optional[List[str]]
+        Per-request field list (overrides INCLUDE_FIELDS when given).
 
     Returns
     -------
@@ -104,5 +173,5 @@ def extract_and_normalize_events(raw_events: Iterable[dict]) -> list[dict]:
         except Exception as e:
             logger.warning(f"Skipping malformed event_day: {e}")
 
-    normalized_events = [_normalize_event(e) for e in events]
+    normalized_events = [_normalize_event(e, fields) for e in events]
     return normalized_events
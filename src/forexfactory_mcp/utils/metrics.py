@@ -0,0 +1,89 @@
+"""
+metrics.py
+
+Minimal in-process metrics registry (counters, gauges and rolling samples).
+
+Scraper components record what they do here, and the `{namespace}://metrics`
+resource exposes a JSON snapshot so throughput, latency and savings can be
+inspected from any MCP client without extra infrastructure.
+
+Usage:
+    from forexfactory_mcp.utils.metrics import get_metrics
+
+    metrics = get_metrics()
+    metrics.incr("scrape.requests_blocked", 12)
+    metrics.observe("scrape.latency_ms", 840.0)
+    p90 = metrics.quantile("scrape.latency_ms", 0.9)
+"""
+
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Optional
+
+
+class Metrics:
+    """
+    Process-wide metrics registry.
+
+    Parameters
+    ----------
+    window : int
+        Number of most recent samples kept per observed series.
+    """
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.gauges: Dict[str, float] = {}
+        self.samples: Dict[str, Deque[float]] = {}
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """Add `value` to a monotonically increasing counter."""
+        self.counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a gauge."""
+        self.gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Append a sample (e.g. a latency) to a rolling window."""
+        series = self.samples.get(name)
+        if series is None:
+            series = self.samples[name] = deque(maxlen=self.window)
+        series.append(value)
+
+    def sample_count(self, name: str) -> int:
+        return len(self.samples.get(name, ()))
+
+    def quantile(self, name: str, q: float) -> Optional[float]:
+        """Return the `q` quantile (0..1) of the rolling window, or None if empty."""
+        series = self.samples.get(name)
+        if not series:
+            return None
+        ordered = sorted(series)
+        index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable view of every counter, gauge and sample summary."""
+        summaries = {
+            name: {
+                "count": len(series),
+                "p50": self.quantile(name, 0.5),
+                "p90": self.quantile(name, 0.9),
+                "p99": self.quantile(name, 0.99),
+                "max": max(series) if series else None,
+            }
+            for name, series in self.samples.items()
+        }
+        return {
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "samples": summaries,
+        }
+
+
+@lru_cache
+def get_metrics() -> Metrics:
+    """Cached accessor for the process-wide metrics registry."""
+    return Metrics()
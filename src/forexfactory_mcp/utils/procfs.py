@@ -0,0 +1,142 @@
+"""
+procfs.py
+
+Tiny `/proc` helpers for tracking the Chromium processes the scraper owns.
+
+Linux only: on other platforms `available()` is False and every lookup returns
+nothing, so callers degrade to "no process tracking".
+"""
+
+import ctypes
+import logging
+import os
+import signal
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PROC = "/proc"
+_PR_SET_CHILD_SUBREAPER = 36
+
+
+@dataclass
+class ProcInfo:
+    """A process as seen in `/proc/<pid>/stat`."""
+
+    pid: int
+    ppid: int
+    state: str  # R, S, D, Z, ...
+    comm: str
+
+    @property
+    def is_zombie(self) -> bool:
+        return self.state == "Z"
+
+
+def available() -> bool:
+    return os.path.isdir(os.path.join(PROC, "self"))
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode(errors="replace")
+    except OSError:
+        return None
+
+
+def read_stat(pid: int) -> Optional[ProcInfo]:
+    raw = _read(f"{PROC}/{pid}/stat")
+    if not raw:
+        return None
+    # "pid (comm) state ppid ..." — comm may contain spaces and parentheses.
+    comm_end = raw.rfind(")")
+    comm = raw[raw.find("(") + 1 : comm_end]
+    fields = raw[comm_end + 2 :].split()
+    try:
+        return ProcInfo(pid=pid, ppid=int(fields[1]), state=fields[0], comm=comm)
+    except (IndexError, ValueError):
+        return None
+
+
+def list_processes() -> Dict[int, ProcInfo]:
+    """Every visible process, keyed by pid."""
+    if not available():
+        return {}
+    procs: Dict[int, ProcInfo] = {}
+    for name in os.listdir(PROC):
+        if name.isdigit():
+            info = read_stat(int(name))
+            if info is not None:
+                procs[info.pid] = info
+    return procs
+
+
+def cmdline(pid: int) -> str:
+    return (_read(f"{PROC}/{pid}/cmdline") or "").replace("\0", " ")
+
+
+def find_by_cmdline(token: str, procs: Iterable[int]) -> List[int]:
+    """Pids among `procs` whose command line contains `token`."""
+    return [pid for pid in procs if token in cmdline(pid)]
+
+
+def descendants(root: int, procs: Dict[int, ProcInfo]) -> Set[int]:
+    """`root` and all of its (transitive) children."""
+    children: Dict[int, List[int]] = {}
+    for info in procs.values():
+        children.setdefault(info.ppid, []).append(info.pid)
+
+    tree, stack = set(), [root]
+    while stack:
+        pid = stack.pop()
+        if pid in tree:
+            continue
+        tree.add(pid)
+        stack.extend(children.get(pid, []))
+    return tree
+
+
+def rss_bytes(pid: int) -> int:
+    """Resident set size of `pid` (0 if gone or unreadable)."""
+    raw = _read(f"{PROC}/{pid}/statm")
+    try:
+        return int(raw.split()[1]) * os.sysconf("SC_PAGE_SIZE") if raw else 0
+    except (IndexError, ValueError):
+        return 0
+
+
+def kill(pids: Iterable[int]) -> int:
+    """SIGKILL every pid that still exists; return how many were signalled."""
+    killed = 0
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except (ProcessLookupError, PermissionError):
+            pass
+    return killed
+
+
+def reap(pid: int) -> bool:
+    """Collect the exit status of a zombie child of this process."""
+    try:
+        reaped, _ = os.waitpid(pid, os.WNOHANG)
+        return reaped == pid
+    except ChildProcessError:
+        return False
+
+
+def become_subreaper() -> bool:
+    """
+    Make this process the reaper of orphaned descendants (Linux ≥ 3.4).
+
+    Orphaned Chromium helpers are then re-parented to us instead of PID 1, so
+    the watchdog can find, kill and reap them.
+    """
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.prctl(_PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0) == 0
+    except (OSError, AttributeError):
+        return False
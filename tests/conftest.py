@@ -0,0 +1,65 @@
+"""
+conftest.py
+
+Shared fixtures: every test runs with settings read from a clean environment
+(files under a temporary directory) and fresh process-wide singletons.
+"""
+
+import pytest
+
+from forexfactory_mcp.services.adaptive_timeout import get_adaptive_timeouts
+from forexfactory_mcp.services.cache_service import (
+    get_calendar_cache,
+    get_negative_cache,
+)
+from forexfactory_mcp.services.event_store import get_event_store
+from forexfactory_mcp.services.hedging import get_hedge_policy
+from forexfactory_mcp.services.leader_lease import get_leases
+from forexfactory_mcp.services.resilience import (
+    get_circuit_breaker,
+    get_retry_policy,
+)
+from forexfactory_mcp.services.scrape_recorder import get_scrape_recorder
+from forexfactory_mcp.services.scrape_scheduler import get_scrape_scheduler
+from forexfactory_mcp.services.scrape_workers import get_scrape_workers
+from forexfactory_mcp.settings import get_settings
+from forexfactory_mcp.utils.metrics import get_metrics
+
+# Cached accessors whose instances depend on the settings (or hold state)
+ACCESSORS = [
+    get_settings,
+    get_metrics,
+    get_adaptive_timeouts,
+    get_calendar_cache,
+    get_negative_cache,
+    get_event_store,
+    get_hedge_policy,
+    get_leases,
+    get_retry_policy,
+    get_circuit_breaker,
+    get_scrape_recorder,
+    get_scrape_scheduler,
+    get_scrape_workers,
+]
+
+
+def reset_accessors() -> None:
+    for accessor in ACCESSORS:
+        accessor.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(tmp_path, monkeypatch):
+    """
+    Isolate settings and singletons. Tests set env vars with `monkeypatch`
+    before the first `get_settings()` call.
+    """
+    # Run outside the working tree so a developer's .env isn't picked up
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LOCAL_TIMEZONE", "UTC")
+    monkeypatch.setenv("CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("EVENT_STORE_PATH", str(tmp_path / "events.sqlite3"))
+    monkeypatch.setenv("SNAPSHOT_PATH", str(tmp_path / "snapshots.json"))
+    reset_accessors()
+    yield
+    reset_accessors()
@@ -0,0 +1,261 @@
+"""
+test_cache_service.py
+
+Tests for the calendar caches and period-aware TTLs.
+"""
+
+import asyncio
+import datetime as dt
+
+import pytest
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services import cache_service
+from forexfactory_mcp.services.cache_service import (
+    CalendarSnapshot,
+    NegativeCache,
+    SqliteCache,
+    TTLCache,
+    get_calendar_cache,
+    ttl_for_period,
+)
+from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.services.resilience import ScrapeError
+from forexfactory_mcp.settings import get_settings
+
+
+class Blocking:
+    """Call a cache's coroutine accessors synchronously."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def __len__(self):
+        return len(self.cache)
+
+    def __getattr__(self, name):
+        attr = getattr(self.cache, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+        return lambda *args, **kwargs: asyncio.run(attr(*args, **kwargs))
+
+
+def test_ttl_cache_get_and_set():
+    cache = Blocking(TTLCache(max_entries=4))
+    cache.set("a", 1, ttl_s=60)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_expired_entry_is_stale_only(monkeypatch):
+    cache = Blocking(TTLCache(max_entries=4))
+    cache.set("a", 1, ttl_s=60)
+
+    now = cache_service.time.monotonic()
+    monkeypatch.setattr(cache_service.time, "monotonic", lambda: now + 61)
+
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = Blocking(TTLCache(max_entries=2))
+    cache.set("a", 1, ttl_s=60)
+    cache.set("b", 2, ttl_s=60)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3, ttl_s=60)
+
+    assert len(cache) == 2
+    assert cache.get_stale("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_disabled():
+    cache = Blocking(TTLCache(max_entries=0))
+    cache.set("a", 1, ttl_s=60)
+    assert cache.get("a") is None
+
+    cache = Blocking(TTLCache(max_entries=4))
+    cache.set("a", 1, ttl_s=0)
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_invalidate_and_clear():
+    cache = Blocking(TTLCache(max_entries=4))
+    cache.set("a", 1, ttl_s=60)
+    cache.set("b", 2, ttl_s=60)
+
+    cache.invalidate("a")
+    assert cache.get_stale("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_for_named_periods():
+    s = get_settings()
+    assert ttl_for_period(TimePeriod.LAST_WEEK) == s.CACHE_TTL_PAST_S
+    assert ttl_for_period(TimePeriod.TODAY) == s.CACHE_TTL_CURRENT_S
+    assert ttl_for_period(TimePeriod.NEXT_MONTH) == s.CACHE_TTL_FUTURE_S
+
+
+def test_ttl_for_custom_ranges():
+    s = get_settings()
+    today = dt.datetime.now(s.local_tz).date()
+    day = dt.timedelta(days=1)
+
+    def ttl(start, end):
+        return ttl_for_period(TimePeriod.CUSTOM, start.isoformat(), end.isoformat())
+
+    assert ttl(today - 3 * day, today - day) == s.CACHE_TTL_PAST_S
+    assert ttl(today - day, today + day) == s.CACHE_TTL_CURRENT_S
+    assert ttl(today + day, today + 3 * day) == s.CACHE_TTL_FUTURE_S
+
+
+def test_calendar_cache_defaults_to_memory():
+    cache = Blocking(get_calendar_cache())
+    assert isinstance(cache.cache, TTLCache)
+
+    snapshot = CalendarSnapshot([{"date": "Mon Sep 1"}])
+    cache.set(("2025-09-01", "2025-09-01", None), snapshot, ttl_s=60)
+    assert cache.get(("2025-09-01", "2025-09-01", None)) is snapshot
+
+
+def test_negative_cache_window_backs_off(monkeypatch):
+    cache = NegativeCache(ttl_s=10, max_ttl_s=30)
+    assert cache.record_failure("k", "timeout") == 10
+    assert cache.record_failure("k", "timeout") == 20
+    assert cache.record_failure("k", "timeout") == 30
+    assert cache.get("k") == "timeout"
+    assert 0 < cache.retry_in_s("k") <= 30
+
+    now = cache_service.time.monotonic()
+    monkeypatch.setattr(cache_service.time, "monotonic", lambda: now + 31)
+    assert cache.get("k") is None
+    assert cache.retry_in_s("k") == 0
+
+
+def test_negative_cache_clear_and_disable():
+    cache = NegativeCache(ttl_s=10, max_ttl_s=30)
+    cache.record_failure("k", "timeout")
+    cache.clear("k")
+    assert cache.get("k") is None
+    assert cache.record_failure("k", "timeout") == 10  # streak restarted
+
+    disabled = NegativeCache(ttl_s=0, max_ttl_s=30)
+    assert disabled.record_failure("k", "timeout") == 0
+    assert disabled.get("k") is None
+
+
+def test_negative_cache_forgets_oldest_keys():
+    cache = NegativeCache(ttl_s=10, max_ttl_s=30, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.record_failure(key, "timeout")
+    assert cache.get("a") is None
+    assert cache.get("c") == "timeout"
+
+
+def test_failed_scrape_is_not_retried_inside_its_window(monkeypatch):
+    monkeypatch.setenv("SCRAPER_RETRY_ATTEMPTS", "1")
+    calls = []
+
+    async def get_calendar_backend(self, url, timeout_ms):
+        calls.append(url)
+        raise ScrapeError("timeout")
+
+    monkeypatch.setattr(FFScraperService, "_get_calendar_backend", get_calendar_backend)
+
+    for _ in range(2):
+        with pytest.raises(ScrapeError, match="timeout"):
+            asyncio.run(FFScraperService(TimePeriod.TODAY).refresh())
+    assert len(calls) == 1
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    writer, reader = Blocking(SqliteCache(path, 8)), Blocking(SqliteCache(path, 8))
+    key = ("2025-09-01", "2025-09-07", None)
+
+    writer.set(key, CalendarSnapshot([{"date": "a"}], fetched_at=1.0), ttl_s=60)
+    assert reader.get(key) == CalendarSnapshot([{"date": "a"}], fetched_at=1.0)
+
+    # A replacement by another process is picked up, not the decoded copy
+    writer.set(key, CalendarSnapshot([{"date": "b"}], fetched_at=2.0), ttl_s=60)
+    assert reader.get(key).days == [{"date": "b"}]
+
+    writer.invalidate(key)
+    assert reader.get_stale(key) is None
+
+
+def test_sqlite_cache_expiry(tmp_path, monkeypatch):
+    cache = Blocking(SqliteCache(str(tmp_path / "shared.sqlite3"), 8))
+    cache.set("k", CalendarSnapshot([]), ttl_s=60)
+
+    now = cache_service.time.time()
+    monkeypatch.setattr(cache_service.time, "time", lambda: now + 61)
+    assert cache.get("k") is None
+    assert cache.get_stale("k") is not None
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    cache = Blocking(SqliteCache(str(tmp_path / "shared.sqlite3"), 2))
+    clock = [1000.0]
+    monkeypatch.setattr(cache_service.time, "time", lambda: clock[0])
+
+    for key in ("a", "b"):
+        clock[0] += 1
+        cache.set(key, CalendarSnapshot([], fetched_at=0.0), ttl_s=600)
+    clock[0] += 100
+    cache.get("a")  # "b" is now the least recently used
+    clock[0] += 1
+    cache.set("c", CalendarSnapshot([], fetched_at=0.0), ttl_s=600)
+
+    assert len(cache) == 2
+    assert cache.get_stale("b") is None
+    assert cache.get("a") is not None
+
+
+def test_sqlite_cache_throttles_access_time_writes(tmp_path, monkeypatch):
+    cache = Blocking(SqliteCache(str(tmp_path / "shared.sqlite3"), 8))
+    clock = [1000.0]
+    monkeypatch.setattr(cache_service.time, "time", lambda: clock[0])
+    cache.set("k", CalendarSnapshot([], fetched_at=0.0), ttl_s=600)
+
+    def accessed_at():
+        return cache.conn.execute("SELECT accessed_at FROM snapshots").fetchone()[0]
+
+    clock[0] += 30  # under a tenth of the TTL: no write
+    cache.get("k")
+    assert accessed_at() == 1000.0
+
+    clock[0] += 30
+    cache.get("k")
+    assert accessed_at() == 1060.0
+
+
+def test_sqlite_cache_disabled_and_clear(tmp_path):
+    disabled = Blocking(SqliteCache(str(tmp_path / "off.sqlite3"), 0))
+    disabled.set("k", CalendarSnapshot([]), ttl_s=60)
+    assert disabled.get("k") is None
+
+    cache = Blocking(SqliteCache(str(tmp_path / "shared.sqlite3"), 8))
+    cache.set("k", CalendarSnapshot([]), ttl_s=60)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_calendar_cache_sqlite_backend(monkeypatch):
+    monkeypatch.setenv("CACHE_BACKEND", "sqlite")
+    cache = get_calendar_cache()
+    assert isinstance(cache, SqliteCache)
+    assert cache.path == get_settings().CACHE_PATH
+
+
+def test_sqlite_cache_bounds_decoded_snapshots(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    writer, reader = Blocking(SqliteCache(path, 2)), Blocking(SqliteCache(path, 2))
+    for key in ("a", "b", "c", "d"):
+        writer.set(key, CalendarSnapshot([], fetched_at=0.0), ttl_s=60)
+        reader.get(key)
+    assert len(reader._decoded) <= 2
+    assert len(writer._decoded) <= 2
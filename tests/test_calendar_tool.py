@@ -0,0 +1,67 @@
+"""
+test_calendar_tool.py
+
+Tests for the `get_calendar_events` tool through an in-process MCP client,
+with the calendar snapshot stubbed out.
+"""
+
+import asyncio
+import json
+
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from forexfactory_mcp.services.cache_service import CalendarSnapshot
+from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.tools.get_calendar_tool import register_get_calendar_tool
+
+DAYS = [
+    {
+        "date": "Mon <span>Sep 1</span>",
+        "events": [{"id": 1, "name": "CPI m/m", "currency": "USD"}],
+    }
+]
+
+
+def call_tool(monkeypatch, snapshot: CalendarSnapshot, **arguments) -> dict:
+    async def get_snapshot(self):
+        return snapshot
+
+    monkeypatch.setattr(FFScraperService, "get_snapshot", get_snapshot)
+    app = FastMCP("test")
+    register_get_calendar_tool(app, "ffcal")
+
+    async def scenario():
+        async with create_connected_server_and_client_session(
+            app._mcp_server
+        ) as client:
+            result = await client.call_tool("ffcal_get_calendar_events", arguments)
+        assert not result.isError, result.content
+        return json.loads(result.content[0].text)
+
+    return asyncio.run(scenario())
+
+
+def test_fresh_snapshot_reports_ok(monkeypatch):
+    response = call_tool(monkeypatch, CalendarSnapshot(DAYS), time_period="today")
+
+    assert response["status"] == "ok"
+    assert response["age_s"] == 0
+    assert "error" not in response
+    assert len(response["events"]) == 1
+
+
+def test_stale_snapshot_reports_status_age_and_error(monkeypatch):
+    stale = CalendarSnapshot(DAYS, fetched_at=0, status="stale", error="circuit open")
+    response = call_tool(
+        monkeypatch,
+        stale,
+        time_period="custom",
+        start_date="2025-09-01",
+        end_date="2025-09-01",
+    )
+
+    assert response["status"] == "stale"
+    assert response["age_s"] > 0
+    assert response["error"] == "circuit open"
+    assert len(response["events"]) == 1
@@ -0,0 +1,94 @@
+"""
+test_date_ranges.py
+
+Tests for resolving time periods to calendar dates.
+"""
+
+import datetime as dt
+
+import pytest
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.utils.date_ranges import covering_periods, resolve_range
+
+WEDNESDAY = dt.date(2025, 9, 3)
+
+
+def d(iso: str) -> dt.date:
+    return dt.date.fromisoformat(iso)
+
+
+@pytest.mark.parametrize(
+    "period, start, end",
+    [
+        (TimePeriod.TODAY, "2025-09-03", "2025-09-03"),
+        (TimePeriod.TOMORROW, "2025-09-04", "2025-09-04"),
+        (TimePeriod.YESTERDAY, "2025-09-02", "2025-09-02"),
+        (TimePeriod.THIS_WEEK, "2025-08-31", "2025-09-06"),
+        (TimePeriod.NEXT_WEEK, "2025-09-07", "2025-09-13"),
+        (TimePeriod.LAST_WEEK, "2025-08-24", "2025-08-30"),
+        (TimePeriod.THIS_MONTH, "2025-09-01", "2025-09-30"),
+        (TimePeriod.NEXT_MONTH, "2025-10-01", "2025-10-31"),
+        (TimePeriod.LAST_MONTH, "2025-08-01", "2025-08-31"),
+    ],
+)
+def test_named_periods(period, start, end):
+    assert resolve_range(period, today=WEDNESDAY) == (d(start), d(end))
+
+
+def test_weeks_start_on_sunday():
+    sunday, saturday = d("2025-09-07"), d("2025-09-13")
+    assert resolve_range(TimePeriod.THIS_WEEK, today=sunday) == (sunday, saturday)
+    assert resolve_range(TimePeriod.THIS_WEEK, today=saturday) == (sunday, saturday)
+
+
+def test_months_across_year_and_leap_day():
+    assert resolve_range(TimePeriod.NEXT_MONTH, today=d("2025-12-15")) == (
+        d("2026-01-01"),
+        d("2026-01-31"),
+    )
+    assert resolve_range(TimePeriod.LAST_MONTH, today=d("2025-01-31")) == (
+        d("2024-12-01"),
+        d("2024-12-31"),
+    )
+    assert resolve_range(TimePeriod.THIS_MONTH, today=d("2024-02-10")) == (
+        d("2024-02-01"),
+        d("2024-02-29"),
+    )
+
+
+def test_custom_range():
+    assert resolve_range(TimePeriod.CUSTOM, "2025-09-01", "2025-09-10") == (
+        d("2025-09-01"),
+        d("2025-09-10"),
+    )
+
+
+def test_custom_range_needs_both_bounds():
+    with pytest.raises(ValueError):
+        resolve_range(TimePeriod.CUSTOM, "2025-09-01")
+
+
+def test_reversed_custom_range_is_rejected():
+    with pytest.raises(ValueError, match="after end"):
+        resolve_range(TimePeriod.CUSTOM, "2025-09-10", "2025-09-01")
+
+
+def test_covering_periods_narrowest_first():
+    today = d("2025-09-10")
+    assert covering_periods((today, today), today=today) == [
+        (TimePeriod.THIS_WEEK, (d("2025-09-07"), d("2025-09-13"))),
+        (TimePeriod.THIS_MONTH, (d("2025-09-01"), d("2025-09-30"))),
+    ]
+
+
+def test_covering_periods_excludes_the_range_itself():
+    this_week = resolve_range(TimePeriod.THIS_WEEK, today=d("2025-09-10"))
+    assert covering_periods(this_week, today=d("2025-09-10")) == [
+        (TimePeriod.THIS_MONTH, (d("2025-09-01"), d("2025-09-30"))),
+    ]
+
+
+def test_week_straddling_months_has_no_cover():
+    this_week = resolve_range(TimePeriod.THIS_WEEK, today=WEDNESDAY)
+    assert covering_periods(this_week, today=WEDNESDAY) == []
@@ -0,0 +1,116 @@
+"""
+test_event_store.py
+
+Tests for the per-day event store and its day-range helpers.
+"""
+
+import datetime as dt
+import time
+
+from forexfactory_mcp.services.event_store import (
+    contiguous_runs,
+    get_event_store,
+    iter_days,
+    split_range,
+)
+from forexfactory_mcp.settings import get_settings
+
+
+def _block(day: str) -> dict:
+    """Minimal raw ForexFactory day block for ISO `day`."""
+    date = dt.date.fromisoformat(day)
+    dateline = dt.datetime(date.year, date.month, date.day, tzinfo=dt.timezone.utc)
+    return {
+        "date": f"{date:%a} <span>{date:%b} {date.day}</span>",
+        "dateline": int(dateline.timestamp()),
+        "events": [{"id": 1, "name": "CPI m/m"}],
+    }
+
+
+def _noon_utc(day: str) -> float:
+    return dt.datetime.fromisoformat(f"{day}T12:00:00+00:00").timestamp()
+
+
+def test_put_and_get_days():
+    store = get_event_store()
+    store.put_days({"2025-09-01": _block("2025-09-01"), "2025-09-02": None}, 100.0)
+
+    stored = store.get_days("2025-09-01", "2025-09-30")
+    assert stored["2025-09-01"] == (_block("2025-09-01"), 100.0)
+    assert stored["2025-09-02"] == (None, 100.0)
+    assert store.get_days("2025-10-01", "2025-10-31") == {}
+
+
+def test_put_blocks_keys_by_iso_date():
+    store = get_event_store()
+    store.put_blocks([_block("2025-09-01"), _block("2025-09-03")])
+    assert sorted(store.get_days("2025-09-01", "2025-09-30")) == [
+        "2025-09-01",
+        "2025-09-03",
+    ]
+
+
+def test_past_day_fetched_after_it_ended_is_immutable():
+    store = get_event_store()
+    assert store.is_fresh("2025-09-01", _noon_utc("2025-09-02"))
+
+
+def test_current_day_goes_stale_after_ttl():
+    store = get_event_store()
+    today = dt.datetime.now(dt.timezone.utc).date().isoformat()
+    assert store.is_fresh(today, time.time())
+    assert not store.is_fresh(today, time.time() - store.ttl_s - 1)
+
+
+def test_freshness_uses_configured_timezone(monkeypatch):
+    # Noon UTC on Sep 1 is already Sep 2 in UTC+14.
+    fetched_at = _noon_utc("2025-09-01")
+    assert not get_event_store().is_fresh("2025-09-01", fetched_at)
+
+    monkeypatch.setenv("LOCAL_TIMEZONE", "Pacific/Kiritimati")
+    get_settings.cache_clear()
+    assert get_event_store().is_fresh("2025-09-01", fetched_at)
+
+
+def test_missing_days():
+    store = get_event_store()
+    today = dt.datetime.now(dt.timezone.utc).date()
+    days = iter_days((today - dt.timedelta(days=2)).isoformat(), today.isoformat())
+    stored = {
+        days[0]: (None, time.time()),  # past day, fetched after it ended
+        days[2]: (None, time.time() - store.ttl_s - 1),  # today, stale
+    }
+    assert store.missing_days(days, stored) == [days[1], days[2]]
+
+
+def test_iter_days():
+    assert iter_days("2025-08-30", "2025-09-02") == [
+        "2025-08-30",
+        "2025-08-31",
+        "2025-09-01",
+        "2025-09-02",
+    ]
+    assert iter_days("2025-09-01", "2025-09-01") == ["2025-09-01"]
+
+
+def test_contiguous_runs():
+    days = ["2025-09-01", "2025-09-02", "2025-09-04", "2025-09-30", "2025-10-01"]
+    assert contiguous_runs(days) == [
+        ("2025-09-01", "2025-09-02"),
+        ("2025-09-04", "2025-09-04"),
+        ("2025-09-30", "2025-10-01"),
+    ]
+    assert contiguous_runs([]) == []
+
+
+def test_split_range():
+    assert split_range("2025-09-01", "2025-09-17", 7) == [
+        ("2025-09-01", "2025-09-07"),
+        ("2025-09-08", "2025-09-14"),
+        ("2025-09-15", "2025-09-17"),
+    ]
+    assert split_range("2025-09-01", "2025-09-03", 0) == [
+        ("2025-09-01", "2025-09-01"),
+        ("2025-09-02", "2025-09-02"),
+        ("2025-09-03", "2025-09-03"),
+    ]
@@ -0,0 +1,65 @@
+import asyncio
+
+from forexfactory_mcp.services.adaptive_timeout import LATENCY_METRIC
+from forexfactory_mcp.services.hedging import HedgePolicy, is_hedge_cancel
+from forexfactory_mcp.services.scrape_scheduler import get_scrape_scheduler
+from forexfactory_mcp.utils.metrics import get_metrics
+
+
+def policy() -> HedgePolicy:
+    get_metrics().observe(LATENCY_METRIC, 10)
+    return HedgePolicy(enabled=True, quantile=0.9, min_samples=1, min_delay_ms=10)
+
+
+def test_slow_scrape_is_hedged_and_loser_cancelled():
+    attempts = []
+
+    async def scrape():
+        attempt = len(attempts)
+        attempts.append(None)
+        try:
+            await asyncio.sleep(5 if attempt == 0 else 0)
+        except asyncio.CancelledError as error:
+            attempts[attempt] = error
+            raise
+        return attempt
+
+    winner = asyncio.run(policy().run(scrape))
+
+    counters = get_metrics().counters
+    assert winner == 1
+    assert is_hedge_cancel(attempts[0])
+    assert counters["scrape.hedges"] == counters["scrape.hedges_won"] == 1
+    assert get_scrape_scheduler().active == 0
+
+
+def test_hedge_skipped_without_free_slot():
+    calls = []
+
+    async def scenario():
+        scheduler = get_scrape_scheduler()
+        for _ in range(scheduler.max_concurrency):
+            assert scheduler.try_acquire()
+
+        async def scrape():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "days"
+
+        return await policy().run(scrape)
+
+    assert asyncio.run(scenario()) == "days"
+    assert len(calls) == 1
+    assert get_metrics().counters["scrape.hedges_skipped"] == 1
+
+
+def test_disabled_policy_runs_once():
+    calls = []
+
+    async def scrape():
+        calls.append(1)
+        return "days"
+
+    disabled = HedgePolicy(enabled=False, quantile=0.9, min_samples=1, min_delay_ms=0)
+    assert asyncio.run(disabled.run(scrape)) == "days"
+    assert calls == [1]
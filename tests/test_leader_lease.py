@@ -0,0 +1,133 @@
+"""
+test_leader_lease.py
+
+Tests for the SQLite leases replicas coordinate through. Two `LeaseStore`s on
+one file stand in for two replicas.
+"""
+
+import asyncio
+
+import pytest
+
+from forexfactory_mcp.services import leader_lease
+from forexfactory_mcp.services.leader_lease import LeaseStore, get_leases
+from forexfactory_mcp.settings import get_settings
+
+run = asyncio.run
+
+
+async def no_result():
+    return None
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    return (
+        LeaseStore(path, ttl_s=30, poll_s=0.01),
+        LeaseStore(path, ttl_s=30, poll_s=0.01),
+    )
+
+
+def test_lease_has_a_single_holder(replicas):
+    a, b = replicas
+    assert run(a.acquire("refresh:this_week"))
+    assert not run(b.acquire("refresh:this_week"))
+    assert run(a.acquire("refresh:this_week"))  # renewing our own lease
+    assert run(b.holder_of("refresh:this_week")) == a.holder
+
+
+def test_released_lease_is_taken_over(replicas):
+    a, b = replicas
+    run(a.acquire("refresh:today"))
+    run(a.release("refresh:today"))
+    assert run(a.holder_of("refresh:today")) is None
+    assert run(b.acquire("refresh:today"))
+
+
+def test_expired_lease_is_taken_over(replicas, monkeypatch):
+    a, b = replicas
+    run(a.acquire("refresh:today"))
+
+    now = leader_lease.time.time()
+    monkeypatch.setattr(leader_lease.time, "time", lambda: now + 31)
+    assert run(b.holder_of("refresh:today")) is None
+    assert run(b.acquire("refresh:today"))
+    assert not run(a.acquire("refresh:today"))  # lost to b
+
+
+def test_exclusive_runs_load_when_free(replicas):
+    a, _ = replicas
+
+    async def load():
+        return "scraped"
+
+    result = run(a.exclusive("scrape:k", load, no_result))
+    assert result == "scraped"
+    assert run(a.holder_of("scrape:k")) is None  # released afterwards
+
+
+def test_exclusive_waits_for_the_holders_result(replicas):
+    a, b = replicas
+    run(a.acquire("scrape:k"))
+    published = []
+    calls = []
+
+    async def load():
+        calls.append("b")
+        return "scraped by b"
+
+    async def peer_result():
+        return published[0] if published else None
+
+    async def main():
+        waiter = asyncio.create_task(b.exclusive("scrape:k", load, peer_result))
+        await asyncio.sleep(0.05)
+        published.append("scraped by a")
+        await a.release("scrape:k")
+        return await waiter
+
+    assert run(main()) == "scraped by a"
+    assert calls == []
+
+
+def test_exclusive_takes_over_from_a_holder_that_gave_up(replicas):
+    a, b = replicas
+    run(a.acquire("scrape:k"))
+
+    async def load():
+        return "scraped by b"
+
+    async def main():
+        waiter = asyncio.create_task(b.exclusive("scrape:k", load, no_result))
+        await asyncio.sleep(0.05)
+        await a.release("scrape:k")  # failed without publishing
+        return await waiter
+
+    assert run(main()) == "scraped by b"
+
+
+def test_stop_releases_held_leases(replicas):
+    a, b = replicas
+
+    async def main():
+        await a.start()
+        await a.acquire("refresh:today")
+        await a.stop()
+
+    run(main())
+    assert run(b.acquire("refresh:today"))
+
+
+def test_get_leases_needs_election_and_sqlite(monkeypatch):
+    assert get_leases() is None
+
+    monkeypatch.setenv("LEADER_ELECTION_ENABLED", "true")
+    get_settings.cache_clear()
+    get_leases.cache_clear()
+    assert get_leases() is None  # memory cache backend
+
+    monkeypatch.setenv("CACHE_BACKEND", "sqlite")
+    get_settings.cache_clear()
+    get_leases.cache_clear()
+    assert isinstance(get_leases(), LeaseStore)
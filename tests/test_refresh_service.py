@@ -0,0 +1,117 @@
+"""
+test_refresh_service.py
+
+Tests for the hot-period snapshot refresher, with the scrape stubbed out.
+"""
+
+import asyncio
+import datetime as dt
+import time
+from dataclasses import replace
+
+import pytest
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services.cache_service import get_calendar_cache
+from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.services.refresh_service import SnapshotRefresher
+from forexfactory_mcp.services.resilience import ScrapeError
+from forexfactory_mcp.utils import date_ranges
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Settable local date seen by every period resolution."""
+    today = [dt.date(2025, 9, 3)]
+    monkeypatch.setattr(date_ranges, "local_today", lambda: today[0])
+    return today
+
+
+@pytest.fixture
+def scrapes(monkeypatch):
+    """Stub scrape returning one block per day of the scraped range."""
+    calls = []
+    failures = []
+
+    async def refresh(self):
+        calls.append(self.date_range)
+        if failures:
+            raise failures.pop(0)
+        return [{"date": day} for day in self.cache_key[:2]]
+
+    monkeypatch.setattr(FFScraperService, "refresh", refresh)
+    return calls, failures
+
+
+def refresher(*periods: TimePeriod) -> SnapshotRefresher:
+    return SnapshotRefresher(list(periods), interval_s=300, soft_ttl_s=60)
+
+
+def test_first_read_waits_for_a_scrape(clock, scrapes):
+    calls, _ = scrapes
+    hot = refresher(TimePeriod.TODAY)
+
+    snapshot = asyncio.run(hot.get(TimePeriod.TODAY))
+    assert snapshot.days[0] == {"date": "2025-09-03"}
+    assert len(calls) == 1
+
+    asyncio.run(hot.get(TimePeriod.TODAY))  # served from the snapshot
+    assert len(calls) == 1
+
+
+def test_read_after_midnight_scrapes_the_new_day(clock, scrapes):
+    calls, _ = scrapes
+    hot = refresher(TimePeriod.TODAY)
+    asyncio.run(hot.get(TimePeriod.TODAY))
+
+    clock[0] = dt.date(2025, 9, 4)
+    snapshot = asyncio.run(hot.get(TimePeriod.TODAY))
+    assert snapshot.days[0] == {"date": "2025-09-04"}
+    assert calls[-1] == (dt.date(2025, 9, 4), dt.date(2025, 9, 4))
+
+
+def test_rolled_over_period_is_not_served_if_the_scrape_fails(clock, scrapes):
+    _, failures = scrapes
+    hot = refresher(TimePeriod.TODAY)
+    asyncio.run(hot.get(TimePeriod.TODAY))
+
+    clock[0] = dt.date(2025, 9, 4)
+    assert hot._due(TimePeriod.TODAY)
+    failures.append(ScrapeError("circuit open"))
+    with pytest.raises(ScrapeError, match="circuit open"):
+        asyncio.run(hot.get(TimePeriod.TODAY))
+
+
+def test_sliced_period_rolls_over_with_the_week(clock, scrapes):
+    calls, _ = scrapes
+    hot = refresher(TimePeriod.TODAY, TimePeriod.THIS_WEEK)
+    asyncio.run(hot.get(TimePeriod.TODAY))
+    assert calls == [(dt.date(2025, 8, 31), dt.date(2025, 9, 6))]
+
+    clock[0] = dt.date(2025, 9, 7)  # Sunday: a new week
+    asyncio.run(hot.get(TimePeriod.TODAY))
+    assert calls[-1] == (dt.date(2025, 9, 7), dt.date(2025, 9, 13))
+    assert asyncio.run(hot.get(TimePeriod.THIS_WEEK)).days[0] == {"date": "2025-09-07"}
+
+
+def test_patched_day_keeps_the_snapshot_age(clock, scrapes):
+    hot = refresher(TimePeriod.TODAY)
+    asyncio.run(hot.get(TimePeriod.TODAY))
+    scraped_at = time.time() - 250
+    hot._snapshots[TimePeriod.TODAY] = replace(
+        hot._snapshots[TimePeriod.TODAY], fetched_at=scraped_at
+    )
+
+    block = {"date": "2025-09-03", "events": ["CPI"]}
+    asyncio.run(hot.patch_day("2025-09-03", block))
+
+    snapshot = hot._snapshots[TimePeriod.TODAY]
+    assert {"date": "2025-09-03"} not in snapshot.days
+    assert block in snapshot.days
+    assert snapshot.fetched_at == scraped_at
+    assert hot._due(TimePeriod.TODAY)  # the rest of the day is still 250s old
+
+    key = FFScraperService(time_period=TimePeriod.TODAY).cache_key
+    cached = asyncio.run(get_calendar_cache().get(key))
+    assert cached.days == snapshot.days
+    assert cached.fetched_at == scraped_at
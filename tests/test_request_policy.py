@@ -0,0 +1,42 @@
+from forexfactory_mcp.services.request_policy import (
+    DEFAULT_ESTIMATED_BYTES,
+    ESTIMATED_BYTES,
+    RequestPolicy,
+    TrafficStats,
+)
+
+
+def test_block_reason_by_type_and_host():
+    policy = RequestPolicy(["image", "font"], ["forexfactory.com"])
+
+    assert policy.block_reason("document", "https://ads.example/") is None
+    assert policy.block_reason("image", "https://www.forexfactory.com/a.png") == "image"
+    assert policy.block_reason("script", "https://cdn.example/x.js") == "third-party"
+    assert policy.block_reason("script", "https://www.forexfactory.com/x.js") is None
+
+
+def test_traffic_stats_estimate_bytes_saved():
+    traffic = TrafficStats()
+
+    traffic.record_blocked("image", "image")
+    traffic.record_blocked("third-party", "script")
+    traffic.record_blocked("third-party", "beacon")
+
+    assert traffic.blocked_total == 3
+    assert traffic.blocked == {"image": 1, "third-party": 2}
+    assert traffic.bytes_saved == (
+        ESTIMATED_BYTES["image"] + ESTIMATED_BYTES["script"] + DEFAULT_ESTIMATED_BYTES
+    )
+    assert "KB saved" in traffic.summary()
+
+
+def test_traffic_stats_count_unsized_responses():
+    traffic = TrafficStats()
+
+    traffic.record_response("2048")
+    traffic.record_response(None)
+    traffic.record_response("bogus")
+
+    assert traffic.bytes_loaded == 2048
+    assert traffic.unsized == 2
+    assert "+2 unsized" in traffic.summary()
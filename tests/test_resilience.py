@@ -0,0 +1,197 @@
+"""
+test_resilience.py
+
+Tests for scrape retries and the circuit breaker, alone and around
+`FFScraperService._scrape_with_retry` with a stubbed page load.
+"""
+
+import asyncio
+
+import pytest
+
+from forexfactory_mcp.models.time_period import TimePeriod
+from forexfactory_mcp.services.ff_scraper_service import FFScraperService
+from forexfactory_mcp.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    ScrapeError,
+    get_circuit_breaker,
+)
+from forexfactory_mcp.utils.metrics import get_metrics
+
+URL = "https://www.forexfactory.com/calendar?day=sep1.2025"
+DAYS = [{"date": "Mon <span>Sep 1</span>", "events": []}]
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setenv("SCRAPER_RETRY_ATTEMPTS", "3")
+    monkeypatch.setenv("SCRAPER_RETRY_BASE_DELAY_S", "0")
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "5")
+    monkeypatch.setenv("CIRCUIT_RESET_TIMEOUT_S", "60")
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """Stub page load: pops one outcome per call (exception or days array)."""
+    outcomes = []
+    calls = []
+
+    async def get_calendar_backend(self, url, timeout_ms):
+        calls.append(url)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if callable(outcome):
+            return await outcome()
+        return outcome
+
+    monkeypatch.setattr(FFScraperService, "_get_calendar_backend", get_calendar_backend)
+    return outcomes, calls
+
+
+def scrape():
+    service = FFScraperService(TimePeriod.TODAY)
+    return asyncio.run(service._scrape_with_retry(URL))
+
+
+def test_retry_delay_is_jittered_within_cap():
+    policy = RetryPolicy(attempts=5, base_delay_s=0.5, max_delay_s=2.0)
+    for retry, cap in [(0, 0.5), (1, 1.0), (2, 2.0), (6, 2.0)]:
+        delays = [policy.delay(retry) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+    assert RetryPolicy(attempts=0, base_delay_s=1, max_delay_s=1).attempts == 1
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=60)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == breaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow()
+    assert 0 < breaker.retry_in_s <= 60
+
+
+def test_breaker_success_resets_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == breaker.CLOSED
+
+
+def test_breaker_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=0)
+    breaker.record_failure()
+    assert breaker.state == breaker.HALF_OPEN
+
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=60)
+    breaker.record_failure()
+    breaker._opened_at -= 60  # let the reset timeout elapse
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+
+
+def test_breaker_released_probe_can_be_claimed_again():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
+
+
+def test_scrape_retries_transient_failures(backend):
+    outcomes, calls = backend
+    outcomes.extend([ScrapeError("timeout"), ScrapeError("timeout"), DAYS])
+
+    assert scrape() == DAYS
+    assert len(calls) == 3
+    assert get_metrics().counters["scrape.retries"] == 2
+    assert get_circuit_breaker().failures == 0
+
+
+def test_scrape_raises_after_last_attempt(backend):
+    outcomes, calls = backend
+    outcomes.extend([ScrapeError("timeout")] * 3)
+
+    with pytest.raises(ScrapeError, match="timeout"):
+        scrape()
+    assert len(calls) == 3
+    assert get_metrics().counters["scrape.failures"] == 3
+
+
+def test_scrape_fails_fast_while_circuit_open(backend, monkeypatch):
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "2")
+    outcomes, calls = backend
+    outcomes.extend([ScrapeError("timeout")] * 3)
+
+    with pytest.raises(ScrapeError):
+        scrape()
+    # The threshold of 2 opened the circuit before the third attempt
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        scrape()
+    assert len(calls) == 2
+
+
+def test_unexpected_error_counts_as_failure_and_is_not_retried(backend):
+    outcomes, calls = backend
+    outcomes.append(RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError):
+        scrape()
+    assert len(calls) == 1
+    assert get_circuit_breaker().failures == 1
+
+
+def test_unexpected_error_in_probe_reopens_circuit(backend):
+    outcomes, _ = backend
+    breaker = get_circuit_breaker()
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.reset_timeout_s  # half-open
+
+    outcomes.append(RuntimeError("boom"))
+    with pytest.raises(RuntimeError):
+        scrape()
+    assert breaker.state == breaker.OPEN
+
+
+def test_cancelled_probe_releases_it(backend):
+    outcomes, _ = backend
+    breaker = get_circuit_breaker()
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.reset_timeout_s  # half-open
+
+    async def hang():
+        await asyncio.sleep(60)
+
+    outcomes.append(hang)
+
+    async def cancel_probe():
+        service = FFScraperService(TimePeriod.TODAY)
+        task = asyncio.create_task(service._scrape_with_retry(URL))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_probe())
+    assert breaker.state == breaker.HALF_OPEN
+    assert breaker.allow()
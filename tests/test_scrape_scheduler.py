@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+
+from forexfactory_mcp.services.scrape_scheduler import (
+    ScrapePriority,
+    ScrapeScheduler,
+    get_scrape_scheduler,
+)
+from forexfactory_mcp.settings import get_settings
+
+
+def test_concurrency_cap_is_respected():
+    peak = 0
+
+    async def scenario():
+        scheduler = ScrapeScheduler(max_concurrency=2)
+
+        async def job():
+            nonlocal peak
+            peak = max(peak, scheduler.active)
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            *(scheduler.run(job, ScrapePriority.REFRESH) for _ in range(6))
+        )
+        return scheduler.active, scheduler.queue_depth
+
+    assert asyncio.run(scenario()) == (0, 0)
+    assert peak == 2
+
+
+def test_queued_scrapes_are_admitted_by_priority():
+    order = []
+
+    async def scenario():
+        scheduler = ScrapeScheduler(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        def job(name):
+            async def run():
+                order.append(name)
+
+            return run
+
+        holder = asyncio.ensure_future(scheduler.run(hold, ScrapePriority.REFRESH))
+        await asyncio.sleep(0)
+
+        # Queued in the worst possible order: lowest priority first.
+        queued = [
+            ("backfill-1", ScrapePriority.BACKFILL),
+            ("refresh-1", ScrapePriority.REFRESH),
+            ("backfill-2", ScrapePriority.BACKFILL),
+            ("interactive-1", ScrapePriority.INTERACTIVE),
+            ("refresh-2", ScrapePriority.REFRESH),
+            ("interactive-2", ScrapePriority.INTERACTIVE),
+        ]
+        tasks = [
+            asyncio.ensure_future(scheduler.run(job(name), priority))
+            for name, priority in queued
+        ]
+        await asyncio.sleep(0)
+        depth = scheduler.queue_depth
+
+        release.set()
+        await asyncio.gather(holder, *tasks)
+        return depth
+
+    assert asyncio.run(scenario()) == 6
+    assert order == [
+        "interactive-1",
+        "interactive-2",
+        "refresh-1",
+        "refresh-2",
+        "backfill-1",
+        "backfill-2",
+    ]
+
+
+def test_try_acquire_never_jumps_the_queue():
+    async def scenario():
+        scheduler = ScrapeScheduler(max_concurrency=1)
+        release = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        async def queued_job():
+            await finish.wait()
+
+        holder = asyncio.ensure_future(scheduler.run(hold, ScrapePriority.REFRESH))
+        await asyncio.sleep(0)
+        full = scheduler.try_acquire()
+
+        waiter = asyncio.ensure_future(
+            scheduler.run(queued_job, ScrapePriority.BACKFILL)
+        )
+        await asyncio.sleep(0)
+        release.set()
+        await holder
+        # The freed slot went to the queued waiter, not to an opportunist.
+        queued = scheduler.try_acquire()
+        finish.set()
+        await waiter
+
+        free = scheduler.try_acquire()
+        scheduler.release()
+        return full, queued, free
+
+    assert asyncio.run(scenario()) == (False, False, True)
+
+
+def test_cancelled_waiter_passes_its_slot_on():
+    order = []
+
+    async def scenario():
+        scheduler = ScrapeScheduler(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        def job(name):
+            async def run():
+                order.append(name)
+
+            return run
+
+        holder = asyncio.ensure_future(scheduler.run(hold, ScrapePriority.REFRESH))
+        await asyncio.sleep(0)
+        cancelled = asyncio.ensure_future(
+            scheduler.run(job("cancelled"), ScrapePriority.INTERACTIVE)
+        )
+        waiting = asyncio.ensure_future(
+            scheduler.run(job("backfill"), ScrapePriority.BACKFILL)
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, waiting)
+        return scheduler.active, scheduler.queue_depth
+
+    assert asyncio.run(scenario()) == (0, 0)
+    assert order == ["backfill"]
+
+
+def test_browser_backend_caps_concurrency_at_pool_size(monkeypatch):
+    monkeypatch.setenv("SCRAPER_BACKEND", "browser")
+    monkeypatch.setenv("SCRAPER_MAX_CONCURRENCY", "4")
+    monkeypatch.setenv("BROWSER_POOL_SIZE", "2")
+    get_settings.cache_clear()
+
+    assert get_scrape_scheduler().max_concurrency == 2
+
+
+def test_browser_backend_caps_concurrency_at_worker_count(monkeypatch):
+    monkeypatch.setenv("SCRAPER_BACKEND", "browser")
+    monkeypatch.setenv("SCRAPER_MAX_CONCURRENCY", "8")
+    monkeypatch.setenv("SCRAPER_WORKERS", "3")
+    get_settings.cache_clear()
+
+    assert get_scrape_scheduler().max_concurrency == 3
+
+
+@pytest.mark.parametrize(
+    "env",
+    [
+        {"SCRAPER_BACKEND": "auto"},
+        {"SCRAPER_BACKEND": "browser", "SCRAPER_MODE": "replay"},
+    ],
+)
+def test_other_backends_keep_configured_concurrency(monkeypatch, env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("SCRAPER_MAX_CONCURRENCY", "4")
+    monkeypatch.setenv("BROWSER_POOL_SIZE", "2")
+    get_settings.cache_clear()
+
+    assert get_scrape_scheduler().max_concurrency == 4
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from forexfactory_mcp.services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    calls = []
+
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return "days"
+
+        waiters = [asyncio.ensure_future(flight.do("week", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert "week" in flight
+        release.set()
+        return await asyncio.gather(*waiters), "week" in flight
+
+    results, in_flight = asyncio.run(scenario())
+
+    assert results == ["days"] * 5
+    assert len(calls) == 1
+    assert not in_flight
+
+
+def test_different_keys_run_independently():
+    calls = []
+
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        return await asyncio.gather(
+            flight.do("today", lambda: fetch("today")),
+            flight.do("week", lambda: fetch("week")),
+        )
+
+    assert asyncio.run(scenario()) == ["today", "week"]
+    assert sorted(calls) == ["today", "week"]
+
+
+def test_key_is_released_after_completion():
+    calls = []
+
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        return await flight.do("week", fetch), await flight.do("week", fetch)
+
+    assert asyncio.run(scenario()) == (1, 2)
+
+
+def test_error_is_shared_and_key_released():
+    calls = []
+
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fail():
+            calls.append(1)
+            await asyncio.sleep(0)
+            raise RuntimeError("blocked")
+
+        results = await asyncio.gather(
+            flight.do("week", fail), flight.do("week", fail), return_exceptions=True
+        )
+        return results, "week" in flight
+
+    results, in_flight = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert not in_flight
+
+
+def test_cancelled_waiter_does_not_cancel_shared_work():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "days"
+
+        first = asyncio.ensure_future(flight.do("week", fetch))
+        second = asyncio.ensure_future(flight.do("week", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return first, await second
+
+    first, result = asyncio.run(scenario())
+
+    assert first.cancelled()
+    assert result == "days"